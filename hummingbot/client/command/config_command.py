@@ -85,6 +85,13 @@ client_configs_to_display = ["autofill_import",
                              "market_data_collection_enabled",
                              "market_data_collection_interval",
                              "market_data_collection_depth",
+                             "market_data_collection_columnar",
+                             "market_data_collection_flush_interval",
+                             "markets_recorder",
+                             "recorder_write_behind",
+                             "recorder_write_behind_interval",
+                             "recorder_write_behind_queue_size",
+                             "recorder_trade_fills_warm_start",
                              ]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
@@ -82,7 +82,8 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            accumulator = self.trading_core.performance_accumulator(market, symbol, cur_trades)
+            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances, accumulator=accumulator)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
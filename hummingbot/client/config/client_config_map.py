@@ -104,9 +104,46 @@ class MarketDataCollectionConfigMap(BaseClientModel):
         ge=2,
         json_schema_extra={"prompt": lambda cm: "Set the order book collection depth (Default=20)"},
     )
+    market_data_collection_columnar: bool = Field(
+        default=False,
+        json_schema_extra={"prompt": lambda cm: "Record the market data to columnar snapshot files instead of the "
+                                                "database (True/False)"},
+    )
+    market_data_collection_flush_interval: int = Field(
+        default=60,
+        ge=1,
+        json_schema_extra={"prompt": lambda cm: "Set the interval in seconds between the writes of the columnar "
+                                                "snapshot files (Default=60)"},
+    )
     model_config = ConfigDict(title="market_data_collection")
 
 
+class MarketsRecorderConfigMap(BaseClientModel):
+    recorder_write_behind: bool = Field(
+        default=False,
+        json_schema_extra={"prompt": lambda cm: "Persist the market events from a writer thread instead of the event "
+                                                "loop (True/False)"},
+    )
+    recorder_write_behind_interval: float = Field(
+        default=0.05,
+        gt=0,
+        json_schema_extra={"prompt": lambda cm: "Set the interval in seconds between the writes of the writer thread "
+                                                "(Default=0.05)"},
+    )
+    recorder_write_behind_queue_size: int = Field(
+        default=10000,
+        ge=1,
+        json_schema_extra={"prompt": lambda cm: "Set the maximum number of pending writes of the writer thread "
+                                                "(Default=10000)"},
+    )
+    recorder_trade_fills_warm_start: bool = Field(
+        default=False,
+        json_schema_extra={"prompt": lambda cm: "Load all the trade fills recorded for the config in the connectors "
+                                                "trade fills index on start (True/False)"},
+    )
+    model_config = ConfigDict(title="markets_recorder")
+
+
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
         default="#000000",
@@ -809,6 +846,7 @@ class ClientConfigMap(BaseClientModel):
         )},
     )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
+    markets_recorder: MarketsRecorderConfigMap = Field(default=MarketsRecorderConfigMap())
     model_config = ConfigDict(title="client_config_map")
 
     @field_validator("kill_switch_mode", mode="before")
@@ -1,12 +1,12 @@
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import PositionAction, TradeType
-from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.trade_fill import TradeFill
@@ -66,10 +66,21 @@ class PerformanceMetrics:
     async def create(cls,
                      trading_pair: str,
                      trades: List[Any],
-                     current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
-        performance = PerformanceMetrics()
-        await performance._initialize_metrics(trading_pair, trades, current_balances)
-        return performance
+                     current_balances: Dict[str, Decimal],
+                     accumulator: Optional['PerformanceMetricsAccumulator'] = None) -> 'PerformanceMetrics':
+        """
+        :param trading_pair: the trading market to get performance metrics
+        :param trades: the list of TradeFill or Trade object
+        :param current_balances: current user account balance
+        :param accumulator: an accumulator kept between calls, only the TradeFill records it did not ingest yet are
+            ingested. If None, all the trades are ingested by a new accumulator
+        """
+        if accumulator is None:
+            accumulator = PerformanceMetricsAccumulator(trading_pair)
+            accumulator.add_trades(trades)
+        else:
+            accumulator.add_trade_fills(trades)
+        return await accumulator.metrics(current_balances)
 
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
@@ -174,40 +185,6 @@ class PerformanceMetrics:
     def _is_trade_fill(self, trade):
         return isinstance(trade, TradeFill)
 
-    def _are_derivatives(self, trades: List[Any]) -> bool:
-        return (
-            trades
-            and self._is_trade_fill(trades[0])
-            and PositionAction.NIL.value not in [t.position for t in trades]
-        )
-
-    def _preprocess_trades_and_group_by_type(self, trades: List[Any]) -> Tuple[List[Any], List[Any]]:
-        buys = []
-        sells = []
-        for trade in trades:
-            if trade.trade_type.upper() == TradeType.BUY.name.upper():
-                buys.append(trade)
-                self.b_vol_base += Decimal(str(trade.amount))
-                self.b_vol_quote += Decimal(str(trade.amount)) * Decimal(str(trade.price)) * Decimal("-1")
-            elif trade.trade_type.upper() == TradeType.SELL.name.upper():
-                sells.append(trade)
-                self.s_vol_base += Decimal(str(trade.amount)) * Decimal("-1")
-                self.s_vol_quote += Decimal(str(trade.amount)) * Decimal(str(trade.price))
-
-            self.s_vol_quote += self._process_deducted_fees_impact_in_quote_vol(trade)
-
-        self.tot_vol_base = self.b_vol_base + self.s_vol_base
-        self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
-
-        self.avg_b_price = self.divide(self.b_vol_quote, self.b_vol_base)
-        self.avg_s_price = self.divide(self.s_vol_quote, self.s_vol_base)
-        self.avg_tot_price = self.divide(abs(self.b_vol_quote) + abs(self.s_vol_quote),
-                                         abs(self.b_vol_base) + abs(self.s_vol_base))
-        self.avg_b_price = abs(self.avg_b_price)
-        self.avg_s_price = abs(self.avg_s_price)
-
-        return buys, sells
-
     def _process_deducted_fees_impact_in_quote_vol(self, trade):
         fee_percent = None
         fee_type = ""
@@ -224,30 +201,32 @@ class PerformanceMetrics:
             impact = Decimal(str(trade.amount)) * Decimal(str(trade.price)) * fee_percent * Decimal("-1")
         return impact
 
+    def _trade_fee_amounts(self, quote: str, trade: Any) -> List[Tuple[str, Decimal]]:
+        """
+        :return: the token and amount of each fee paid for the trade
+        """
+        fee_amounts = []
+        if self._is_trade_fill(trade):
+            if trade.trade_fee.get("percent") is not None:
+                fee_percent = Decimal(str(trade.trade_fee["percent"]))
+                fee_amounts.append((quote, Decimal(str(trade.price)) * Decimal(str(trade.amount)) * fee_percent))
+            for flat_fee in trade.trade_fee.get("flat_fees", []):
+                fee_amounts.append((flat_fee["token"], Decimal(flat_fee["amount"])))
+        else:  # assume this is Trade object
+            if trade.trade_fee.percent is not None:
+                fee_percent = Decimal(trade.trade_fee.percent)
+                fee_amounts.append((quote, Decimal(trade.price) * Decimal(trade.amount) * fee_percent))
+            for flat_fee in trade.trade_fee.flat_fees:
+                fee_amounts.append((flat_fee.token, flat_fee.amount))
+        return fee_amounts
+
     async def _calculate_fees(self, quote: str, trades: List[Any]):
         for trade in trades:
-            fee_percent = None
-            trade_price = None
-            trade_amount = None
-            if self._is_trade_fill(trade):
-                if trade.trade_fee.get("percent") is not None:
-                    trade_price = Decimal(str(trade.price))
-                    trade_amount = Decimal(str(trade.amount))
-                    fee_percent = Decimal(str(trade.trade_fee["percent"]))
-                flat_fees = [TokenAmount(token=flat_fee["token"], amount=Decimal(flat_fee["amount"]))
-                             for flat_fee in trade.trade_fee.get("flat_fees", [])]
-            else:  # assume this is Trade object
-                if trade.trade_fee.percent is not None:
-                    trade_price = Decimal(trade.price)
-                    trade_amount = Decimal(trade.amount)
-                    fee_percent = Decimal(trade.trade_fee.percent)
-                flat_fees = trade.trade_fee.flat_fees
-
-            if fee_percent is not None:
-                self.fees[quote] += trade_price * trade_amount * fee_percent
-            for flat_fee in flat_fees:
-                self.fees[flat_fee.token] += flat_fee.amount
+            for fee_token, fee_amount in self._trade_fee_amounts(quote, trade):
+                self.fees[fee_token] += fee_amount
+        await self._calculate_fee_in_quote(quote)
 
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -262,55 +241,42 @@ class PerformanceMetrics:
                         f"using {RateOracle.get_instance()}. PNL value will be inconsistent."
                     )
 
-    def _calculate_trade_pnl(self, buys: list, sells: list):
-        self.trade_pnl = self.cur_value - self.hold_value
-
-        # Handle trade_pnl differently for derivatives
-        if self._are_derivatives(buys) or self._are_derivatives(sells):
-            buys_copy, sells_copy = self.aggregate_position_order(buys.copy(), sells.copy())
-            long = []
-            short = []
-
-            while True:
-                lng = self.position_order(buys_copy, sells_copy)
-                if lng is not None:
-                    long.append(lng)
-
-                sht = self.position_order(sells_copy, buys_copy)
-                if sht is not None:
-                    short.append(sht)
-                if lng is None and sht is None:
-                    break
-
-            self.trade_pnl = Decimal(str(sum(self.derivative_pnl(long, short))))
-
     async def _initialize_metrics(self,
-                                  trading_pair: str,
-                                  trades: List[Any],
+                                  accumulator: 'PerformanceMetricsAccumulator',
                                   current_balances: Dict[str, Decimal]):
         """
-        Calculates PnL, fees, Return % and etc...
-        :param trading_pair: the trading market to get performance metrics
-        :param trades: the list of TradeFill or Trade object
+        Calculates PnL, fees, Return % and etc... from the totals of the trades ingested by the accumulator
+        :param accumulator: the accumulator of the trades of the trading market to get performance metrics
         :param current_balances: current user account balance
         """
-
+        trading_pair = accumulator.trading_pair
         base, quote = split_hb_trading_pair(trading_pair)
-        buys, sells = self._preprocess_trades_and_group_by_type(trades)
 
-        self.num_buys = len(buys)
-        self.num_sells = len(sells)
+        self.num_buys = accumulator.num_buys
+        self.num_sells = accumulator.num_sells
         self.num_trades = self.num_buys + self.num_sells
 
+        self.b_vol_base = accumulator.b_vol_base
+        self.b_vol_quote = accumulator.b_vol_quote
+        self.s_vol_base = accumulator.s_vol_base
+        self.s_vol_quote = accumulator.s_vol_quote
+        self.tot_vol_base = self.b_vol_base + self.s_vol_base
+        self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
+
+        self.avg_b_price = abs(self.divide(self.b_vol_quote, self.b_vol_base))
+        self.avg_s_price = abs(self.divide(self.s_vol_quote, self.s_vol_base))
+        self.avg_tot_price = self.divide(abs(self.b_vol_quote) + abs(self.s_vol_quote),
+                                         abs(self.b_vol_base) + abs(self.s_vol_base))
+
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = accumulator.start_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = accumulator.last_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +284,285 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
+        self.trade_pnl = self.cur_value - self.hold_value
+        # Handle trade_pnl differently for derivatives
+        if accumulator.are_derivatives:
+            self.trade_pnl = accumulator.positions_pnl
 
-        await self._calculate_fees(quote, trades)
+        self.fees.update(accumulator.fees)
+        await self._calculate_fee_in_quote(quote)
 
         self.total_pnl = self.trade_pnl - self.fee_in_quote
         self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+
+@dataclass
+class _PositionOrder:
+    """
+    Fills of a position order, aggregated as a single order at the average fill price
+    """
+    trade_type: str
+    position: str
+    price_sum: Decimal = s_decimal_0
+    fills: int = 0
+    amount: Decimal = s_decimal_0
+    pair_id: Optional[int] = None
+
+    @property
+    def price(self) -> Decimal:
+        return self.price_sum / self.fills
+
+
+class PerformanceMetricsAccumulator:
+    """
+    Running totals of the trades of a trading pair, from which the performance metrics are calculated without going
+    through the trades again. Each trade is ingested once, in O(1): volumes and fees are added to the totals, and the
+    fills of derivative positions are aggregated by order and matched with a FIFO queue per side, the n-th order
+    opening a long (short) position being paired with the n-th order closing a long (short) position.
+    The state of the accumulator can be saved with to_json and restored with from_json, to keep ingesting the trades
+    recorded afterwards.
+    """
+
+    def __init__(self, trading_pair: str):
+        self._trading_pair = trading_pair
+        self._base, self._quote = split_hb_trading_pair(trading_pair)
+        # Provides the parsing of the trade formats (TradeFill or Trade)
+        self._trade_parser = PerformanceMetrics()
+
+        self.num_buys: int = 0
+        self.num_sells: int = 0
+        self.b_vol_base: Decimal = s_decimal_0
+        self.b_vol_quote: Decimal = s_decimal_0
+        self.s_vol_base: Decimal = s_decimal_0
+        self.s_vol_quote: Decimal = s_decimal_0
+        self.fees: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        # Prices of the earliest and the latest trades by timestamp, the trades may be ingested out of order
+        self._start_price: Optional[Decimal] = None
+        self._start_price_timestamp: Optional[float] = None
+        self._last_price: Optional[Decimal] = None
+        self._last_price_timestamp: Optional[float] = None
+
+        # Per trade type: whether its first trade is a TradeFill and the number of trades without position
+        self._first_trade_is_fill: Dict[str, bool] = {}
+        self._nil_positions: Dict[str, int] = defaultdict(int)
+
+        self._orders: Dict[Tuple[str, str], _PositionOrder] = {}
+        # Orders waiting for their counterpart, by (trade type, position)
+        self._unmatched_orders: Dict[Tuple[str, str], Deque[Tuple[str, str]]] = defaultdict(deque)
+        # Pairs of (open order, close order), by pair id
+        self._position_pairs: Dict[int, Tuple[Tuple[str, str], Tuple[str, str]]] = {}
+        self._position_pair_pnls: Dict[int, Decimal] = {}
+        self._positions_pnl: Decimal = s_decimal_0
+        self._next_pair_id: int = 0
+
+        # Primary keys (market, order id, exchange trade id) of the ingested fills, to skip them when they are read
+        # again from the database
+        self._ingested_fill_keys: Set[Tuple[str, str, str]] = set()
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def start_price(self) -> Decimal:
+        return self._start_price if self._start_price is not None else s_decimal_0
+
+    @property
+    def last_price(self) -> Decimal:
+        return self._last_price if self._last_price is not None else s_decimal_0
+
+    @property
+    def are_derivatives(self) -> bool:
+        return any(
+            self._first_trade_is_fill.get(trade_type, False) and self._nil_positions[trade_type] == 0
+            for trade_type in (TradeType.BUY.name, TradeType.SELL.name)
+        )
+
+    @property
+    def positions_pnl(self) -> Decimal:
+        """
+        The PnL of the closed derivative positions
+        """
+        return Decimal(str(self._positions_pnl))
+
+    async def metrics(self, current_balances: Dict[str, Decimal]) -> PerformanceMetrics:
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics(self, current_balances)
+        return performance
+
+    def add_trades(self, trades: Iterable[Any]):
+        for trade in trades:
+            self.add_trade(trade)
+
+    def add_trade_fills(self, trade_fills: Iterable[TradeFill]) -> int:
+        """
+        Ingests the TradeFill records that were not ingested yet, identified by their primary key. Fills recorded
+        late with an earlier timestamp than the ones already ingested are ingested too.
+        :return: the number of records ingested
+        """
+        ingested = 0
+        for trade_fill in trade_fills:
+            key = (trade_fill.market, trade_fill.order_id, trade_fill.exchange_trade_id)
+            if key in self._ingested_fill_keys:
+                continue
+            self._ingested_fill_keys.add(key)
+            self.add_trade(trade_fill)
+            ingested += 1
+        return ingested
+
+    def add_trade(self, trade: Any):
+        """
+        Ingests a trade (TradeFill or Trade)
+        """
+        price = Decimal(str(trade.price))
+        amount = Decimal(str(trade.amount))
+        trade_type = trade.trade_type.upper()
+        is_trade_fill = self._trade_parser._is_trade_fill(trade)
+
+        if trade_type == TradeType.BUY.name:
+            self.num_buys += 1
+            self.b_vol_base += amount
+            self.b_vol_quote -= amount * price
+        elif trade_type == TradeType.SELL.name:
+            self.num_sells += 1
+            self.s_vol_base -= amount
+            self.s_vol_quote += amount * price
+        self.s_vol_quote += self._trade_parser._process_deducted_fees_impact_in_quote_vol(trade)
+
+        for fee_token, fee_amount in self._trade_parser._trade_fee_amounts(self._quote, trade):
+            self.fees[fee_token] += fee_amount
+
+        timestamp = trade.timestamp
+        if self._start_price_timestamp is None or timestamp < self._start_price_timestamp:
+            self._start_price = price
+            self._start_price_timestamp = timestamp
+        if self._last_price_timestamp is None or timestamp >= self._last_price_timestamp:
+            self._last_price = price
+            self._last_price_timestamp = timestamp
+
+        if trade_type in (TradeType.BUY.name, TradeType.SELL.name):
+            self._first_trade_is_fill.setdefault(trade_type, is_trade_fill)
+            if is_trade_fill:
+                if trade.position == PositionAction.NIL.value:
+                    self._nil_positions[trade_type] += 1
+                self._add_position_fill(trade_type, trade.order_id, trade.position, price, amount)
+
+    def _add_position_fill(self, trade_type: str, order_id: str, position: str, price: Decimal, amount: Decimal):
+        key = (trade_type, order_id)
+        order = self._orders.get(key)
+        if order is None:
+            if position not in (PositionAction.OPEN.value, PositionAction.CLOSE.value):
+                return
+            order = _PositionOrder(trade_type=trade_type, position=position)
+            self._orders[key] = order
+            self._match_order(key, order)
+        order.price_sum += price
+        order.fills += 1
+        order.amount += amount
+        if order.pair_id is not None:
+            self._update_pair_pnl(order.pair_id)
+
+    def _match_order(self, key: Tuple[str, str], order: _PositionOrder):
+        counterpart_trade_type = TradeType.SELL.name if order.trade_type == TradeType.BUY.name else TradeType.BUY.name
+        counterpart_position = (PositionAction.CLOSE.value if order.position == PositionAction.OPEN.value
+                                else PositionAction.OPEN.value)
+        counterparts = self._unmatched_orders[(counterpart_trade_type, counterpart_position)]
+        if not counterparts:
+            self._unmatched_orders[(order.trade_type, order.position)].append(key)
+            return
+        counterpart_key = counterparts.popleft()
+        pair_id = self._next_pair_id
+        self._next_pair_id += 1
+        if order.position == PositionAction.OPEN.value:
+            self._position_pairs[pair_id] = (key, counterpart_key)
+        else:
+            self._position_pairs[pair_id] = (counterpart_key, key)
+        order.pair_id = pair_id
+        self._orders[counterpart_key].pair_id = pair_id
+        self._position_pair_pnls[pair_id] = s_decimal_0
+
+    def _update_pair_pnl(self, pair_id: int):
+        open_key, close_key = self._position_pairs[pair_id]
+        open_order, close_order = self._orders[open_key], self._orders[close_key]
+        if open_order.fills == 0 or close_order.fills == 0:
+            return
+        if open_order.trade_type == TradeType.BUY.name:
+            pnl = (close_order.price - open_order.price) * close_order.amount
+        else:
+            pnl = (open_order.price - close_order.price) * close_order.amount
+        self._positions_pnl += pnl - self._position_pair_pnls[pair_id]
+        self._position_pair_pnls[pair_id] = pnl
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        :return: the state of the accumulator, as a JSON serializable dictionary
+        """
+        return {
+            "trading_pair": self._trading_pair,
+            "num_buys": self.num_buys,
+            "num_sells": self.num_sells,
+            "b_vol_base": str(self.b_vol_base),
+            "b_vol_quote": str(self.b_vol_quote),
+            "s_vol_base": str(self.s_vol_base),
+            "s_vol_quote": str(self.s_vol_quote),
+            "fees": {token: str(amount) for token, amount in self.fees.items()},
+            "start_price": None if self._start_price is None else str(self._start_price),
+            "start_price_timestamp": self._start_price_timestamp,
+            "last_price": None if self._last_price is None else str(self._last_price),
+            "last_price_timestamp": self._last_price_timestamp,
+            "first_trade_is_fill": dict(self._first_trade_is_fill),
+            "nil_positions": dict(self._nil_positions),
+            "orders": [
+                [trade_type, order_id, order.position, str(order.price_sum), order.fills, str(order.amount),
+                 order.pair_id]
+                for (trade_type, order_id), order in self._orders.items()
+            ],
+            "unmatched_orders": [
+                [trade_type, position, [list(key) for key in keys]]
+                for (trade_type, position), keys in self._unmatched_orders.items() if keys
+            ],
+            "position_pairs": [
+                [pair_id, list(open_key), list(close_key), str(self._position_pair_pnls[pair_id])]
+                for pair_id, (open_key, close_key) in self._position_pairs.items()
+            ],
+            "positions_pnl": str(self._positions_pnl),
+            "next_pair_id": self._next_pair_id,
+            "ingested_fill_keys": sorted(list(key) for key in self._ingested_fill_keys),
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'PerformanceMetricsAccumulator':
+        accumulator = cls(data["trading_pair"])
+        accumulator.num_buys = data["num_buys"]
+        accumulator.num_sells = data["num_sells"]
+        accumulator.b_vol_base = Decimal(data["b_vol_base"])
+        accumulator.b_vol_quote = Decimal(data["b_vol_quote"])
+        accumulator.s_vol_base = Decimal(data["s_vol_base"])
+        accumulator.s_vol_quote = Decimal(data["s_vol_quote"])
+        accumulator.fees.update({token: Decimal(amount) for token, amount in data["fees"].items()})
+        accumulator._start_price = None if data["start_price"] is None else Decimal(data["start_price"])
+        accumulator._start_price_timestamp = data["start_price_timestamp"]
+        accumulator._last_price = None if data["last_price"] is None else Decimal(data["last_price"])
+        accumulator._last_price_timestamp = data["last_price_timestamp"]
+        accumulator._first_trade_is_fill.update(data["first_trade_is_fill"])
+        accumulator._nil_positions.update(data["nil_positions"])
+        for trade_type, order_id, position, price_sum, fills, amount, pair_id in data["orders"]:
+            accumulator._orders[(trade_type, order_id)] = _PositionOrder(trade_type=trade_type,
+                                                                         position=position,
+                                                                         price_sum=Decimal(price_sum),
+                                                                         fills=fills,
+                                                                         amount=Decimal(amount),
+                                                                         pair_id=pair_id)
+        for trade_type, position, keys in data["unmatched_orders"]:
+            accumulator._unmatched_orders[(trade_type, position)].extend(tuple(key) for key in keys)
+        for pair_id, open_key, close_key, pnl in data["position_pairs"]:
+            accumulator._position_pairs[pair_id] = (tuple(open_key), tuple(close_key))
+            accumulator._position_pair_pnls[pair_id] = Decimal(pnl)
+        accumulator._positions_pnl = Decimal(data["positions_pnl"])
+        accumulator._next_pair_id = data["next_pair_id"]
+        accumulator._ingested_fill_keys = set(tuple(key) for key in data["ingested_fill_keys"])
+        return accumulator
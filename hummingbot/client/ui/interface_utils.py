@@ -76,7 +76,9 @@ async def start_trade_monitor(trade_monitor):
                             for market, symbol in market_info:
                                 cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
                                 cur_balances = await hb.trading_core.get_current_balances(market)
-                                perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+                                accumulator = hb.trading_core.performance_accumulator(market, symbol, cur_trades)
+                                perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances,
+                                                                       accumulator=accumulator)
                                 return_pcts.append(perf.return_pct)
                                 pnls.append(perf.total_pnl)
                             avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
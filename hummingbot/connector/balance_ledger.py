@@ -0,0 +1,135 @@
+from bisect import bisect_right
+from decimal import Decimal
+from typing import Dict, List, Tuple
+
+from hummingbot.connector.constants import s_decimal_0
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.data_type.common import TradeType
+
+# (timestamp, base asset, quote asset, base balance change, quote balance change)
+FillEntry = Tuple[float, str, str, Decimal, Decimal]
+
+
+class BalanceLedger:
+    """
+    Per asset balances locked in the in-flight orders and changed by the order fills, updated incrementally every time
+    an order or a fill is reported, so that they can be queried in O(assets) instead of iterating all the orders and
+    fill events.
+    The balances match the ones calculated by ConnectorBase.in_flight_asset_balances and
+    ConnectorBase.order_filled_balances.
+    """
+
+    def __init__(self):
+        # Balances locked by the buy orders (before adding the fees) and by the sell orders, with the number of orders
+        # locking each asset
+        self._locked_by_buy_orders: Dict[str, Decimal] = {}
+        self._locked_by_sell_orders: Dict[str, Decimal] = {}
+        self._locking_orders_count: Dict[Tuple[str, bool], int] = {}
+        # Contribution (asset, is buy, amount) of each in-flight order to the locked balances
+        self._order_locked_amounts: Dict[str, Tuple[str, bool, Decimal]] = {}
+
+        self._filled_balances: Dict[str, Decimal] = {}
+        # Fills sorted by timestamp, with the balance changes of the fills up to the cursor accumulated apart, so that
+        # the balances filled since a timestamp are calculated moving the cursor (usually only forward)
+        self._fill_timestamps: List[float] = []
+        self._fills: List[FillEntry] = []
+        self._fills_cursor: int = 0
+        self._filled_balances_before_cursor: Dict[str, Decimal] = {}
+        self._fills_after_cursor_count: Dict[str, int] = {}
+
+    def update_order(self, order: InFlightOrderBase):
+        """
+        Updates the balance locked by the order. Orders that are no longer active do not lock any balance.
+        :param order: the order that was added, filled or changed state
+        """
+        self.remove_order(order.client_order_id)
+        if order.is_done or order.is_failure or order.is_cancelled:
+            return
+        outstanding_amount = order.amount - order.executed_amount_base
+        is_buy = order.trade_type is TradeType.BUY
+        if is_buy:
+            asset, locked_amount = order.quote_asset, outstanding_amount * order.price
+            balances = self._locked_by_buy_orders
+        else:
+            asset, locked_amount = order.base_asset, outstanding_amount
+            balances = self._locked_by_sell_orders
+        self._order_locked_amounts[order.client_order_id] = (asset, is_buy, locked_amount)
+        balances[asset] = balances.get(asset, s_decimal_0) + locked_amount
+        self._locking_orders_count[(asset, is_buy)] = self._locking_orders_count.get((asset, is_buy), 0) + 1
+
+    def remove_order(self, client_order_id: str):
+        previous = self._order_locked_amounts.pop(client_order_id, None)
+        if previous is not None:
+            asset, is_buy, locked_amount = previous
+            balances = self._locked_by_buy_orders if is_buy else self._locked_by_sell_orders
+            self._locking_orders_count[(asset, is_buy)] -= 1
+            if self._locking_orders_count[(asset, is_buy)] == 0:
+                # Reset instead of subtracting, to not accumulate rounding differences
+                del self._locking_orders_count[(asset, is_buy)]
+                del balances[asset]
+            else:
+                balances[asset] -= locked_amount
+
+    def locked_balances(self, fee_pct: Decimal) -> Dict[str, Decimal]:
+        """
+        :param fee_pct: the estimated fee percentage, added to the quote balance locked by the buy orders
+        :return: the balance of each asset locked in the in-flight orders (see ConnectorBase.in_flight_asset_balances)
+        """
+        balances = {asset: balance * (Decimal(1) + fee_pct) for asset, balance in self._locked_by_buy_orders.items()}
+        for asset, balance in self._locked_by_sell_orders.items():
+            balances[asset] = balances.get(asset, s_decimal_0) + balance
+        return balances
+
+    def record_fill(self, timestamp: float, trading_pair: str, trade_type: TradeType, price: Decimal, amount: Decimal):
+        base, quote = split_hb_trading_pair(trading_pair)
+        if trade_type is TradeType.BUY:
+            base_change, quote_change = amount, Decimal("-1") * price * amount
+        else:
+            base_change, quote_change = Decimal("-1") * amount, price * amount
+        self._add_to(self._filled_balances, base, quote, base_change, quote_change)
+
+        position = bisect_right(self._fill_timestamps, timestamp)
+        self._fill_timestamps.insert(position, timestamp)
+        self._fills.insert(position, (timestamp, base, quote, base_change, quote_change))
+        if position < self._fills_cursor:
+            self._fills_cursor += 1
+            self._add_to(self._filled_balances_before_cursor, base, quote, base_change, quote_change)
+        else:
+            self._count_fill_after_cursor(base, quote, 1)
+
+    def filled_balances(self, starting_timestamp: float = 0) -> Dict[str, Decimal]:
+        """
+        :param starting_timestamp: only the fills after this timestamp are included
+        :return: the balance change of each asset caused by the fills (see ConnectorBase.order_filled_balances)
+        """
+        self._move_fills_cursor(bisect_right(self._fill_timestamps, starting_timestamp))
+        return {
+            asset: self._filled_balances[asset] - self._filled_balances_before_cursor.get(asset, s_decimal_0)
+            for asset in self._fills_after_cursor_count
+        }
+
+    def _move_fills_cursor(self, position: int):
+        while self._fills_cursor < position:
+            _, base, quote, base_change, quote_change = self._fills[self._fills_cursor]
+            self._add_to(self._filled_balances_before_cursor, base, quote, base_change, quote_change)
+            self._count_fill_after_cursor(base, quote, -1)
+            self._fills_cursor += 1
+        while self._fills_cursor > position:
+            self._fills_cursor -= 1
+            _, base, quote, base_change, quote_change = self._fills[self._fills_cursor]
+            self._add_to(self._filled_balances_before_cursor, base, quote, -base_change, -quote_change)
+            self._count_fill_after_cursor(base, quote, 1)
+
+    def _count_fill_after_cursor(self, base: str, quote: str, count: int):
+        for asset in (base, quote):
+            asset_count = self._fills_after_cursor_count.get(asset, 0) + count
+            if asset_count == 0:
+                del self._fills_after_cursor_count[asset]
+            else:
+                self._fills_after_cursor_count[asset] = asset_count
+
+    @staticmethod
+    def _add_to(balances: Dict[str, Decimal], base: str, quote: str, base_change: Decimal, quote_change: Decimal):
+        balances[base] = balances.get(base, s_decimal_0) + base_change
+        balances[quote] = balances.get(quote, s_decimal_0) + quote_change
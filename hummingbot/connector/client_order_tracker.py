@@ -2,8 +2,8 @@ import asyncio
 import logging
 from collections import defaultdict
 from decimal import Decimal
-from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Mapping, Optional
 
 from cachetools import TTLCache
 
@@ -29,6 +29,92 @@ if TYPE_CHECKING:
 cot_logger = None
 
 
+class OrdersBucket(dict):
+    """
+    Dictionary of orders by client order id that notifies every addition and removal, so that the tracker indexes
+    are kept updated even when the bucket is modified directly.
+    """
+
+    def __init__(self, on_change: Callable[[str, InFlightOrder], None]):
+        super().__init__()
+        self._on_change = on_change
+
+    def __setitem__(self, client_order_id: str, order: InFlightOrder):
+        previous_order = self.get(client_order_id)
+        super().__setitem__(client_order_id, order)
+        if previous_order is not None and previous_order is not order:
+            self._on_change(client_order_id, previous_order)
+        self._on_change(client_order_id, order)
+
+    def __delitem__(self, client_order_id: str):
+        order = self[client_order_id]
+        super().__delitem__(client_order_id)
+        self._on_change(client_order_id, order)
+
+    def pop(self, client_order_id: str, *args):
+        if client_order_id not in self:
+            return super().pop(client_order_id, *args)
+        order = super().pop(client_order_id)
+        self._on_change(client_order_id, order)
+        return order
+
+    def popitem(self):
+        client_order_id, order = super().popitem()
+        self._on_change(client_order_id, order)
+        return client_order_id, order
+
+    def setdefault(self, client_order_id: str, default: Optional[InFlightOrder] = None):
+        if client_order_id not in self:
+            self[client_order_id] = default
+        return self[client_order_id]
+
+    def update(self, *args, **kwargs):
+        for client_order_id, order in dict(*args, **kwargs).items():
+            self[client_order_id] = order
+
+    def clear(self):
+        while len(self) > 0:
+            self.popitem()
+
+
+class CachedOrdersBucket(TTLCache):
+    """
+    TTL cache of orders by client order id that notifies every addition and removal (including expirations and
+    evictions), so that the tracker indexes are kept updated.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, on_change: Callable[[str, InFlightOrder], None]):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._on_change = on_change
+
+    def __setitem__(self, client_order_id: str, order: InFlightOrder, **kwargs):
+        previous_order = self.get(client_order_id)
+        super().__setitem__(client_order_id, order, **kwargs)
+        if previous_order is not None and previous_order is not order:
+            self._on_change(client_order_id, previous_order)
+        self._on_change(client_order_id, order)
+
+    def __delitem__(self, client_order_id: str, **kwargs):
+        order = self.get(client_order_id)
+        try:
+            super().__delitem__(client_order_id, **kwargs)
+        finally:
+            if order is not None:
+                self._on_change(client_order_id, order)
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for client_order_id, order in expired:
+            self._on_change(client_order_id, order)
+        return expired
+
+    def clear(self):
+        removed_orders = list(self.items())
+        super().clear()
+        for client_order_id, order in removed_orders:
+            self._on_change(client_order_id, order)
+
+
 class ClientOrderTracker:
 
     MAX_CACHE_SIZE = 1000
@@ -54,69 +140,81 @@ class ClientOrderTracker:
         """
         self._connector: ConnectorBase = connector
         self._lost_order_count_limit = lost_order_count_limit
-        self._in_flight_orders: Dict[str, InFlightOrder] = {}
-        self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
-        self._lost_orders: Dict[str, InFlightOrder] = {}
+        # Indexes maintained incrementally every time an order is added to or removed from one of the state buckets
+        # (active, cached and lost orders), to avoid rebuilding them every time they are requested
+        self._all_orders: Dict[str, InFlightOrder] = {}
+        self._all_fillable_orders: Dict[str, InFlightOrder] = {}
+        self._all_updatable_orders: Dict[str, InFlightOrder] = {}
+        self._fillable_orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._updatable_orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        # Fillable orders whose exchange order id was not known when they were indexed
+        self._orders_without_exchange_order_id: Dict[str, InFlightOrder] = {}
+
+        self._in_flight_orders: OrdersBucket = OrdersBucket(on_change=self._reindex_order)
+        self._cached_orders: CachedOrdersBucket = CachedOrdersBucket(
+            maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL, on_change=self._reindex_order)
+        self._lost_orders: OrdersBucket = OrdersBucket(on_change=self._reindex_order)
 
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
 
     @property
-    def active_orders(self) -> Dict[str, InFlightOrder]:
+    def active_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns orders that are actively tracked
         """
-        return self._in_flight_orders
+        return MappingProxyType(self._in_flight_orders)
 
     @property
-    def cached_orders(self) -> Dict[str, InFlightOrder]:
+    def cached_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns orders that are no longer actively tracked.
         """
-        return {client_order_id: order for client_order_id, order in self._cached_orders.items()}
+        self._cached_orders.expire()
+        return MappingProxyType(self._cached_orders)
 
     @property
-    def all_orders(self) -> Dict[str, InFlightOrder]:
+    def all_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns both active and cached order.
         """
-        return {**self.active_orders, **self.cached_orders}
+        self._cached_orders.expire()
+        return MappingProxyType(self._all_orders)
 
     @property
-    def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns all orders that could still be impacted by trades: active orders, cached orders and lost orders
+        Returns all orders that could still be impacted by trades: active orders, cached orders and lost orders.
+        The result is a read-only view of the index. Callers that await while iterating it have to iterate a copy,
+        since the orders can be tracked, untracked or lost in the meantime.
         """
-        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+        self._cached_orders.expire()
+        return MappingProxyType(self._all_fillable_orders)
 
     @property
-    def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_fillable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order
-            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        self._cached_orders.expire()
+        self._index_new_exchange_order_ids()
+        return MappingProxyType(self._fillable_orders_by_exchange_order_id)
 
     @property
-    def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns all orders that could receive status updates
         """
-        return {**self.active_orders, **self.lost_orders}
+        return MappingProxyType(self._all_updatable_orders)
 
     @property
-    def all_updatable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_updatable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order for order in chain(self.active_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        self._index_new_exchange_order_ids()
+        return MappingProxyType(self._updatable_orders_by_exchange_order_id)
 
     @property
     def current_timestamp(self) -> int:
@@ -150,6 +248,18 @@ class ClientOrderTracker:
             if client_order_id in self._order_not_found_records:
                 del self._order_not_found_records[client_order_id]
 
+    def update_exchange_order_id(self, client_order_id: str, exchange_order_id: str):
+        """
+        Sets the exchange order id of a tracked order, updating the indexes by exchange order id.
+        :param client_order_id: the client order id of the order
+        :param exchange_order_id: the exchange order id assigned to the order
+        """
+        order = self._all_fillable_orders.get(client_order_id)
+        if order is not None:
+            self._unindex_exchange_order_id(order)
+            order.update_exchange_order_id(exchange_order_id)
+            self._reindex_order(client_order_id, order)
+
     def restore_tracking_states(self, tracking_states: Dict[str, any]):
         """
         Restore in-flight orders from saved tracking states.
@@ -173,16 +283,31 @@ class ClientOrderTracker:
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
         found_order = None
+        self._cached_orders.expire()
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
+        if client_order_id in self._all_orders:
+            found_order = self._all_orders[client_order_id]
         elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
-            )
+            self._index_new_exchange_order_ids()
+            order = self._fillable_orders_by_exchange_order_id.get(exchange_order_id)
+            if order is not None and self._all_orders.get(order.client_order_id) is order:
+                found_order = order
 
         return found_order
 
+    def fetch_fillable_order(
+        self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
+    ) -> Optional[InFlightOrder]:
+        """
+        Looks up an order in the fillable orders index, without copying it as `all_fillable_orders` does.
+        """
+        self._cached_orders.expire()
+        found_order = self._all_fillable_orders.get(client_order_id)
+        if found_order is None and exchange_order_id is not None:
+            self._index_new_exchange_order_ids()
+            found_order = self._fillable_orders_by_exchange_order_id.get(exchange_order_id)
+        return found_order
+
     def fetch_lost_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
@@ -203,7 +328,7 @@ class ClientOrderTracker:
     def process_trade_update(self, trade_update: TradeUpdate):
         client_order_id: str = trade_update.client_order_id
 
-        tracked_order: Optional[InFlightOrder] = self.all_fillable_orders.get(client_order_id)
+        tracked_order: Optional[InFlightOrder] = self.fetch_fillable_order(client_order_id)
 
         if tracked_order:
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
@@ -304,6 +429,63 @@ class ClientOrderTracker:
             else:
                 self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
+    def _reindex_order(self, client_order_id: str, order: InFlightOrder):
+        """
+        Updates the indexes for a single order, after it has been added to or removed from a state bucket.
+        When the same client order id is present in several buckets, lost orders take precedence over cached orders,
+        and cached orders over active orders.
+        """
+        active_order = self._in_flight_orders.get(client_order_id)
+        cached_order = self._cached_orders.get(client_order_id)
+        lost_order = self._lost_orders.get(client_order_id)
+
+        self._set_index_entry(self._all_orders, client_order_id, cached_order or active_order)
+        fillable_order = lost_order or cached_order or active_order
+        self._set_index_entry(self._all_fillable_orders, client_order_id, fillable_order)
+        updatable_order = lost_order or active_order
+        self._set_index_entry(self._all_updatable_orders, client_order_id, updatable_order)
+        self._connector.update_balance_ledger_order(client_order_id)
+
+        if order is not fillable_order:
+            self._unindex_exchange_order_id(order)
+        if fillable_order is None:
+            self._orders_without_exchange_order_id.pop(client_order_id, None)
+        elif fillable_order.exchange_order_id is None:
+            self._orders_without_exchange_order_id[client_order_id] = fillable_order
+        else:
+            self._orders_without_exchange_order_id.pop(client_order_id, None)
+            exchange_order_id = fillable_order.exchange_order_id
+            self._fillable_orders_by_exchange_order_id[exchange_order_id] = fillable_order
+            if updatable_order is not None:
+                self._updatable_orders_by_exchange_order_id[exchange_order_id] = updatable_order
+            elif self._updatable_orders_by_exchange_order_id.get(exchange_order_id) is fillable_order:
+                del self._updatable_orders_by_exchange_order_id[exchange_order_id]
+
+    def _unindex_exchange_order_id(self, order: InFlightOrder):
+        exchange_order_id = order.exchange_order_id
+        if exchange_order_id is not None:
+            if self._fillable_orders_by_exchange_order_id.get(exchange_order_id) is order:
+                del self._fillable_orders_by_exchange_order_id[exchange_order_id]
+            if self._updatable_orders_by_exchange_order_id.get(exchange_order_id) is order:
+                del self._updatable_orders_by_exchange_order_id[exchange_order_id]
+
+    def _index_new_exchange_order_ids(self):
+        """
+        Adds to the indexes by exchange order id the orders that got their exchange order id assigned directly
+        (without using `update_exchange_order_id`) since they were indexed.
+        """
+        if len(self._orders_without_exchange_order_id) > 0:
+            for client_order_id, order in list(self._orders_without_exchange_order_id.items()):
+                if order.exchange_order_id is not None:
+                    self._reindex_order(client_order_id, order)
+
+    @staticmethod
+    def _set_index_entry(index: Dict[str, InFlightOrder], client_order_id: str, order: Optional[InFlightOrder]):
+        if order is None:
+            index.pop(client_order_id, None)
+        else:
+            index[client_order_id] = order
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
@@ -12,8 +12,13 @@ cdef class ConnectorBase(NetworkIterator):
         public bint _real_time_balance_update
         public dict _in_flight_orders_snapshot
         public double _in_flight_orders_snapshot_timestamp
-        public set _current_trade_fills
-        public dict _exchange_order_ids
+        public object _in_flight_orders_snapshot_balances
+        public object _in_flight_orders_snapshot_balances_source
+        public object _current_trade_fills
+        public object _exchange_order_ids
+        public object _balance_ledger
+        public object _balance_ledger_fill_forwarder
+        public bint _balance_ledger_consistency_check
         public object _trade_fee_schema
         public object _trade_volume_metric_collector
         public object _client_config
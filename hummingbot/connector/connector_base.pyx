@@ -4,6 +4,8 @@ from decimal import Decimal
 from typing import Dict, List, Set, Tuple, TYPE_CHECKING, Union
 
 from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
+from hummingbot.connector.balance_ledger import BalanceLedger
+from hummingbot.connector.fill_dedup_index import ExchangeOrderIdIndex, TradeFillDedupIndex
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 from hummingbot.connector.utils import split_hb_trading_pair, TradeFillOrderDetails
 from hummingbot.connector.constants import s_decimal_NaN, s_decimal_0
@@ -12,6 +14,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.market_order import MarketOrder
+from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.network_iterator import NetworkIterator
@@ -62,8 +65,16 @@ cdef class ConnectorBase(NetworkIterator):
         # for _in_flight_orders_snapshot and _in_flight_orders_snapshot_timestamp when the update user balances.
         self._in_flight_orders_snapshot = {}  # Dict[order_id:str, InFlightOrderBase]
         self._in_flight_orders_snapshot_timestamp = 0.0
-        self._current_trade_fills = set()
-        self._exchange_order_ids = dict()
+        # Balances locked in the orders of the snapshot, calculated once for each new snapshot
+        self._in_flight_orders_snapshot_balances = {}
+        self._in_flight_orders_snapshot_balances_source = None
+        # Bounded indexes of the recorded trade fills and orders, used to detect the new fills in history reconciliation
+        self._current_trade_fills = TradeFillDedupIndex()
+        self._exchange_order_ids = ExchangeOrderIdIndex()
+        # Incremental ledger of the locked and filled balances, only used when enabled with enable_balance_ledger
+        self._balance_ledger = None
+        self._balance_ledger_fill_forwarder = None
+        self._balance_ledger_consistency_check = False
         self._trade_fee_schema = None
         self._trade_volume_metric_collector = client_config_map.anonymized_metrics_mode.get_collector(
             connector=self,
@@ -161,6 +172,79 @@ cdef class ConnectorBase(NetworkIterator):
             balances[quote] += quote_value
         return balances
 
+    def enable_balance_ledger(self, consistency_check: bool = False):
+        """
+        Starts keeping the balances locked in the in-flight orders and changed by the fills in a BalanceLedger, to
+        calculate the available balances without iterating all the orders and the event logs.
+        The ledger is updated with the fill events, and connectors have to call update_balance_ledger_order every time
+        an order is added to or removed from in_flight_orders.
+        :param consistency_check: if True every ledger query is compared against the full recalculation. Differences
+            are logged and the full recalculation is used
+        """
+        self._balance_ledger = BalanceLedger()
+        self._balance_ledger_consistency_check = consistency_check
+        for order in self.in_flight_orders.values():
+            self._balance_ledger.update_order(order)
+        for event in self.event_logs:
+            if isinstance(event, OrderFilledEvent):
+                self._balance_ledger.record_fill(event.timestamp, event.trading_pair, event.trade_type, event.price,
+                                                 event.amount)
+        self._balance_ledger_fill_forwarder = EventForwarder(self._did_fill_order_for_balance_ledger)
+        self.c_add_listener(MarketEvent.OrderFilled.value, self._balance_ledger_fill_forwarder)
+
+    def update_balance_ledger_order(self, client_order_id: str):
+        """
+        Updates the balance locked by the order in the balance ledger (if enabled), after a change in in_flight_orders
+        """
+        if self._balance_ledger is not None:
+            order = self.in_flight_orders.get(client_order_id)
+            if order is None:
+                self._balance_ledger.remove_order(client_order_id)
+            else:
+                self._balance_ledger.update_order(order)
+
+    def _did_fill_order_for_balance_ledger(self, event: OrderFilledEvent):
+        self._balance_ledger.record_fill(event.timestamp, event.trading_pair, event.trade_type, event.price,
+                                         event.amount)
+        self.update_balance_ledger_order(event.order_id)
+
+    def _in_flight_orders_snapshot_locked_balances(self) -> Dict[str, Decimal]:
+        # The snapshot is replaced (not modified) every time the balances are updated
+        snapshot = self._in_flight_orders_snapshot
+        if self._in_flight_orders_snapshot_balances_source is not snapshot:
+            self._in_flight_orders_snapshot_balances = self.in_flight_asset_balances(snapshot)
+            self._in_flight_orders_snapshot_balances_source = snapshot
+        return self._in_flight_orders_snapshot_balances
+
+    def _in_flight_orders_locked_balances(self) -> Dict[str, Decimal]:
+        if self._balance_ledger is None:
+            return self.in_flight_asset_balances(self.in_flight_orders)
+        balances = self._balance_ledger.locked_balances(self.estimate_fee_pct(True))
+        if self._balance_ledger_consistency_check:
+            balances = self._checked_balance_ledger_result(
+                "locked", balances, self.in_flight_asset_balances(self.in_flight_orders))
+        return balances
+
+    def _order_filled_balances_since(self, starting_timestamp: float) -> Dict[str, Decimal]:
+        if self._balance_ledger is None:
+            return self.order_filled_balances(starting_timestamp)
+        balances = self._balance_ledger.filled_balances(starting_timestamp)
+        if self._balance_ledger_consistency_check:
+            balances = self._checked_balance_ledger_result(
+                "filled", balances, self.order_filled_balances(starting_timestamp))
+        return balances
+
+    def _checked_balance_ledger_result(self,
+                                       balance_type: str,
+                                       ledger_balances: Dict[str, Decimal],
+                                       expected_balances: Dict[str, Decimal]) -> Dict[str, Decimal]:
+        for asset in set(ledger_balances) | set(expected_balances):
+            if ledger_balances.get(asset, s_decimal_0) != expected_balances.get(asset, s_decimal_0):
+                self.logger().warning(
+                    f"The balance ledger {balance_type} balance of {asset} ({ledger_balances.get(asset)}) does not "
+                    f"match the recalculated balance ({expected_balances.get(asset)}).")
+        return expected_balances
+
     def get_exchange_limit_config(self, market: str) -> Dict[str, object]:
         """
         Retrieves the Balance Limits for the specified market.
@@ -386,9 +470,9 @@ cdef class ConnectorBase(NetworkIterator):
         :param limit: The balance limit for the token
         :returns An available balance after the limit has been applied
         """
-        in_flight_balance = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
+        in_flight_balance = self._in_flight_orders_locked_balances().get(currency, s_decimal_0)
         limit -= in_flight_balance
-        filled_balance = self.order_filled_balances().get(currency, s_decimal_0)
+        filled_balance = self._order_filled_balances_since(0).get(currency, s_decimal_0)
         limit += filled_balance
         limit = max(limit, s_decimal_0)
         return min(available_balance, limit)
@@ -401,10 +485,10 @@ cdef class ConnectorBase(NetworkIterator):
         _update_balances()
         :returns the real available that accounts for changes in flight orders and filled orders
         """
-        snapshot_bal = self.in_flight_asset_balances(self._in_flight_orders_snapshot).get(currency, s_decimal_0)
-        in_flight_bal = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
-        orders_filled_bal = self.order_filled_balances(self._in_flight_orders_snapshot_timestamp).get(currency,
-                                                                                                      s_decimal_0)
+        snapshot_bal = self._in_flight_orders_snapshot_locked_balances().get(currency, s_decimal_0)
+        in_flight_bal = self._in_flight_orders_locked_balances().get(currency, s_decimal_0)
+        orders_filled_bal = self._order_filled_balances_since(self._in_flight_orders_snapshot_timestamp).get(
+            currency, s_decimal_0)
         actual_available = available_balance + snapshot_bal - in_flight_bal + orders_filled_bal
         return actual_available
 
@@ -517,6 +601,13 @@ cdef class ConnectorBase(NetworkIterator):
         """
         self._exchange_order_ids.update(current_exchange_order_ids)
 
+    def warm_start_trade_fills_from_market_recorder(self, trade_fills: Set[TradeFillOrderDetails]):
+        """
+        Loads the trade fills recorded in the past into the bloom filter of the trade fills index (if enabled), so
+        they are recognized by is_confirmed_new_order_filled_event without keeping each one of them in memory
+        """
+        self._current_trade_fills.warm_start(trade_fills)
+
     def is_confirmed_new_order_filled_event(self, exchange_trade_id: str, exchange_order_id: str, trading_pair: str):
         """
         Returns True if order to be filled is not already present in TradeFill entries.
@@ -524,7 +615,17 @@ cdef class ConnectorBase(NetworkIterator):
         """
         # Assume (market, exchange_trade_id, trading_pair) are unique. Also order has to be recorded in Order table
         return (not TradeFillOrderDetails(self.display_name, exchange_trade_id, trading_pair) in self._current_trade_fills) and \
-               (exchange_order_id in set(self._exchange_order_ids.keys()))
+               (exchange_order_id in self._exchange_order_ids)
+
+    def fill_dedup_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        :return: the size, number of lookups, hit rate and number of evictions of the indexes of the recorded trade
+            fills and exchange order ids
+        """
+        return {
+            "trade_fills": self._current_trade_fills.stats(),
+            "exchange_order_ids": self._exchange_order_ids.stats(),
+        }
 
     def trade_fee_schema(self):
         if self._trade_fee_schema is None:
@@ -514,7 +514,7 @@ class DydxV4PerpetualDerivative(PerpetualDerivativePyBase):
 
         for fill_data in fills_data:
             exchange_order_id: str = fill_data["orderId"]
-            all_orders = self._order_tracker.all_fillable_orders
+            all_orders = dict(self._order_tracker.all_fillable_orders)
             try:
                 for k, v in all_orders.items():
                     await v.get_exchange_order_id()
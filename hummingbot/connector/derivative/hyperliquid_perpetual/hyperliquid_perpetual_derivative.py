@@ -567,7 +567,7 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
         tracked_order = self._order_tracker.all_fillable_orders_by_exchange_order_id.get(exchange_order_id)
 
         if tracked_order is None:
-            all_orders = self._order_tracker.all_fillable_orders
+            all_orders = dict(self._order_tracker.all_fillable_orders)
             for k, v in all_orders.items():
                 await v.get_exchange_order_id()
             _cli_tracked_orders = [o for o in all_orders.values() if exchange_order_id == o.exchange_order_id]
@@ -32,6 +32,7 @@ if TYPE_CHECKING:
 
 class BinanceExchange(ExchangePyBase):
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
+    ORDER_BOOK_PER_PAIR_ROUTING = True
 
     web_utils = web_utils
 
@@ -622,7 +622,7 @@ class DexalotExchange(ExchangePyBase):
 
         exchange_order_id = trade["data"].get("makerOrder", "") \
             if trade["data"].get("addressMaker", "") == self.api_key else trade["data"].get("takerOrder", "")
-        all_orders = self._order_tracker.all_fillable_orders
+        all_orders = dict(self._order_tracker.all_fillable_orders)
         self._calculate_available_balance_from_trades(trade["data"])
         try:
             for k, v in all_orders.items():
@@ -75,6 +75,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                          LimitOrders *limit_orders_map_ptr,
                                                          LimitOrdersIterator *map_it_ptr)
     cdef c_process_crossed_limit_orders(self)
+    cdef bint c_has_crossed_limit_orders(self)
+    cdef object c_get_crossing_price(self, str trading_pair, bint is_buy)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
@@ -9,6 +9,7 @@ from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from cpython cimport PyObject
 from cython.operator cimport address, dereference as deref, postincrement as inc
+from libc.math cimport INFINITY
 from libcpp cimport bool as cppbool
 from libcpp.vector cimport vector
 
@@ -320,6 +321,21 @@ cdef class PaperTradeExchange(ExchangeBase):
         self.c_process_market_orders()
         self.c_process_crossed_limit_orders()
 
+    cdef double c_next_wake_up_timestamp(self, double timestamp):
+        """
+        The exchange needs to be ticked when the next queued market order is due, or on the next tick if the order
+        book has crossed a limit order. Limit orders not crossed are filled by the order book trade events, or are
+        crossed later by order book changes, which are checked again after each tick.
+        """
+        cdef:
+            QueuedOrder front_order
+        if self.c_has_crossed_limit_orders():
+            return timestamp
+        if len(self._queued_orders) > 0:
+            front_order = self._queued_orders[0]
+            return front_order.create_timestamp + self.TRADE_EXECUTION_DELAY
+        return INFINITY
+
     cdef str c_buy(self,
                    str trading_pair_str,
                    object amount,
@@ -872,6 +888,43 @@ cdef class PaperTradeExchange(ExchangeBase):
         for orders_it in process_order_its:
             self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
 
+    cdef bint c_has_crossed_limit_orders(self):
+        cdef:
+            LimitOrdersIterator map_it = self._bid_limit_orders.begin()
+            SingleTradingPairLimitOrders *orders_collection_ptr = NULL
+            object opposite_order_book_price
+
+        while map_it != self._bid_limit_orders.end():
+            orders_collection_ptr = address(deref(map_it).second)
+            if not orders_collection_ptr.empty():
+                opposite_order_book_price = self.c_get_crossing_price(deref(map_it).first.decode("utf8"), True)
+                if (opposite_order_book_price is not None and
+                        opposite_order_book_price <= <object>deref(orders_collection_ptr.rbegin()).getPrice()):
+                    return True
+            inc(map_it)
+
+        map_it = self._ask_limit_orders.begin()
+        while map_it != self._ask_limit_orders.end():
+            orders_collection_ptr = address(deref(map_it).second)
+            if not orders_collection_ptr.empty():
+                opposite_order_book_price = self.c_get_crossing_price(deref(map_it).first.decode("utf8"), False)
+                if (opposite_order_book_price is not None and
+                        opposite_order_book_price >= <object>deref(orders_collection_ptr.begin()).getPrice()):
+                    return True
+            inc(map_it)
+        return False
+
+    cdef object c_get_crossing_price(self, str trading_pair, bint is_buy):
+        """
+        :returns: the top price of the order book side the limit orders are compared to when processing crossed limit
+        orders, or None if that side of the order book is empty
+        """
+        try:
+            top_price = Decimal(str(self.c_get_order_book(trading_pair).c_get_price(is_buy)))
+        except EnvironmentError:
+            return None
+        return self.c_quantize_order_price(trading_pair, top_price)
+
     cdef c_process_crossed_limit_orders(self):
         cdef:
             LimitOrders *limit_orders_ptr = address(self._bid_limit_orders)
@@ -1,25 +1,27 @@
 import asyncio
-import copy
 import logging
 import math
+import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 from async_timeout import timeout
 
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.in_flight_orders_snapshot import InFlightOrdersSnapshotter
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.cancellation_result import CancellationResult
-from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -28,6 +30,7 @@ from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -45,6 +48,15 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Maximum number of orders whose status or fills are requested at the same time during a reconciliation cycle
+    ORDER_UPDATE_CONCURRENCY = 1
+    # Maximum number of orders in a single batch order creation or cancelation request (0 when the exchange does not
+    # provide the batch endpoint, the orders are then sent with concurrent single requests)
+    BATCH_ORDER_CREATE_MAX_SIZE = 0
+    BATCH_ORDER_CANCEL_MAX_SIZE = 0
+    # When True the order book messages of each trading pair are routed to their own bounded queue and the pending
+    # diffs are applied in batches (see OrderBookTracker per_pair_routing)
+    ORDER_BOOK_PER_PAIR_ROUTING = False
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -66,6 +78,16 @@ class ExchangePyBase(ExchangeBase, ABC):
             rate_limits=self.rate_limits_rules,
             limits_share_percentage=client_config_map.rate_limits_share_pct)
         self._poll_notifier = asyncio.Event()
+        # Duration of the order reconciliation cycles, for the active orders and for the lost orders
+        self._order_update_cycle_durations: Dict[str, LatencyHistogram] = {
+            "active_orders": LatencyHistogram(),
+            "lost_orders": LatencyHistogram(),
+        }
+        # Orders requested with batch_order_create and batch_order_cancel, sent together once the current tick ends
+        self._orders_pending_batch_creation: List[Union[LimitOrder, MarketOrder]] = []
+        self._orders_pending_batch_cancelation: List[LimitOrder] = []
+        self._order_batches_processing_scheduled = False
+        self._in_flight_orders_snapshotter = InFlightOrdersSnapshotter()
 
         # init Auth and Api factory
         self._auth: AuthBase = self.authenticator
@@ -76,12 +98,15 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            per_pair_routing=self.ORDER_BOOK_PER_PAIR_ROUTING))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
 
         self._order_tracker: ClientOrderTracker = self._create_order_tracker()
+        # The order tracker reports every change of the in-flight orders, which keeps the balance ledger updated
+        self.enable_balance_ledger()
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -139,6 +164,21 @@ class ExchangePyBase(ExchangeBase, ABC):
     def trading_pairs(self) -> List[str]:
         raise NotImplementedError
 
+    @property
+    def order_update_rate_limit_id(self) -> Optional[str]:
+        """
+        The rate limit of the requests of the status and fills of a single order. When defined, the number of orders
+        reconciled at the same time is also limited by the capacity of the throttler for that limit.
+        """
+        return None
+
+    def order_update_cycle_durations(self) -> Dict[str, LatencyHistogram]:
+        """
+        :return: the histograms of the durations (in seconds) of the reconciliation cycles of the active orders and of
+            the lost orders
+        """
+        return dict(self._order_update_cycle_durations)
+
     @property
     @abstractmethod
     def is_cancel_request_in_exchange_synchronous(self) -> bool:
@@ -389,6 +429,39 @@ class ExchangePyBase(ExchangeBase, ABC):
         failed_cancellations = [CancellationResult(oid, False) for oid in order_id_set]
         return successful_cancellations + failed_cancellations
 
+    def batch_order_create(
+        self, orders_to_create: List[Union[LimitOrder, MarketOrder]]
+    ) -> List[Union[LimitOrder, MarketOrder]]:
+        """
+        Creates a promise to create the orders. If the exchange supports batch requests (see
+        BATCH_ORDER_CREATE_MAX_SIZE) all the orders requested during the same tick are sent together. Otherwise each
+        order is created with buy or sell.
+
+        :param orders_to_create: the orders to create (the order ids can be blank)
+
+        :return: the orders to create, with the ids assigned by the connector (the client ids)
+        """
+        if self.BATCH_ORDER_CREATE_MAX_SIZE <= 0:
+            return super().batch_order_create(orders_to_create=orders_to_create)
+
+        orders_with_ids_to_create = []
+        for order in orders_to_create:
+            client_order_id = self._batch_order_client_order_id(order=order)
+            orders_with_ids_to_create.append(order.copy_with_id(client_order_id=client_order_id))
+        self._schedule_order_batches_processing()
+        self._orders_pending_batch_creation.extend(orders_with_ids_to_create)
+        return orders_with_ids_to_create
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Creates a promise to cancel the orders. All the cancelations requested during the same tick are sent together,
+        in batch requests if the exchange supports them (see BATCH_ORDER_CANCEL_MAX_SIZE).
+
+        :param orders_to_cancel: the orders to cancel
+        """
+        self._schedule_order_batches_processing()
+        self._orders_pending_batch_cancelation.extend(orders_to_cancel)
+
     async def _create_order(self,
                             trade_type: TradeType,
                             order_id: str,
@@ -407,6 +480,47 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
         :param price: the order price
         """
+        order = await self._start_tracking_and_validate_order(
+            trade_type=trade_type,
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            order_type=order_type,
+            price=price,
+            **kwargs,
+        )
+        if order is None:
+            return
+        try:
+            await self._place_order_and_process_update(order=order, **kwargs,)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self._on_order_failure(
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=order.amount,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=order.price,
+                exception=ex,
+                **kwargs,
+            )
+
+    async def _start_tracking_and_validate_order(self,
+                                                 trade_type: TradeType,
+                                                 order_id: str,
+                                                 trading_pair: str,
+                                                 amount: Decimal,
+                                                 order_type: OrderType,
+                                                 price: Optional[Decimal] = None,
+                                                 **kwargs) -> Optional[InFlightOrder]:
+        """
+        Starts tracking the order and checks it against the trading rules
+
+        :return: the tracked order, or None if the order is not valid (it is then marked as failed)
+        """
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -450,22 +564,8 @@ class ExchangePyBase(ExchangeBase, ABC):
                 exception=ValueError(f"Order notional {notional_size} is lower than minimum notional size {trading_rule.min_notional_size}"
                                      f" for the pair {trading_pair}. The order will not be created."))
             return
-        try:
-            await self._place_order_and_process_update(order=order, **kwargs,)
 
-        except asyncio.CancelledError:
-            raise
-        except Exception as ex:
-            self._on_order_failure(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=quantized_amount,
-                trade_type=trade_type,
-                order_type=order_type,
-                price=price,
-                exception=ex,
-                **kwargs,
-            )
+        return order
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
         exchange_order_id, update_timestamp = await self._place_order(
@@ -538,30 +638,36 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
             await self._order_tracker.process_order_not_found(order.client_order_id)
         except Exception as ex:
-            if self._is_order_not_found_during_cancelation_error(cancelation_exception=ex):
-                self.logger().warning(f"Failed to cancel order {order.client_order_id} (order not found)")
-                await self._order_tracker.process_order_not_found(order.client_order_id)
-            else:
-                self.logger().error(f"Failed to cancel order {order.client_order_id}", exc_info=True)
+            await self._process_order_cancelation_error(order=order, exception=ex)
         return None
 
+    async def _process_order_cancelation_error(self, order: InFlightOrder, exception: Exception):
+        if self._is_order_not_found_during_cancelation_error(cancelation_exception=exception):
+            self.logger().warning(f"Failed to cancel order {order.client_order_id} (order not found)")
+            await self._order_tracker.process_order_not_found(order.client_order_id)
+        else:
+            self.logger().error(f"Failed to cancel order {order.client_order_id}", exc_info=exception)
+
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
         cancelled = await self._place_cancel(order.client_order_id, order)
         if cancelled:
-            update_timestamp = self.current_timestamp
-            if update_timestamp is None or math.isnan(update_timestamp):
-                update_timestamp = self._time()
-            order_update: OrderUpdate = OrderUpdate(
-                client_order_id=order.client_order_id,
-                trading_pair=order.trading_pair,
-                update_timestamp=update_timestamp,
-                new_state=(OrderState.CANCELED
-                           if self.is_cancel_request_in_exchange_synchronous
-                           else OrderState.PENDING_CANCEL),
-            )
-            self._order_tracker.process_order_update(order_update)
+            self._process_order_cancelation_success(order=order)
         return cancelled
 
+    def _process_order_cancelation_success(self, order: InFlightOrder):
+        update_timestamp = self.current_timestamp
+        if update_timestamp is None or math.isnan(update_timestamp):
+            update_timestamp = self._time()
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=update_timestamp,
+            new_state=(OrderState.CANCELED
+                       if self.is_cancel_request_in_exchange_synchronous
+                       else OrderState.PENDING_CANCEL),
+        )
+        self._order_tracker.process_order_update(order_update)
+
     async def _execute_cancel(self, trading_pair: str, order_id: str) -> str:
         """
         Requests the exchange to cancel an active order
@@ -576,6 +682,132 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return result
 
+    def _schedule_order_batches_processing(self):
+        if not self._order_batches_processing_scheduled:
+            self._order_batches_processing_scheduled = True
+            safe_ensure_future(self._process_order_batches())
+
+    async def _process_order_batches(self):
+        orders_to_create, self._orders_pending_batch_creation = self._orders_pending_batch_creation, []
+        orders_to_cancel, self._orders_pending_batch_cancelation = self._orders_pending_batch_cancelation, []
+        self._order_batches_processing_scheduled = False
+        await safe_gather(
+            self._execute_orders_cancelation(orders_to_cancel=orders_to_cancel),
+            self._execute_orders_creation(orders_to_create=orders_to_create),
+        )
+
+    async def _execute_orders_creation(self, orders_to_create: List[Union[LimitOrder, MarketOrder]]):
+        # Only connectors with a batch order creation endpoint queue orders (see batch_order_create)
+        if len(orders_to_create) == 0:
+            return
+        valid_orders = []
+        for order in orders_to_create:
+            valid_order = await self._start_tracking_and_validate_order(
+                trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.quantity,
+                order_type=order.order_type(),
+                price=self._batch_order_price(order=order),
+                **self._position_kwargs(order),
+            )
+            if valid_order is not None:
+                valid_orders.append(valid_order)
+        await safe_gather(*[
+            self._place_order_batch_and_process_updates(orders=chunk)
+            for chunk in self._split_in_chunks(valid_orders, self.BATCH_ORDER_CREATE_MAX_SIZE)
+        ])
+
+    async def _place_order_batch_and_process_updates(self, orders: List[InFlightOrder]):
+        try:
+            results = await self._place_order_batch(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self.logger().network(f"Batch order create failed for {len(orders)} orders.", exc_info=True)
+            results = [ex] * len(orders)
+
+        for order, result in zip(orders, results):
+            if isinstance(result, Exception):
+                self._on_order_failure(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    exception=result,
+                )
+            else:
+                exchange_order_id, update_timestamp = result
+                order_update: OrderUpdate = OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(exchange_order_id),
+                    trading_pair=order.trading_pair,
+                    update_timestamp=update_timestamp,
+                    new_state=OrderState.OPEN,
+                )
+                self._order_tracker.process_order_update(order_update)
+
+    async def _execute_orders_cancelation(self, orders_to_cancel: List[LimitOrder]):
+        tracked_orders = []
+        for order in orders_to_cancel:
+            tracked_order = self._order_tracker.fetch_tracked_order(order.client_order_id)
+            if tracked_order is not None:
+                tracked_orders.append(tracked_order)
+
+        if self.BATCH_ORDER_CANCEL_MAX_SIZE <= 0:
+            await safe_gather(*[self._execute_order_cancel(order=order) for order in tracked_orders])
+            return
+
+        await safe_gather(*[
+            self._place_cancel_batch_and_process_updates(orders=chunk)
+            for chunk in self._split_in_chunks(tracked_orders, self.BATCH_ORDER_CANCEL_MAX_SIZE)
+        ])
+
+    async def _place_cancel_batch_and_process_updates(self, orders: List[InFlightOrder]):
+        try:
+            results = await self._place_cancel_batch(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self.logger().network(f"Batch order cancel failed for {len(orders)} orders.", exc_info=True)
+            results = [ex] * len(orders)
+
+        for order, result in zip(orders, results):
+            if isinstance(result, Exception):
+                await self._process_order_cancelation_error(order=order, exception=result)
+            elif result:
+                self._process_order_cancelation_success(order=order)
+
+    def _batch_order_client_order_id(self, order: Union[LimitOrder, MarketOrder]) -> str:
+        """
+        Connectors with a batch order creation endpoint that build their own client order ids in buy and sell override
+        this method to build the ids of the orders created in batch the same way.
+        """
+        return get_new_client_order_id(
+            is_buy=order.is_buy,
+            trading_pair=order.trading_pair,
+            hbot_order_id_prefix=self.client_order_id_prefix,
+            max_id_len=self.client_order_id_max_length,
+        )
+
+    def _batch_order_price(self, order: Union[LimitOrder, MarketOrder]) -> Decimal:
+        """
+        Connectors with a batch order creation endpoint that set the order price in buy and sell (e.g. the price of
+        market orders) override this method to price the orders created in batch the same way.
+        """
+        return order.price if order.price is not None else s_decimal_NaN
+
+    @staticmethod
+    def _split_in_chunks(orders: List[InFlightOrder], chunk_size: int) -> List[List[InFlightOrder]]:
+        return [orders[i:i + chunk_size] for i in range(0, len(orders), chunk_size)]
+
+    @staticmethod
+    def _position_kwargs(order: Union[LimitOrder, MarketOrder]) -> Dict[str, Any]:
+        # The position action is only sent for the orders of derivative markets
+        return {} if order.position == PositionAction.NIL else {"position_action": order.position}
+
     # === Order Tracking ===
 
     def restore_tracking_states(self, saved_states: Dict[str, Any]):
@@ -649,6 +881,26 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_order_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Connectors with a batch order creation endpoint override this method and set BATCH_ORDER_CREATE_MAX_SIZE to
+        the maximum number of orders accepted in a single request.
+        :param orders: the orders to create, at most BATCH_ORDER_CREATE_MAX_SIZE
+        :return: for each order (in the same order), either the exchange order id and the update timestamp, or the
+            exception explaining why the order was rejected
+        """
+        raise NotImplementedError
+
+    async def _place_cancel_batch(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        """
+        Connectors with a batch order cancelation endpoint override this method and set BATCH_ORDER_CANCEL_MAX_SIZE to
+        the maximum number of orders accepted in a single request.
+        :param orders: the orders to cancel, at most BATCH_ORDER_CANCEL_MAX_SIZE
+        :return: for each order (in the same order), either True if the order was canceled, or the exception explaining
+            why the cancelation failed
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _get_fee(self,
                  base_currency: str,
@@ -945,7 +1197,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             await self._update_balances()
             if not self.real_time_balance_update:
                 # This is only required for exchanges that do not provide balance update notifications through websocket
-                self._in_flight_orders_snapshot = {k: copy.copy(v) for k, v in self.in_flight_orders.items()}
+                self._in_flight_orders_snapshot = self._in_flight_orders_snapshotter.take_snapshot(self.in_flight_orders)
                 self._in_flight_orders_snapshot_timestamp = self.current_timestamp
         except asyncio.CancelledError:
             raise
@@ -956,18 +1208,25 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        for order in orders:
-            try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
-                for trade_update in trade_updates:
-                    self._order_tracker.process_trade_update(trade_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                self.logger().warning(
-                    f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
-                    exc_info=request_error,
-                )
+        trade_updates = await self._request_recent_trade_updates_with_error_handling(orders)
+        if trade_updates is not None:
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+            return
+        await self._process_orders_concurrently(orders, self._update_order_fills)
+
+    async def _update_order_fills(self, order: InFlightOrder):
+        try:
+            trade_updates = await self._all_trade_updates_for_order(order=order)
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
+                exc_info=request_error,
+            )
 
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
@@ -996,7 +1255,16 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().warning(f"Error fetching status update for the lost order {order.client_order_id}: {error}.")
 
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
-        for order in orders:
+        order_updates = await self._request_open_orders_status_with_error_handling(orders)
+        if order_updates is not None:
+            for order in orders:
+                order_update = order_updates.get(order.client_order_id)
+                if order_update is not None:
+                    self._order_tracker.process_order_update(order_update)
+            # The orders not reported by the bulk request (e.g. the ones no longer open) are requested one by one
+            orders = [order for order in orders if order.client_order_id not in order_updates]
+
+        async def update_order(order: InFlightOrder):
             try:
                 order_update = await self._request_order_status(tracked_order=order)
                 self._order_tracker.process_order_update(order_update)
@@ -1005,6 +1273,68 @@ class ExchangePyBase(ExchangeBase, ABC):
             except Exception as request_error:
                 await error_handler(order, request_error)
 
+        await self._process_orders_concurrently(orders, update_order)
+
+    async def _process_orders_concurrently(self,
+                                           orders: List[InFlightOrder],
+                                           process_order: Callable[[InFlightOrder], Awaitable[None]]):
+        """
+        Processes the orders with up to ORDER_UPDATE_CONCURRENCY concurrent workers, in the order of the list when
+        there is a single worker.
+        """
+        concurrency = self._order_update_concurrency(len(orders))
+        if concurrency <= 1:
+            for order in orders:
+                await process_order(order)
+            return
+
+        pending_orders = iter(orders)
+
+        async def worker():
+            for order in pending_orders:
+                await process_order(order)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    def _order_update_concurrency(self, orders_count: int) -> int:
+        concurrency = min(self.ORDER_UPDATE_CONCURRENCY, orders_count)
+        limit_id = self.order_update_rate_limit_id
+        if concurrency > 1 and limit_id is not None:
+            capacity = self._throttler.available_capacity(limit_id)
+            if capacity is not None:
+                concurrency = min(concurrency, capacity)
+        return max(1, concurrency)
+
+    async def _request_recent_trade_updates_with_error_handling(
+            self, orders: List[InFlightOrder]) -> Optional[List[TradeUpdate]]:
+        if not orders:
+            return None
+        try:
+            return await self._request_recent_trade_updates(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch the recent trade updates, requesting them order by order. Error: {request_error}",
+                exc_info=request_error,
+            )
+            return None
+
+    async def _request_open_orders_status_with_error_handling(
+            self, orders: List[InFlightOrder]) -> Optional[Dict[str, OrderUpdate]]:
+        if not orders:
+            return None
+        try:
+            return await self._request_open_orders_status(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch the status of the open orders, requesting it order by order. Error: {request_error}",
+                exc_info=request_error,
+            )
+            return None
+
     async def _update_orders(self):
         orders_to_update = self.in_flight_orders.copy()
         await self._update_orders_with_error_handler(
@@ -1018,12 +1348,16 @@ class ExchangePyBase(ExchangeBase, ABC):
         )
 
     async def _update_order_status(self):
+        start = time.perf_counter()
         await self._update_orders_fills(orders=list(self._order_tracker.all_fillable_orders.values()))
         await self._update_orders()
+        self._order_update_cycle_durations["active_orders"].observe(time.perf_counter() - start)
 
     async def _update_lost_orders_status(self):
+        start = time.perf_counter()
         await self._update_orders_fills(orders=list(self._order_tracker.lost_orders.values()))
         await self._update_lost_orders()
+        self._order_update_cycle_durations["lost_orders"].observe(time.perf_counter() - start)
 
     async def _cancel_lost_orders(self):
         for _, lost_order in self._order_tracker.lost_orders.items():
@@ -1055,6 +1389,25 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _request_recent_trade_updates(self, orders: List[InFlightOrder]) -> Optional[List[TradeUpdate]]:
+        """
+        Connectors with an endpoint returning the recent fills of the account can override this method to get the fills
+        of all the orders with a single request, instead of calling _all_trade_updates_for_order for each order.
+        :param orders: the orders whose fills are requested
+        :return: the trade updates, None if not supported (the fills are then requested order by order)
+        """
+        return None
+
+    async def _request_open_orders_status(self, orders: List[InFlightOrder]) -> Optional[Dict[str, OrderUpdate]]:
+        """
+        Connectors with an endpoint returning the open orders of the account can override this method to get the
+        status of many orders with a single request, instead of calling _request_order_status for each order.
+        :param orders: the orders whose status is requested
+        :return: the order updates by client order id, None if not supported. The status of the orders without update
+            (e.g. the ones that are no longer open) is requested order by order
+        """
+        return None
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
@@ -0,0 +1,183 @@
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 100000
+
+
+class BloomFilter:
+    """
+    Fixed-size probabilistic set. Membership checks can return false positives (at the configured rate once the
+    filter holds `capacity` items) but never false negatives.
+    """
+
+    __slots__ = ("_bits", "_bits_count", "_hashes_count", "count")
+
+    def __init__(self, capacity: int, false_positive_rate: float = 1e-6):
+        self._bits_count: int = max(8, int(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        self._hashes_count: int = max(1, round(self._bits_count / capacity * math.log(2)))
+        self._bits = bytearray((self._bits_count + 7) // 8)
+        self.count: int = 0
+
+    def _positions(self, item: Hashable) -> Iterator[int]:
+        digest = hashlib.blake2b(repr(item).encode("utf8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self._hashes_count):
+            yield (first + i * second) % self._bits_count
+
+    def add(self, item: Hashable):
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: Hashable) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class _BoundedIndex:
+    """
+    Insertion ordered index that evicts its oldest entries when it holds more than `max_entries` entries, or when
+    they are older than `max_age` seconds. Membership checks are O(1) and counted to report the hit rate.
+    """
+
+    def __init__(self,
+                 max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+                 max_age: Optional[float] = None,
+                 time_provider: Callable[[], float] = time.time):
+        """
+        :param max_entries: maximum number of entries kept, None for no count limit
+        :param max_age: maximum age in seconds of the entries kept, None for no age limit
+        :param time_provider: function returning the current time, used for the age of the entries
+        """
+        self._max_entries = max_entries
+        self._max_age = max_age
+        self._time_provider = time_provider
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.lookups: int = 0
+        self.hits: int = 0
+        self.evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups > 0 else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {"size": len(self), "lookups": self.lookups, "hits": self.hits, "hit_rate": self.hit_rate,
+                "evictions": self.evictions}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._entries)
+
+    def _contains(self, key: Hashable) -> bool:
+        self._expire()
+        return key in self._entries
+
+    def _count_lookup(self, found: bool) -> bool:
+        self.lookups += 1
+        if found:
+            self.hits += 1
+        return found
+
+    def _put(self, key: Hashable, value: Any):
+        self._entries[key] = (self._time_provider(), value)
+        self._entries.move_to_end(key)
+        self._expire()
+
+    def _expire(self):
+        if self._max_entries is not None:
+            while len(self._entries) > self._max_entries:
+                self._evict_oldest()
+        if self._max_age is not None and len(self._entries) > 0:
+            oldest_allowed = self._time_provider() - self._max_age
+            while len(self._entries) > 0 and next(iter(self._entries.values()))[0] < oldest_allowed:
+                self._evict_oldest()
+
+    def _evict_oldest(self):
+        key, _ = self._entries.popitem(last=False)
+        self.evictions += 1
+        self._on_evicted(key)
+
+    def _on_evicted(self, key: Hashable):
+        pass
+
+
+class TradeFillDedupIndex(_BoundedIndex):
+    """
+    Set of the trade fills already recorded, used to avoid recording twice the fills found during history
+    reconciliation. When a bloom filter capacity is configured, the evicted fills (and the ones loaded with warm_start)
+    are still recognized through the bloom filter, at the cost of a small false positive rate.
+    """
+
+    def __init__(self,
+                 max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+                 max_age: Optional[float] = None,
+                 bloom_filter_capacity: int = 0,
+                 bloom_filter_false_positive_rate: float = 1e-6,
+                 time_provider: Callable[[], float] = time.time):
+        """
+        :param bloom_filter_capacity: expected number of fills kept in the bloom filter, 0 to disable it
+        """
+        super().__init__(max_entries=max_entries, max_age=max_age, time_provider=time_provider)
+        self._bloom_filter: Optional[BloomFilter] = (
+            BloomFilter(capacity=bloom_filter_capacity, false_positive_rate=bloom_filter_false_positive_rate)
+            if bloom_filter_capacity > 0
+            else None)
+
+    def add(self, trade_fill: Hashable):
+        self._put(trade_fill, None)
+
+    def update(self, trade_fills: Iterable[Hashable]):
+        for trade_fill in trade_fills:
+            self._put(trade_fill, None)
+
+    def warm_start(self, trade_fills: Iterable[Hashable]):
+        """
+        Loads fills recorded in the past (e.g. all the fills in the database) into the bloom filter only, without
+        using memory for each one of them. Without bloom filter the fills are added to the index.
+        """
+        if self._bloom_filter is None:
+            self.update(trade_fills)
+        else:
+            for trade_fill in trade_fills:
+                self._bloom_filter.add(trade_fill)
+
+    def __contains__(self, trade_fill: Hashable) -> bool:
+        found = self._contains(trade_fill) or (self._bloom_filter is not None and trade_fill in self._bloom_filter)
+        return self._count_lookup(found)
+
+    def _on_evicted(self, key: Hashable):
+        if self._bloom_filter is not None:
+            self._bloom_filter.add(key)
+
+
+class ExchangeOrderIdIndex(_BoundedIndex):
+    """
+    Mapping of the exchange order ids of the recorded orders to their client order ids
+    """
+
+    def get(self, exchange_order_id: str, default: Optional[str] = None) -> Optional[str]:
+        self._expire()
+        entry = self._entries.get(exchange_order_id)
+        return entry[1] if entry is not None else default
+
+    def update(self, exchange_order_ids: Dict[str, str]):
+        for exchange_order_id, client_order_id in exchange_order_ids.items():
+            self._put(exchange_order_id, client_order_id)
+
+    def keys(self) -> Iterable[str]:
+        return self._entries.keys()
+
+    def __getitem__(self, exchange_order_id: str) -> str:
+        return self._entries[exchange_order_id][1]
+
+    def __setitem__(self, exchange_order_id: str, client_order_id: str):
+        self._put(exchange_order_id, client_order_id)
+
+    def __contains__(self, exchange_order_id: str) -> bool:
+        return self._count_lookup(self._contains(exchange_order_id))
@@ -1,5 +1,4 @@
 import asyncio
-import copy
 import itertools as it
 import logging
 import re
@@ -11,6 +10,7 @@ from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.gateway.common_types import TransactionStatus
 from hummingbot.connector.gateway.gateway_in_flight_order import GatewayInFlightOrder
+from hummingbot.connector.in_flight_orders_snapshot import InFlightOrdersSnapshotter
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import OrderState, OrderUpdate, TradeFeeBase, TradeUpdate
@@ -100,6 +100,7 @@ class GatewayBase(ConnectorBase):
         self._poll_notifier = None
         self._native_currency = None
         self._order_tracker: ClientOrderTracker = ClientOrderTracker(connector=self, lost_order_count_limit=10)
+        self._in_flight_orders_snapshotter = InFlightOrdersSnapshotter()
         self._amount_quantum_dict = {}
         self._token_data = {}  # Store complete token information
         self._allowances = {}
@@ -440,7 +441,8 @@ class GatewayBase(ConnectorBase):
             for asset_name in asset_names_to_remove:
                 del self._account_available_balances[asset_name]
                 del self._account_balances[asset_name]
-            self._in_flight_orders_snapshot = {k: copy.copy(v) for k, v in self._order_tracker.all_orders.items()}
+            self._in_flight_orders_snapshot = self._in_flight_orders_snapshotter.take_snapshot(
+                self._order_tracker.all_orders)
             self._in_flight_orders_snapshot_timestamp = self.current_timestamp
 
     async def _update_balances(self):
@@ -0,0 +1,46 @@
+import copy
+from typing import Dict, Hashable, Mapping, Tuple
+
+from hummingbot.core.data_type.in_flight_order import InFlightOrder
+
+
+class InFlightOrdersSnapshotter:
+    """
+    Takes snapshots of the in-flight orders for the balance estimation of the connectors without real time balance
+    updates. Each order has a version built from its mutable state, and only the orders whose version changed since the
+    previous snapshot are copied. The other ones reuse the copy taken before, which is never modified.
+    """
+
+    def __init__(self):
+        self._versioned_copies: Dict[str, Tuple[Hashable, InFlightOrder]] = {}
+        self.copied_orders_count: int = 0
+        self.reused_orders_count: int = 0
+
+    @staticmethod
+    def order_version(order: InFlightOrder) -> Hashable:
+        return (
+            order.current_state,
+            order.executed_amount_base,
+            order.executed_amount_quote,
+            order.exchange_order_id,
+            order.last_update_timestamp,
+        )
+
+    def take_snapshot(self, orders: Mapping[str, InFlightOrder]) -> Dict[str, InFlightOrder]:
+        """
+        :param orders: the current orders by client order id
+        :return: a copy of the orders, by client order id
+        """
+        versioned_copies = {}
+        for client_order_id, order in orders.items():
+            version = self.order_version(order)
+            versioned_copy = self._versioned_copies.get(client_order_id)
+            if versioned_copy is None or versioned_copy[0] != version:
+                versioned_copy = (version, copy.copy(order))
+                self.copied_orders_count += 1
+            else:
+                self.reused_orders_count += 1
+            versioned_copies[client_order_id] = versioned_copy
+        # Orders no longer present are dropped with the previous snapshot
+        self._versioned_copies = versioned_copies
+        return {client_order_id: order_copy for client_order_id, (_, order_copy) in versioned_copies.items()}
@@ -0,0 +1,184 @@
+import glob
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Columns of each snapshot chunk, besides the pairs table and the pair offsets
+SNAPSHOT_COLUMNS = ("timestamp", "pair_index", "mid_price", "best_bid", "best_ask", "bids", "asks")
+CHUNK_FILE_PREFIX = "market_data_"
+
+
+class MarketDataSnapshotBuffer:
+    """
+    In memory buffer of order book snapshots, stored column by column in preallocated NumPy arrays.
+    The bids and asks of each snapshot are stored as (depth, 2) blocks of [price, amount] rows, best first. Levels
+    missing in the book are NaN.
+    """
+
+    def __init__(self, depth: int, capacity: int):
+        self._depth = depth
+        self._capacity = capacity
+        self._size = 0
+        self._timestamp = np.empty(capacity, dtype=np.int64)
+        self._pair_index = np.empty(capacity, dtype=np.int32)
+        self._mid_price = np.empty(capacity, dtype=np.float64)
+        self._best_bid = np.empty(capacity, dtype=np.float64)
+        self._best_ask = np.empty(capacity, dtype=np.float64)
+        self._bids = np.full((capacity, depth, 2), np.nan, dtype=np.float64)
+        self._asks = np.full((capacity, depth, 2), np.nan, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def is_full(self) -> bool:
+        return self._size >= self._capacity
+
+    def append(self,
+               timestamp: int,
+               pair_index: int,
+               mid_price: float,
+               best_bid: float,
+               best_ask: float,
+               bids: np.ndarray,
+               asks: np.ndarray):
+        """
+        :param bids: [price, amount] rows of the best bids, up to depth rows
+        :param asks: [price, amount] rows of the best asks, up to depth rows
+        """
+        if self.is_full:
+            raise ValueError("The market data snapshot buffer is full.")
+        i = self._size
+        self._timestamp[i] = timestamp
+        self._pair_index[i] = pair_index
+        self._mid_price[i] = mid_price
+        self._best_bid[i] = best_bid
+        self._best_ask[i] = best_ask
+        self._bids[i, :len(bids)] = bids[:self._depth]
+        self._asks[i, :len(asks)] = asks[:self._depth]
+        self._size += 1
+
+    def take(self) -> Dict[str, np.ndarray]:
+        """
+        Removes the buffered snapshots.
+        :return: the columns of the snapshots, sorted by pair and timestamp
+        """
+        order = np.lexsort((self._timestamp[:self._size], self._pair_index[:self._size]))
+        columns = {
+            "timestamp": self._timestamp[order],
+            "pair_index": self._pair_index[order],
+            "mid_price": self._mid_price[order],
+            "best_bid": self._best_bid[order],
+            "best_ask": self._best_ask[order],
+            "bids": self._bids[order],
+            "asks": self._asks[order],
+        }
+        self._bids[:self._size] = np.nan
+        self._asks[:self._size] = np.nan
+        self._size = 0
+        return columns
+
+
+class MarketDataSnapshotStore:
+    """
+    Directory of market data snapshot chunks. Each chunk is an uncompressed .npz file holding the snapshot columns
+    sorted by pair and timestamp, the pairs table and the offset of the first snapshot of each pair, so that the
+    snapshots of a pair are read with a slice and a binary search on the timestamps. The first and last timestamps
+    of each chunk are part of its file name.
+    """
+
+    def __init__(self, directory: str):
+        self._directory = directory
+        self._pairs: List[Tuple[str, str]] = []
+        self._pair_indexes: Dict[Tuple[str, str], int] = {}
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def pair_index(self, exchange: str, trading_pair: str) -> int:
+        key = (exchange, trading_pair)
+        index = self._pair_indexes.get(key)
+        if index is None:
+            index = len(self._pairs)
+            self._pairs.append(key)
+            self._pair_indexes[key] = index
+        return index
+
+    def write_chunk(self, columns: Dict[str, np.ndarray]) -> Optional[str]:
+        """
+        Writes the snapshots taken from a buffer to a new chunk file.
+        :return: the path of the chunk, None if there are no snapshots
+        """
+        timestamps = columns["timestamp"]
+        if len(timestamps) == 0:
+            return None
+        # Pairs are only ever appended, the copy holds all the pairs referenced by the snapshots
+        pairs = list(self._pairs)
+        os.makedirs(self._directory, exist_ok=True)
+        pair_offsets = np.searchsorted(columns["pair_index"], np.arange(len(pairs) + 1)).astype(np.int64)
+        path = os.path.join(self._directory,
+                            f"{CHUNK_FILE_PREFIX}{timestamps.min()}_{timestamps.max()}_{len(self._chunk_paths())}.npz")
+        with open(path, "wb") as chunk_file:
+            np.savez(chunk_file,
+                     pairs=np.array(pairs, dtype=str).reshape(-1, 2),
+                     pair_offsets=pair_offsets,
+                     **columns)
+        return path
+
+    def read(self,
+             exchange: Optional[str] = None,
+             trading_pair: Optional[str] = None,
+             start: Optional[int] = None,
+             end: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Reads the snapshots of the chunks of the directory.
+        :param exchange: only read the snapshots of this exchange
+        :param trading_pair: only read the snapshots of this trading pair
+        :param start: only read the snapshots taken at or after this timestamp (ms)
+        :param end: only read the snapshots taken at or before this timestamp (ms)
+        :return: the snapshot columns, with the exchange and trading pair of each snapshot instead of the pair index
+        """
+        parts: List[Dict[str, np.ndarray]] = []
+        for path in self._chunk_paths():
+            first_timestamp, last_timestamp = self._chunk_time_range(path)
+            if (start is not None and last_timestamp < start) or (end is not None and first_timestamp > end):
+                continue
+            with np.load(path) as chunk:
+                pairs = chunk["pairs"]
+                pair_offsets = chunk["pair_offsets"]
+                columns = {column: chunk[column] for column in SNAPSHOT_COLUMNS}
+            for index, (pair_exchange, pair_trading_pair) in enumerate(pairs):
+                if exchange is not None and pair_exchange != exchange:
+                    continue
+                if trading_pair is not None and pair_trading_pair != trading_pair:
+                    continue
+                pair_start, pair_end = pair_offsets[index], pair_offsets[index + 1]
+                timestamps = columns["timestamp"][pair_start:pair_end]
+                if start is not None:
+                    pair_start += np.searchsorted(timestamps, start, side="left")
+                if end is not None:
+                    pair_end = pair_offsets[index] + np.searchsorted(timestamps, end, side="right")
+                if pair_end <= pair_start:
+                    continue
+                part = {column: values[pair_start:pair_end] for column, values in columns.items()
+                        if column != "pair_index"}
+                part["exchange"] = np.full(pair_end - pair_start, pair_exchange)
+                part["trading_pair"] = np.full(pair_end - pair_start, pair_trading_pair)
+                parts.append(part)
+        if not parts:
+            return {}
+        return {column: np.concatenate([part[column] for part in parts]) for column in parts[0]}
+
+    def _chunk_paths(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(self._directory, f"{CHUNK_FILE_PREFIX}*.npz")))
+
+    @staticmethod
+    def _chunk_time_range(path: str) -> Tuple[int, int]:
+        first_timestamp, last_timestamp = os.path.basename(path)[len(CHUNK_FILE_PREFIX):-4].split("_")[:2]
+        return int(first_timestamp), int(last_timestamp)
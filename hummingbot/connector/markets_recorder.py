@@ -5,8 +5,9 @@ import os.path
 import threading
 import time
 from decimal import Decimal
-from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -14,6 +15,9 @@ from sqlalchemy.orm import Query, Session
 from hummingbot import data_path
 from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.market_data_snapshots import MarketDataSnapshotBuffer, MarketDataSnapshotStore
+from hummingbot.connector.markets_recorder_writer import MarketsRecorderWriter
+from hummingbot.connector.trades_csv_writer import TradesCsvWriter
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
@@ -76,7 +80,20 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 write_behind: bool = False,
+                 write_behind_interval: float = 0.05,
+                 write_behind_queue_size: int = 10000,
+                 trade_fills_warm_start: bool = False):
+        """
+        :param write_behind: if True the market events are persisted by a writer thread, in batches of all the events
+            received during write_behind_interval, instead of synchronously in the event loop thread
+        :param write_behind_interval: seconds between the writes of the writer thread
+        :param write_behind_queue_size: maximum number of pending operations of the writer thread. When the queue is
+            full, the event handlers block until the writer catches up
+        :param trade_fills_warm_start: if True all the trade fills recorded for the config are loaded in the connectors
+            trade fills index (in its bloom filter when enabled), not only the latest ones
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -87,7 +104,21 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._market_data_snapshot_buffer: Optional[MarketDataSnapshotBuffer] = None
+        self._market_data_snapshot_store: Optional[MarketDataSnapshotStore] = None
+        self._writer: Optional[MarketsRecorderWriter] = None
+        self._csv_writers: Dict[str, TradesCsvWriter] = {}
+        if write_behind:
+            self._writer = MarketsRecorderWriter(sql=sql,
+                                                 flush_interval=write_behind_interval,
+                                                 max_queue_size=write_behind_queue_size)
+            self._writer.start()
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
+        if trade_fills_warm_start:
+            all_trade_fills = {TradeFillOrderDetails(tf.market, tf.exchange_trade_id, tf.symbol)
+                               for tf in self.get_trades_for_config(self._config_file_path)}
+            for market in self._markets:
+                market.warm_start_trade_fills_from_market_recorder(all_trade_fills)
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
             market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(tf.market,
@@ -128,6 +159,9 @@ class MarketsRecorder:
         self._market_data_collection_task = self._ev_loop.create_task(self._record_market_data())
 
     async def _record_market_data(self):
+        if self._market_data_collection_config.market_data_collection_columnar:
+            await self._record_market_data_snapshots()
+            return
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
@@ -149,8 +183,8 @@ class MarketsRecorder:
                                         best_bid=best_bid,
                                         best_ask=best_ask,
                                         order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
+                                            "bid": list(islice(order_book.bid_entries(), depth)),
+                                            "ask": list(islice(order_book.ask_entries(), depth))}
                                     )
                                     session.add(market_data)
             except asyncio.CancelledError:
@@ -160,6 +194,64 @@ class MarketsRecorder:
             finally:
                 await self._sleep(self._market_data_collection_config.market_data_collection_interval)
 
+    @property
+    def market_data_snapshot_store(self) -> MarketDataSnapshotStore:
+        if self._market_data_snapshot_store is None:
+            config_name = os.path.splitext(os.path.basename(self._config_file_path))[0]
+            self._market_data_snapshot_store = MarketDataSnapshotStore(
+                os.path.join(data_path(), "market_data", config_name))
+        return self._market_data_snapshot_store
+
+    async def _record_market_data_snapshots(self):
+        """
+        Records the top of the order books in memory and writes them in bulk to columnar snapshot files every
+        market_data_collection_flush_interval seconds, instead of writing a database row per pair and snapshot.
+        """
+        config = self._market_data_collection_config
+        store = self.market_data_snapshot_store
+        snapshots_per_flush = max(1, config.market_data_collection_flush_interval // config.market_data_collection_interval)
+        pairs_count = sum(len(market.trading_pairs) for market in self._markets)
+        self._market_data_snapshot_buffer = MarketDataSnapshotBuffer(
+            depth=config.market_data_collection_depth + 1,
+            capacity=max(1, (snapshots_per_flush + 1) * pairs_count))
+        last_flush = time.time()
+        try:
+            while True:
+                try:
+                    if all(ex.ready for ex in self._markets):
+                        self._add_market_data_snapshots()
+                    if time.time() - last_flush >= config.market_data_collection_flush_interval:
+                        last_flush = time.time()
+                        await self._ev_loop.run_in_executor(
+                            None, store.write_chunk, self._market_data_snapshot_buffer.take())
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().error("Unexpected error while recording market data.", exc_info=True)
+                finally:
+                    await self._sleep(config.market_data_collection_interval)
+        finally:
+            store.write_chunk(self._market_data_snapshot_buffer.take())
+
+    def _add_market_data_snapshots(self):
+        buffer = self._market_data_snapshot_buffer
+        store = self._market_data_snapshot_store
+        timestamp = self.db_timestamp
+        for market in self._markets:
+            exchange = market.display_name
+            for trading_pair in market.trading_pairs:
+                if buffer.is_full:
+                    # Markets added after the buffer was created or late flush, the snapshots are written ahead of time
+                    store.write_chunk(buffer.take())
+                bids, asks = market.get_order_book(trading_pair).top_levels(buffer.depth)
+                buffer.append(timestamp=timestamp,
+                              pair_index=store.pair_index(exchange, trading_pair),
+                              mid_price=float(market.get_price_by_type(trading_pair, PriceType.MidPrice)),
+                              best_bid=float(market.get_price_by_type(trading_pair, PriceType.BestBid)),
+                              best_ask=float(market.get_price_by_type(trading_pair, PriceType.BestAsk)),
+                              bids=bids,
+                              asks=asks)
+
     @property
     def sql_manager(self) -> SQLConnectionManager:
         return self._sql_manager
@@ -176,6 +268,27 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_behind(self) -> bool:
+        return self._writer is not None and self._writer.running
+
+    def write_behind_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        :return: the backpressure metrics of the write-behind writer, None if the write-behind mode is disabled
+        """
+        if self._writer is None:
+            return None
+        return {"queue_depth": self._writer.queue_depth, **self._writer.stats.to_dict()}
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until all the market events received so far are written to the database.
+        :return: False if the timeout expired before
+        """
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout)
+
     def start(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
@@ -219,6 +332,11 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        if self._writer is not None:
+            self._writer.stop()
+        for csv_writer in self._csv_writers.values():
+            csv_writer.close()
+        self._csv_writers.clear()
 
     def store_or_update_executor(self, executor):
         with self._sql_manager.get_new_session() as session:
@@ -334,19 +452,57 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
+        self._save_market_states_snapshot(config_file_path=config_file_path,
+                                          market_name=market.display_name,
+                                          saved_state=market.tracking_states,
+                                          timestamp=self.db_timestamp,
+                                          session=session)
 
+    @staticmethod
+    def _save_market_states_snapshot(config_file_path: str,
+                                     market_name: str,
+                                     saved_state: Dict[str, Any],
+                                     timestamp: int,
+                                     session: Session):
+        market_states: Optional[MarketState] = (session
+                                                .query(MarketState)
+                                                .filter(MarketState.config_file_path == config_file_path,
+                                                        MarketState.market == market_name)
+                                                .one_or_none())
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = saved_state
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=saved_state)
             session.add(market_states)
 
+    def _record(self, market: ConnectorBase, write: Callable[[Session], bool], save_market_states: bool = True):
+        """
+        Persists the records of a market event, in a transaction of its own or through the write-behind writer.
+        :param write: adds the event records to the session, returns whether the market states should be saved with them
+        :param save_market_states: whether to save the market tracking states with the event records. In write-behind
+            mode they are captured when the event is received, and only the latest states of each market are written
+            in each batch
+        """
+        if self.write_behind:
+            self._writer.enqueue(write)
+            if save_market_states:
+                self._writer.enqueue(partial(self._save_market_states_snapshot,
+                                             self._config_file_path,
+                                             market.display_name,
+                                             market.tracking_states,
+                                             self.db_timestamp),
+                                     coalesce_key=(MarketState, self._config_file_path, market.display_name))
+            return
+
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                if write(session) and save_market_states:
+                    self.save_market_states(self._config_file_path, market, session=session)
+
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
         with self._sql_manager.get_new_session() as session:
             market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
@@ -376,32 +532,35 @@ class MarketsRecorder:
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        market_name: str = market.display_name
+
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+
+        def write(session: Session) -> bool:
+            order_record: Order = Order(id=evt.order_id,
+                                        config_file_path=self._config_file_path,
+                                        strategy=self._strategy_name,
+                                        market=market_name,
+                                        symbol=evt.trading_pair,
+                                        base_asset=base_asset,
+                                        quote_asset=quote_asset,
+                                        creation_timestamp=timestamp,
+                                        order_type=evt.type.name,
+                                        amount=Decimal(evt.amount),
+                                        leverage=evt.leverage if evt.leverage else 1,
+                                        price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                        position=evt.position if evt.position else PositionAction.NIL.value,
+                                        last_status=event_type.name,
+                                        last_update_timestamp=timestamp,
+                                        exchange_order_id=evt.exchange_order_id)
+            order_status: OrderStatus = OrderStatus(order=order_record,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_record)
+            session.add(order_status)
+            return True
+
+        self._record(market, write)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -415,57 +574,60 @@ class MarketsRecorder:
         timestamp: int = int(evt.timestamp * 1e3) if evt.timestamp is not None else self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                try:
-                    fee_in_quote = evt.trade_fee.fee_amount_in_token(
-                        trading_pair=evt.trading_pair,
-                        price=evt.price,
-                        order_amount=evt.amount,
-                        token=quote_asset,
-                        exchange=market
-                    )
-                except Exception as e:
-                    self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
-                    fee_in_quote = 0
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=fee_in_quote,
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
+        market_name: str = market.display_name
+
+        try:
+            fee_in_quote = evt.trade_fee.fee_amount_in_token(
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                order_amount=evt.amount,
+                token=quote_asset,
+                exchange=market
+            )
+        except Exception as e:
+            self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
+            fee_in_quote = 0
+
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+
+        def write(session: Session) -> bool:
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+
+            # Order status and trade fill record should be added even if the order record is not found, because it's
+            # possible for fill event to come in before the order created event for market orders.
+            order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            trade_fill_record: TradeFill = TradeFill(
+                config_file_path=self.config_file_path,
+                strategy=self.strategy_name,
+                market=market_name,
+                symbol=evt.trading_pair,
+                base_asset=base_asset,
+                quote_asset=quote_asset,
+                timestamp=timestamp,
+                order_id=order_id,
+                trade_type=evt.trade_type.name,
+                order_type=evt.order_type.name,
+                price=evt.price,
+                amount=evt.amount,
+                leverage=evt.leverage if evt.leverage else 1,
+                trade_fee=evt.trade_fee.to_json(),
+                trade_fee_in_quote=fee_in_quote,
+                exchange_trade_id=evt.exchange_trade_id,
+                position=evt.position if evt.position else PositionAction.NIL.value,
+            )
+            session.add(order_status)
+            session.add(trade_fill_record)
+            return True
+
+        self._record(market, write)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -476,25 +638,23 @@ class MarketsRecorder:
             return
 
         timestamp: float = evt.timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
-
-    @staticmethod
-    def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
+        market_name: str = market.display_name
+
+        def write(session: Session) -> bool:
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=self.config_file_path,
+                                                                        market=market_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+            return False
+
+        self._record(market, write, save_market_states=False)
 
     def append_to_csv(self, trade: TradeFill):
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
@@ -510,14 +670,17 @@ class MarketsRecorder:
         field_names += ("age",)
         field_data += (age,)
 
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
+        self._trades_csv_writer(csv_path, field_names).write_row(field_data)
 
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+    def _trades_csv_writer(self, csv_path: str, header: tuple) -> TradesCsvWriter:
+        # The header of the file is only validated when its writer is opened
+        csv_writer = self._csv_writers.get(csv_path)
+        if csv_writer is None or csv_writer.header != header:
+            if csv_writer is not None:
+                csv_writer.close()
+            csv_writer = TradesCsvWriter(csv_path=csv_path, header=header)
+            self._csv_writers[csv_path] = csv_writer
+        return csv_writer
 
     def _update_order_status(self,
                              event_tag: int,
@@ -535,18 +698,19 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        def write(session: Session) -> bool:
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+            return order_record is not None
+
+        self._record(market, write)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -582,15 +746,16 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        def write(session: Session) -> bool:
+            rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                                 timestamp=timestamp,
+                                                                 tx_hash=evt.exchange_order_id,
+                                                                 token_id=evt.token_id,
+                                                                 trade_fee=evt.trade_fee.to_json())
+            session.add(rp_update)
+            return True
+
+        self._record(connector, write)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -600,17 +765,18 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        def write(session: Session) -> bool:
+            rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                             strategy=self._strategy_name,
+                                                                             token_id=evt.token_id,
+                                                                             token_0=evt.token_0,
+                                                                             token_1=evt.token_1,
+                                                                             claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                             claimed_fee_1=Decimal(evt.claimed_fee_1))
+            session.add(rp_fees)
+            return True
+
+        self._record(connector, write)
 
     @staticmethod
     async def _sleep(delay):
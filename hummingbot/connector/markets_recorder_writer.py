@@ -0,0 +1,196 @@
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+# A database operation adding or updating records in the session it receives
+WriteOperation = Callable[[Session], Any]
+
+_STOP = object()
+
+
+class MarketsRecorderWriterStats:
+    """
+    Backpressure metrics of the write-behind writer.
+    """
+
+    def __init__(self):
+        self.enqueued: int = 0
+        self.written: int = 0
+        self.coalesced: int = 0
+        self.batches: int = 0
+        self.errors: int = 0
+        self.max_queue_depth: int = 0
+        self.full_queue_waits: int = 0
+        self.blocked_time: float = 0.0
+        self.max_batch_size: int = 0
+        self.batch_durations: LatencyHistogram = LatencyHistogram()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "coalesced": self.coalesced,
+            "batches": self.batches,
+            "errors": self.errors,
+            "max_queue_depth": self.max_queue_depth,
+            "full_queue_waits": self.full_queue_waits,
+            "blocked_time": self.blocked_time,
+            "max_batch_size": self.max_batch_size,
+            "batch_duration": self.batch_durations.to_dict(),
+        }
+
+
+class MarketsRecorderWriter:
+    """
+    Write-behind persistence for the markets recorder. Operations are enqueued by the event loop thread and applied
+    by a dedicated writer thread, which groups all the operations enqueued during a flush interval in a single
+    transaction. If the transaction fails, the operations of the batch are retried one by one so that a single bad
+    record does not discard the others.
+    The queue is bounded: when it is full, enqueuing blocks the caller until the writer catches up.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, sql: SQLConnectionManager, flush_interval: float = 0.05, max_queue_size: int = 10000):
+        """
+        :param sql: the connection manager used to open the writer sessions
+        :param flush_interval: seconds to wait for more operations before writing a batch
+        :param max_queue_size: maximum number of pending operations
+        """
+        self._sql_manager = sql
+        self._flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._flush_requested = threading.Event()
+        self._done_condition = threading.Condition()
+        self._enqueued_count = 0
+        self._processed_count = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stats = MarketsRecorderWriterStats()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def stats(self) -> MarketsRecorderWriterStats:
+        return self._stats
+
+    def start(self):
+        if self.running:
+            return
+        self._thread = threading.Thread(target=self._run, name="MarketsRecorderWriter", daemon=True)
+        self._thread.start()
+
+    def enqueue(self, operation: WriteOperation, coalesce_key: Optional[Hashable] = None):
+        """
+        Enqueues an operation to be applied by the writer thread.
+        :param operation: the operation to apply
+        :param coalesce_key: operations sharing a key in the same batch replace each other, only the last one enqueued
+            is applied
+        """
+        with self._done_condition:
+            self._enqueued_count += 1
+        item = (operation, coalesce_key)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self._stats.full_queue_waits += 1
+            start = time.perf_counter()
+            self._queue.put(item)
+            self._stats.blocked_time += time.perf_counter() - start
+        self._stats.enqueued += 1
+        self._stats.max_queue_depth = max(self._stats.max_queue_depth, self._queue.qsize())
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until all the operations enqueued so far are written.
+        :return: False if the timeout expired before
+        """
+        with self._done_condition:
+            target = self._enqueued_count
+            self._flush_requested.set()
+            return self._done_condition.wait_for(lambda: self._processed_count >= target or not self.running,
+                                                 timeout=timeout)
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Writes all the pending operations and stops the writer thread.
+        """
+        if not self.running:
+            return
+        self._queue.put(_STOP)
+        self._flush_requested.set()
+        self._thread.join(timeout)
+
+    def _run(self):
+        stopped = False
+        while not stopped:
+            item = self._queue.get()
+            if item is not _STOP:
+                self._flush_requested.wait(self._flush_interval)
+            self._flush_requested.clear()
+            items = [item]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopped = _STOP in items
+            operations = [queued for queued in items if queued is not _STOP]
+            if operations:
+                self._write_batch(operations)
+                with self._done_condition:
+                    self._processed_count += len(operations)
+                    self._done_condition.notify_all()
+        with self._done_condition:
+            self._done_condition.notify_all()
+
+    def _write_batch(self, items: List[Tuple[WriteOperation, Optional[Hashable]]]):
+        last_positions: Dict[Hashable, int] = {
+            coalesce_key: position for position, (_, coalesce_key) in enumerate(items) if coalesce_key is not None
+        }
+        operations = [operation for position, (operation, coalesce_key) in enumerate(items)
+                      if coalesce_key is None or last_positions[coalesce_key] == position]
+        self._stats.coalesced += len(items) - len(operations)
+
+        start = time.perf_counter()
+        try:
+            self._apply(operations)
+            self._stats.written += len(operations)
+        except Exception:
+            self.logger().warning(f"Error writing a batch of {len(operations)} records, retrying them one by one.",
+                                  exc_info=True)
+            for operation in operations:
+                try:
+                    self._apply([operation])
+                    self._stats.written += 1
+                except Exception:
+                    self._stats.errors += 1
+                    self.logger().error("Error writing a record to the database. The record is discarded.",
+                                        exc_info=True)
+        self._stats.batches += 1
+        self._stats.max_batch_size = max(self._stats.max_batch_size, len(operations))
+        self._stats.batch_durations.observe(time.perf_counter() - start)
+
+    def _apply(self, operations: List[WriteOperation]):
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for operation in operations:
+                    operation(session)
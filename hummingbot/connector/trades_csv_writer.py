@@ -0,0 +1,139 @@
+import asyncio
+import csv
+import os
+import time
+from datetime import datetime, timezone
+from shutil import move
+from typing import IO, Any, Optional, Sequence, Tuple
+
+
+class TradesCsvWriter:
+    """
+    Append-only CSV file writer. The header of an existing file is validated once, when the file is opened: if it does
+    not match, the file is moved aside and a new one is started. Rows are written through a buffered file and flushed
+    at most every flush_interval seconds (and when the writer is closed). When used from the event loop, a flush is
+    scheduled for the buffered rows, so that they are written even if no other row follows.
+    The file is rotated when it grows beyond max_file_size bytes or when the UTC date changes: the current file is
+    renamed with a timestamp suffix and a new one is started at the same path.
+    """
+
+    def __init__(self,
+                 csv_path: str,
+                 header: Sequence[str],
+                 flush_interval: float = 5.0,
+                 max_file_size: Optional[int] = 100 * 1024 * 1024,
+                 rotate_daily: bool = False):
+        """
+        :param csv_path: path of the CSV file
+        :param header: names of the columns
+        :param flush_interval: maximum seconds between the moment a row is written and the moment it's flushed
+        :param max_file_size: size in bytes above which the file is rotated, None to disable
+        :param rotate_daily: whether to rotate the file when the UTC date changes
+        """
+        self._csv_path = csv_path
+        self._header: Tuple[str, ...] = tuple(header)
+        self._flush_interval = flush_interval
+        self._max_file_size = max_file_size
+        self._rotate_daily = rotate_daily
+        self._file: Optional[IO[str]] = None
+        self._writer: Optional[Any] = None
+        self._opened_date: Optional[str] = None
+        self._last_flush_time: float = 0.0
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def csv_path(self) -> str:
+        return self._csv_path
+
+    @property
+    def header(self) -> Tuple[str, ...]:
+        return self._header
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    def open(self):
+        if self.is_open:
+            return
+        if os.path.exists(self._csv_path) and not self._file_matches_header():
+            self._move_aside("_old_")
+        new_file = not os.path.exists(self._csv_path) or os.path.getsize(self._csv_path) == 0
+        self._file = open(self._csv_path, mode="a", newline="")
+        self._writer = csv.writer(self._file)
+        if new_file:
+            self._writer.writerow(self._header)
+            self._file.flush()
+        self._opened_date = self._utc_date()
+        self._last_flush_time = time.time()
+
+    def write_row(self, row: Sequence[Any]):
+        """
+        Appends a row to the file, opening or rotating the file first if needed.
+        """
+        if not self.is_open:
+            self.open()
+        elif self._should_rotate():
+            self.rotate()
+        self._writer.writerow(row)
+        time_to_flush = self._last_flush_time + self._flush_interval - time.time()
+        if time_to_flush <= 0:
+            self.flush()
+        elif self._flush_timer is None:
+            self._schedule_flush(time_to_flush)
+
+    def flush(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._file is not None:
+            self._file.flush()
+        self._last_flush_time = time.time()
+
+    def rotate(self):
+        """
+        Renames the current file with a timestamp suffix and starts a new one.
+        """
+        self.close()
+        if os.path.exists(self._csv_path):
+            self._move_aside("_")
+        self.open()
+
+    def close(self):
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+    def _schedule_flush(self, delay: float):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Without a running event loop the rows are flushed by the next write after the interval, or on close
+            return
+        self._flush_timer = loop.call_later(delay, self.flush)
+
+    def _should_rotate(self) -> bool:
+        if self._max_file_size is not None and self._file.tell() >= self._max_file_size:
+            return True
+        return self._rotate_daily and self._utc_date() != self._opened_date
+
+    def _file_matches_header(self) -> bool:
+        with open(self._csv_path, newline="") as csv_file:
+            first_row = next(csv.reader(csv_file), None)
+        return first_row is None or tuple(first_row) == self._header
+
+    def _move_aside(self, infix: str):
+        suffix = datetime.now(tz=timezone.utc).strftime("%Y%m%d-%H%M%S")
+        base_path = self._csv_path[:-4] if self._csv_path.endswith(".csv") else self._csv_path
+        target_path = f"{base_path}{infix}{suffix}.csv"
+        counter = 1
+        while os.path.exists(target_path):
+            target_path = f"{base_path}{infix}{suffix}_{counter}.csv"
+            counter += 1
+        move(self._csv_path, target_path)
+
+    @staticmethod
+    def _utc_date() -> str:
+        return datetime.now(tz=timezone.utc).strftime("%Y%m%d")
@@ -3,13 +3,15 @@ import logging
 import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
 MAX_CAPACITY_REACHED_WARNING_INTERVAL = 30.0
+MIN_WAKE_UP_DELAY = 0.001
 
 
 class AsyncRequestContextBase(ABC):
@@ -34,6 +36,8 @@ class AsyncRequestContextBase(ABC):
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 waiter_queue: Optional[asyncio.Lock] = None,
+                 wait_time_histogram: Optional[LatencyHistogram] = None,
                  ):
         """
         Asynchronous context associated with each API request.
@@ -42,6 +46,10 @@ class AsyncRequestContextBase(ABC):
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
         :param retry_interval: Time between each limit check
+        :param waiter_queue: Optional lock shared by the requests of the same limit. When provided, waiting requests
+            are served in FIFO order and only the first one in the queue checks for capacity, sleeping until the
+            oldest blocking task log expires instead of polling every retry_interval
+        :param wait_time_histogram: Optional histogram where the time spent waiting for capacity is recorded
         """
         self._task_logs: List[TaskLog] = task_logs
         self._rate_limit: RateLimit = rate_limit
@@ -49,6 +57,8 @@ class AsyncRequestContextBase(ABC):
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._waiter_queue: Optional[asyncio.Lock] = waiter_queue
+        self._wait_time_histogram: Optional[LatencyHistogram] = wait_time_histogram
 
     def flush(self):
         """
@@ -65,7 +75,25 @@ class AsyncRequestContextBase(ABC):
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    def next_capacity_timestamp(self) -> Optional[float]:
+        """
+        Estimates when capacity can be available for this request, based on the expiration of the oldest task logs
+        blocking it. Used by the waiter queue mode to sleep exactly until then.
+        :return: the estimated timestamp, or None if it can't be estimated (the retry interval is used instead)
+        """
+        return None
+
     async def acquire(self):
+        started = time.perf_counter()
+        if self._waiter_queue is None:
+            await self._acquire_polling()
+        else:
+            async with self._waiter_queue:
+                await self._acquire_when_capacity_is_freed()
+        if self._wait_time_histogram is not None:
+            self._wait_time_histogram.observe(time.perf_counter() - started)
+
+    async def _acquire_polling(self):
         while True:
             async with self._lock:
                 self.flush()
@@ -74,18 +102,39 @@ class AsyncRequestContextBase(ABC):
                     break
             await asyncio.sleep(self._retry_interval)
         async with self._lock:
-            now = time.time()
-            # Each related limit is represented as it own individual TaskLog
-
-            # Log the acquired rate limit into the tasks log
-            new_logs = [
-                TaskLog(timestamp=now, rate_limit=self._rate_limit, weight=self._rate_limit.weight)
-            ] + [
-                # Log its related limits into the tasks log as individual tasks
-                TaskLog(timestamp=now, rate_limit=limit, weight=weight)
-                for limit, weight in self._related_limits
-            ]
-            self._task_logs.extend(new_logs)
+            self.log_task(timestamp=time.time())
+
+    async def _acquire_when_capacity_is_freed(self):
+        while True:
+            async with self._lock:
+                self.flush()
+
+                if self.within_capacity():
+                    self.log_task(timestamp=time.time())
+                    return
+                wake_up_timestamp = self.next_capacity_timestamp()
+            if wake_up_timestamp is None:
+                delay = self._retry_interval
+            else:
+                delay = max(MIN_WAKE_UP_DELAY, wake_up_timestamp - time.time())
+            await asyncio.sleep(delay)
+
+    def log_task(self, timestamp: float):
+        """
+        Registers the capacity consumed by this request (and its related limits) at the given timestamp
+        :param timestamp: the time at which the capacity was acquired
+        """
+        # Each related limit is represented as it own individual TaskLog
+
+        # Log the acquired rate limit into the tasks log
+        new_logs = [
+            TaskLog(timestamp=timestamp, rate_limit=self._rate_limit, weight=self._rate_limit.weight)
+        ] + [
+            # Log its related limits into the tasks log as individual tasks
+            TaskLog(timestamp=timestamp, rate_limit=limit, weight=weight)
+            for limit, weight in self._related_limits
+        ]
+        self._task_logs.extend(new_logs)
 
     async def __aenter__(self):
         await self.acquire()
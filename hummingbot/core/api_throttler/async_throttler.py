@@ -1,7 +1,7 @@
 import collections
 import time
 from decimal import Decimal
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import (
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
@@ -47,6 +47,32 @@ class AsyncRequestContext(AsyncRequestContextBase):
                     return False
         return True
 
+    def next_capacity_timestamp(self) -> Optional[float]:
+        """
+        Finds, for every limit without capacity, when its oldest task log expires. All of them have to expire before
+        the task can be executed.
+        :return: the estimated timestamp, or None if there is no blocking task log
+        """
+        if self._rate_limit is None:
+            return None
+        list_of_limits: List[Tuple[RateLimit, int]] = [(self._rate_limit,
+                                                        self._rate_limit.weight)] + self._related_limits
+        oldest_expiration_per_limit = {}
+        capacity_used_per_limit = collections.defaultdict(int)
+        for task in self._task_logs:
+            limit_id = task.rate_limit.limit_id
+            expiration = task.timestamp + task.rate_limit.time_interval * (1 + self._safety_margin_pct)
+            capacity_used_per_limit[limit_id] += task.weight
+            if expiration < oldest_expiration_per_limit.get(limit_id, float("inf")):
+                oldest_expiration_per_limit[limit_id] = expiration
+        blocking_expirations = [
+            oldest_expiration_per_limit[rate_limit.limit_id]
+            for rate_limit, weight in list_of_limits
+            if (capacity_used_per_limit[rate_limit.limit_id] + weight > rate_limit.limit
+                and rate_limit.limit_id in oldest_expiration_per_limit)
+        ]
+        return max(blocking_expirations) if blocking_expirations else None
+
     def _time(self):
         return time.time()
 
@@ -78,4 +104,6 @@ class AsyncThrottler(AsyncThrottlerBase):
             lock=self._lock,
             safety_margin_pct=self._safety_margin_pct,
             retry_interval=self._retry_interval,
+            waiter_queue=self._waiter_queue(rate_limit),
+            wait_time_histogram=self._wait_time_histogram(rate_limit),
         )
@@ -2,12 +2,14 @@ import asyncio
 import copy
 import logging
 import math
+import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
 from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
 from hummingbot.logger.logger import HummingbotLogger
 
 
@@ -30,7 +32,8 @@ class AsyncThrottlerBase(ABC):
                  rate_limits: List[RateLimit],
                  retry_interval: float = 0.1,
                  safety_margin_pct: Optional[float] = 0.05,  # An extra safety margin, in percentage.
-                 limits_share_percentage: Optional[Decimal] = None
+                 limits_share_percentage: Optional[Decimal] = None,
+                 use_waiter_queue: bool = False,
                  ):
         """
         :param rate_limits: List of RateLimit(s).
@@ -39,6 +42,8 @@ class AsyncThrottlerBase(ABC):
             calls are within the limit.
         :param limits_share_percentage: Percentage of the limits to be used by this instance (important when multiple
             bots operate with the same account)
+        :param use_waiter_queue: If True, requests waiting for capacity are queued per limit and served in FIFO order,
+            sleeping until the blocking task logs expire instead of polling every retry_interval
         """
         # If configured, users can define the percentage of rate limits to allocate to the throttler.
         share_percentage = limits_share_percentage or Decimal("100")
@@ -56,6 +61,13 @@ class AsyncThrottlerBase(ABC):
         # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
         self._lock = asyncio.Lock()
 
+        # FIFO queues (one per limit_id) used to serve the waiting requests when use_waiter_queue is enabled
+        self._use_waiter_queue: bool = use_waiter_queue
+        self._waiter_queues: Dict[str, asyncio.Lock] = {}
+
+        # Time spent waiting for capacity, per limit_id
+        self._wait_time_histograms: Dict[str, LatencyHistogram] = {}
+
     def set_rate_limits(self, rate_limits: List[RateLimit]):
         # Rate Limit Definitions
         self._rate_limits: List[RateLimit] = copy.deepcopy(rate_limits)
@@ -85,6 +97,54 @@ class AsyncThrottlerBase(ABC):
 #
         return rate_limit, related_limits
 
+    def available_capacity(self, limit_id: str) -> Optional[int]:
+        """
+        Number of tasks of a limit that can be executed now without waiting for capacity, considering its linked limits
+        :param limit_id: the limit_id associated with the API request
+        :return: the number of tasks, None if the limit is not defined
+        """
+        rate_limit, related_limits = self.get_related_limits(limit_id=limit_id)
+        if rate_limit is None:
+            return None
+        now = time.time()
+        capacity = None
+        for limit, weight in [(rate_limit, rate_limit.weight)] + related_limits:
+            if weight <= 0:
+                continue
+            tasks = max(0, int((limit.limit - self._capacity_used(limit, now)) // weight))
+            capacity = tasks if capacity is None else min(capacity, tasks)
+        return capacity
+
+    def wait_time_histograms(self) -> Dict[str, LatencyHistogram]:
+        """
+        :return: the histograms of time spent waiting for capacity (in seconds), per limit_id
+        """
+        return dict(self._wait_time_histograms)
+
+    def _waiter_queue(self, rate_limit: Optional[RateLimit]) -> Optional[asyncio.Lock]:
+        if not self._use_waiter_queue or rate_limit is None:
+            return None
+        queue = self._waiter_queues.get(rate_limit.limit_id)
+        if queue is None:
+            queue = asyncio.Lock()
+            self._waiter_queues[rate_limit.limit_id] = queue
+        return queue
+
+    def _wait_time_histogram(self, rate_limit: Optional[RateLimit]) -> Optional[LatencyHistogram]:
+        if rate_limit is None:
+            return None
+        histogram = self._wait_time_histograms.get(rate_limit.limit_id)
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self._wait_time_histograms[rate_limit.limit_id] = histogram
+        return histogram
+
+    def _capacity_used(self, rate_limit: RateLimit, now: float) -> int:
+        return sum(task.weight
+                   for task in self._task_logs
+                   if (task.rate_limit.limit_id == rate_limit.limit_id
+                       and now - task.timestamp <= task.rate_limit.time_interval * (1 + self._safety_margin_pct)))
+
     @abstractmethod
     def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
         raise NotImplementedError
@@ -0,0 +1,192 @@
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+    AsyncRequestContextBase,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+
+
+class SlidingWindow:
+    """
+    Keeps the capacity consumed for a single RateLimit within its time window.
+    Entries are stored in insertion (and therefore timestamp) order, so expired entries are always at the left end of
+    the buffer and the running sum of weights can be maintained in amortized O(1) per admission and expiry.
+    """
+
+    __slots__ = ("rate_limit", "capacity_used", "_expirations", "_weights", "_safety_margin_pct", "_expiration_interval")
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self.rate_limit: RateLimit = rate_limit
+        self.capacity_used: int = 0
+        # Timestamps at which each entry stops consuming capacity
+        self._expirations: Deque[float] = deque()
+        self._weights: Deque[int] = deque()
+        self._safety_margin_pct: float = safety_margin_pct
+        self._expiration_interval: float = float(rate_limit.time_interval) * (1 + safety_margin_pct)
+
+    def __len__(self) -> int:
+        return len(self._expirations)
+
+    def update_rate_limit(self, rate_limit: RateLimit):
+        self.rate_limit = rate_limit
+        self._expiration_interval = float(rate_limit.time_interval) * (1 + self._safety_margin_pct)
+
+    def expire(self, now: float):
+        """
+        Removes the entries that have passed the rate limit period (including the safety margin)
+        :param now: current timestamp
+        """
+        expirations = self._expirations
+        while expirations and now > expirations[0]:
+            expirations.popleft()
+            self.capacity_used -= self._weights.popleft()
+
+    def record(self, timestamp: float, weight: int):
+        self._expirations.append(timestamp + self._expiration_interval)
+        self._weights.append(weight)
+        self.capacity_used += weight
+
+    def has_capacity_for(self, weight: int) -> bool:
+        return self.capacity_used + weight <= self.rate_limit.limit
+
+    def next_expiration_timestamp(self) -> Optional[float]:
+        """
+        :return: the timestamp at which the oldest entry in the window stops consuming capacity, or None if empty
+        """
+        return self._expirations[0] if self._expirations else None
+
+
+class SlidingWindowRequestContext(AsyncRequestContextBase):
+    """
+    An async context class ('async with' syntax) that checks for rate limit and wait for the capacity if needed.
+    Instead of scanning a shared list of task logs it checks the running capacity kept by the SlidingWindow of each
+    rate limit involved in the request.
+    """
+
+    def __init__(self,
+                 windows: List[Tuple[SlidingWindow, int]],
+                 rate_limit: RateLimit,
+                 related_limits: List[Tuple[RateLimit, int]],
+                 lock: asyncio.Lock,
+                 safety_margin_pct: float,
+                 retry_interval: float = 0.1,
+                 waiter_queue: Optional[asyncio.Lock] = None,
+                 wait_time_histogram: Optional[LatencyHistogram] = None,
+                 ):
+        """
+        :param windows: the SlidingWindow of every rate limit consumed by the request, with the weight to consume
+        """
+        super().__init__(
+            task_logs=[],
+            rate_limit=rate_limit,
+            related_limits=related_limits,
+            lock=lock,
+            safety_margin_pct=safety_margin_pct,
+            retry_interval=retry_interval,
+            waiter_queue=waiter_queue,
+            wait_time_histogram=wait_time_histogram,
+        )
+        self._windows: List[Tuple[SlidingWindow, int]] = windows
+
+    def flush(self):
+        """
+        Remove the entries that have passed rate limit periods, only for the limits involved in this request
+        """
+        now = self._time()
+        for window, _ in self._windows:
+            window.expire(now)
+
+    def within_capacity(self) -> bool:
+        """
+        Checks if an additional task within the defined RateLimit(s). Logs a warning message if the limit is about to
+        be reached.
+        :return: True if it is within capacity to add a new task
+        """
+        for window, weight in self._windows:
+            if not window.has_capacity_for(weight):
+                now = self._time()
+                if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+                    rate_limit = window.rate_limit
+                    msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                          f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                          f"is {window.capacity_used} in the last " \
+                          f"{rate_limit.time_interval} seconds"
+                    self.logger().notify(msg)
+                    AsyncRequestContextBase._last_max_cap_warning_ts = now
+                return False
+        return True
+
+    def next_capacity_timestamp(self) -> Optional[float]:
+        """
+        :return: the timestamp at which the oldest entry of every window without capacity has expired, or None if
+            there is no blocking window
+        """
+        blocking_expirations = [
+            window.next_expiration_timestamp()
+            for window, weight in self._windows
+            if not window.has_capacity_for(weight) and len(window) > 0
+        ]
+        return max(blocking_expirations) if blocking_expirations else None
+
+    def log_task(self, timestamp: float):
+        for window, weight in self._windows:
+            window.record(timestamp=timestamp, weight=weight)
+
+    def _time(self):
+        return time.time()
+
+
+class SlidingWindowThrottler(AsyncThrottlerBase):
+    """
+    Drop-in alternative to AsyncThrottler that keeps one SlidingWindow per limit_id, with the running weight used in
+    the window. Capacity checks and expiration of old entries cost amortized O(1) per limit involved in a request,
+    regardless of the number of requests logged for other limits.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._windows: Dict[str, SlidingWindow] = {}
+        super().__init__(*args, **kwargs)
+
+    def execute_task(self, limit_id: str) -> SlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        windows = []
+        if rate_limit is not None:
+            windows.append((self._window_for(rate_limit), rate_limit.weight))
+            windows.extend((self._window_for(limit), weight) for limit, weight in related_rate_limits)
+        return SlidingWindowRequestContext(
+            windows=windows,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            lock=self._lock,
+            safety_margin_pct=self._safety_margin_pct,
+            retry_interval=self._retry_interval,
+            waiter_queue=self._waiter_queue(rate_limit),
+            wait_time_histogram=self._wait_time_histogram(rate_limit),
+        )
+
+    def _capacity_used(self, rate_limit: RateLimit, now: float) -> int:
+        window = self._window_for(rate_limit)
+        window.expire(now)
+        return window.capacity_used
+
+    def _window_for(self, rate_limit: RateLimit) -> SlidingWindow:
+        window = self._windows.get(rate_limit.limit_id)
+        if window is None:
+            window = SlidingWindow(rate_limit=rate_limit, safety_margin_pct=self._safety_margin_pct)
+            self._windows[rate_limit.limit_id] = window
+        elif window.rate_limit is not rate_limit:
+            # The rate limits have been redefined with set_rate_limits. Keep the consumed capacity
+            window.update_rate_limit(rate_limit)
+        return window
@@ -10,3 +10,11 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        dict _iterator_schedules
+        object _tick_stats
+        long long _tick_counter
+        double _last_overrun_warning_timestamp
+        bint _fast_forward
+        long long _fast_forwarded_ticks
+
+    cdef double c_next_backtest_tick(self, double end_timestamp)
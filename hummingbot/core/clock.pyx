@@ -3,14 +3,19 @@
 import asyncio
 import logging
 import time
-from typing import List
+
+from libc.math cimport INFINITY, ceil, isnan
+from typing import Dict, List
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.clock_tick_stats import ClockTickStats, IteratorSchedule
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
+DEFAULT_ITERATOR_SCHEDULE = IteratorSchedule()
+TICK_OVERRUN_WARNING_INTERVAL = 60.0
 
 
 cdef class Clock:
@@ -21,12 +26,15 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0,
+                 fast_forward: bool = False):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param fast_forward: (back testing mode only) jump directly to the earliest wake up timestamp reported by the
+        child iterators instead of ticking every tick_size. Iterators not reporting it are ticked on every tick
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +44,12 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._iterator_schedules = {}
+        self._tick_stats = ClockTickStats(tick_size=tick_size)
+        self._tick_counter = 0
+        self._last_overrun_warning_timestamp = 0
+        self._fast_forward = fast_forward
+        self._fast_forwarded_ticks = 0
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +71,28 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def fast_forward(self) -> bool:
+        return self._fast_forward
+
+    @property
+    def fast_forwarded_ticks(self) -> int:
+        """
+        Number of backtesting ticks skipped by the fast-forward mode
+        """
+        return self._fast_forwarded_ticks
+
+    @property
+    def tick_stats(self) -> ClockTickStats:
+        return self._tick_stats
+
+    def get_tick_stats(self) -> Dict:
+        """
+        :return: the timing of the real time ticks (lag behind the wall clock, duration, overruns and skipped ticks)
+        and the tick durations of each child iterator
+        """
+        return self._tick_stats.to_dict()
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -69,18 +105,39 @@ cdef class Clock:
                 (<TimeIterator>iterator).c_stop(self)
         self._current_context = None
 
-    def add_iterator(self, iterator: TimeIterator):
+    def add_iterator(self, iterator: TimeIterator, tick_every: int = 1, deferred: bool = False):
+        """
+        :param iterator: the child iterator to tick
+        :param tick_every: (real time mode only) tick the iterator only on every Nth clock tick
+        :param deferred: (real time mode only) tick the iterator off the critical path, after the rest of iterators
+        """
         if self._current_context is not None:
             self._current_context.append(iterator)
         if self._started:
             (<TimeIterator>iterator).c_start(self, self._current_tick)
         self._child_iterators.append(iterator)
+        self.set_iterator_schedule(iterator, tick_every=tick_every, deferred=deferred)
 
     def remove_iterator(self, iterator: TimeIterator):
         if self._current_context is not None and iterator in self._current_context:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self._iterator_schedules.pop(iterator, None)
+        self._tick_stats.remove_iterator(iterator)
+
+    def set_iterator_schedule(self, iterator: TimeIterator, tick_every: int = 1, deferred: bool = False):
+        """
+        Changes how a child iterator is ticked in real time mode, e.g. to run slow iterators on every Nth tick or off
+        the critical path so the rest of iterators are ticked on schedule.
+        """
+        if tick_every < 1:
+            raise ValueError(f"tick_every must be a positive integer ({tick_every} received).")
+        schedule = IteratorSchedule(tick_every=tick_every, deferred=deferred)
+        if schedule == DEFAULT_ITERATOR_SCHEDULE:
+            self._iterator_schedules.pop(iterator, None)
+        else:
+            self._iterator_schedules[iterator] = schedule
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -110,23 +167,78 @@ cdef class Clock:
                 # Sleep until the next tick
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
                 await asyncio.sleep(next_tick_time - now)
+                skipped_ticks = max(0, <long long>round((next_tick_time - self._current_tick) / self._tick_size) - 1)
                 self._current_tick = next_tick_time
+                tick_start_time = time.time()
+                deferred_iterators = []
 
                 # Run through all the child iterators.
                 for ci in self._current_context:
                     child_iterator = ci
+                    schedule = self._iterator_schedules.get(child_iterator, DEFAULT_ITERATOR_SCHEDULE)
+                    if self._tick_counter % schedule.tick_every != 0:
+                        continue
+                    if schedule.deferred:
+                        deferred_iterators.append(child_iterator)
+                        continue
+                    iterator_stats = self._tick_stats.iterator_stats(child_iterator, schedule)
+                    iterator_start_time = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
                         self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
                         return
                     except Exception:
+                        iterator_stats.errors += 1
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    iterator_stats.record(time.perf_counter() - iterator_start_time)
+
+                now = time.time()
+                if self._tick_stats.record_tick(lag=tick_start_time - self._current_tick,
+                                                duration=now - tick_start_time,
+                                                skipped_ticks=skipped_ticks):
+                    self._log_tick_overrun(now)
+                if len(deferred_iterators) > 0:
+                    asyncio.get_event_loop().call_soon(self._tick_deferred_iterators,
+                                                       deferred_iterators,
+                                                       self._current_tick)
+                self._tick_counter += 1
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    def _tick_deferred_iterators(self, iterators: List[TimeIterator], timestamp: float):
+        cdef:
+            TimeIterator child_iterator
+
+        for ci in iterators:
+            child_iterator = ci
+            if self._current_context is None or child_iterator not in self._current_context:
+                continue
+            iterator_stats = self._tick_stats.iterator_stats(
+                child_iterator, self._iterator_schedules.get(child_iterator, DEFAULT_ITERATOR_SCHEDULE))
+            iterator_start_time = time.perf_counter()
+            try:
+                child_iterator.c_tick(timestamp)
+            except Exception:
+                iterator_stats.errors += 1
+                self.logger().error("Unexpected error running deferred clock tick.", exc_info=True)
+            iterator_stats.record(time.perf_counter() - iterator_start_time)
+
+    def _log_tick_overrun(self, now: float):
+        if now - self._last_overrun_warning_timestamp < TICK_OVERRUN_WARNING_INTERVAL:
+            return
+        self._last_overrun_warning_timestamp = now
+        slowest = ", ".join(f"{stats.name}: {stats.last_duration:.4f}s"
+                            for stats in self._tick_stats.slowest_iterators())
+        self.logger().warning(
+            f"Clock tick overran the tick size of {self._tick_size}s "
+            f"(lag: {self._tick_stats.last_lag:.4f}s, duration: {self._tick_stats.last_duration:.4f}s, "
+            f"overruns: {self._tick_stats.overruns}, skipped ticks: {self._tick_stats.skipped_ticks}). "
+            f"Slowest iterators: {slowest}."
+        )
+
     def backtest_til(self, timestamp: float):
         cdef TimeIterator child_iterator
 
@@ -138,7 +250,10 @@ cdef class Clock:
 
         try:
             while not (self._current_tick >= timestamp):
-                self._current_tick += self._tick_size
+                if self._fast_forward:
+                    self._current_tick = self.c_next_backtest_tick(timestamp)
+                else:
+                    self._current_tick += self._tick_size
                 for ci in self._child_iterators:
                     child_iterator = ci
                     try:
@@ -154,5 +269,28 @@ cdef class Clock:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    cdef double c_next_backtest_tick(self, double end_timestamp):
+        cdef:
+            TimeIterator child_iterator
+            double wake_up_timestamp = INFINITY
+            double iterator_wake_up_timestamp
+            double steps
+
+        for ci in self._child_iterators:
+            child_iterator = ci
+            iterator_wake_up_timestamp = child_iterator.c_next_wake_up_timestamp(self._current_tick)
+            if isnan(iterator_wake_up_timestamp):
+                return self._current_tick + self._tick_size
+            wake_up_timestamp = min(wake_up_timestamp, iterator_wake_up_timestamp)
+
+        # Never jump beyond the tick where the backtest ends
+        if not isnan(end_timestamp):
+            wake_up_timestamp = min(wake_up_timestamp, end_timestamp)
+        if wake_up_timestamp == INFINITY:
+            return self._current_tick + self._tick_size
+        steps = max(1.0, ceil((wake_up_timestamp - self._current_tick) / self._tick_size))
+        self._fast_forwarded_ticks += <long long>steps - 1
+        return self._current_tick + steps * self._tick_size
+
     def backtest(self):
         self.backtest_til(self._end_time)
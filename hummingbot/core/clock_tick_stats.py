@@ -0,0 +1,112 @@
+from typing import Any, Dict, List, NamedTuple
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+
+
+class IteratorSchedule(NamedTuple):
+    """
+    How the clock ticks a child iterator in real time mode.
+    tick_every: the iterator is only ticked on every Nth clock tick
+    deferred: the iterator is ticked off the critical path, in a separate event loop callback scheduled after the
+        other iterators have been ticked. Its duration is not accounted in the clock tick duration
+    """
+    tick_every: int = 1
+    deferred: bool = False
+
+
+class IteratorTickStats:
+    """
+    Timing of the ticks of a single child iterator.
+    """
+
+    __slots__ = ("name", "schedule", "ticks", "errors", "last_duration", "durations")
+
+    def __init__(self, name: str, schedule: IteratorSchedule):
+        self.name: str = name
+        self.schedule: IteratorSchedule = schedule
+        self.ticks: int = 0
+        self.errors: int = 0
+        self.last_duration: float = 0.0
+        self.durations: LatencyHistogram = LatencyHistogram()
+
+    def record(self, duration: float):
+        self.ticks += 1
+        self.last_duration = duration
+        self.durations.observe(duration)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "tick_every": self.schedule.tick_every,
+            "deferred": self.schedule.deferred,
+            "ticks": self.ticks,
+            "errors": self.errors,
+            "last_duration": self.last_duration,
+            "duration": self.durations.to_dict(),
+        }
+
+
+class ClockTickStats:
+    """
+    Timing of the real time clock ticks: how long the critical path of each tick took, how late the tick started
+    with respect to its scheduled time (lag behind the wall clock), how many ticks overran the tick size and how many
+    ticks were skipped because of it.
+    """
+
+    def __init__(self, tick_size: float):
+        self._tick_size = tick_size
+        self.ticks: int = 0
+        self.overruns: int = 0
+        self.skipped_ticks: int = 0
+        self.last_lag: float = 0.0
+        self.last_duration: float = 0.0
+        self.lags: LatencyHistogram = LatencyHistogram()
+        self.durations: LatencyHistogram = LatencyHistogram()
+        self._iterator_stats: Dict[Any, IteratorTickStats] = {}
+
+    def iterator_stats(self, iterator: Any, schedule: IteratorSchedule) -> IteratorTickStats:
+        stats = self._iterator_stats.get(iterator)
+        if stats is None or stats.schedule != schedule:
+            stats = IteratorTickStats(name=type(iterator).__name__, schedule=schedule)
+            self._iterator_stats[iterator] = stats
+        return stats
+
+    def remove_iterator(self, iterator: Any):
+        self._iterator_stats.pop(iterator, None)
+
+    def record_tick(self, lag: float, duration: float, skipped_ticks: int) -> bool:
+        """
+        Records a clock tick.
+        :param lag: seconds between the scheduled tick time and the moment the tick started
+        :param duration: seconds spent ticking the iterators in the critical path
+        :param skipped_ticks: number of ticks skipped since the previous one
+        :return: True if the tick overran the tick size
+        """
+        self.ticks += 1
+        self.last_lag = lag
+        self.last_duration = duration
+        self.lags.observe(max(lag, 0.0))
+        self.durations.observe(duration)
+        self.skipped_ticks += skipped_ticks
+        overrun = lag + duration > self._tick_size
+        if overrun:
+            self.overruns += 1
+        return overrun
+
+    def slowest_iterators(self, count: int = 3) -> List[IteratorTickStats]:
+        """
+        :return: the iterators with the longest last tick duration, slowest first
+        """
+        return sorted(self._iterator_stats.values(), key=lambda stats: stats.last_duration, reverse=True)[:count]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "skipped_ticks": self.skipped_ticks,
+            "last_lag": self.last_lag,
+            "last_duration": self.last_duration,
+            "lag": self.lags.to_dict(),
+            "duration": self.durations.to_dict(),
+            "iterators": [stats.to_dict() for stats in self._iterator_stats.values()],
+        }
@@ -187,6 +187,37 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
 
+    def apply_conflated_diffs(self, diffs: List[OrderBookMessage]) -> Tuple[int, int]:
+        """
+        Merges the diff messages into a single batch and applies it at once. Only the last update of each price level
+        is kept (last writer wins), and the update id of the batch is the highest update id of the messages.
+        :param diffs: diff messages, in the order they were received
+        :return: the number of price level updates received and the number of price level updates applied
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+            int64_t last_update_id = 0
+            int levels_in = 0
+        bids = {}
+        asks = {}
+        for diff in diffs:
+            last_update_id = max(last_update_id, diff.update_id)
+            # The rows are read through the message properties, which some exchange messages override
+            diff_bids = diff.bids
+            diff_asks = diff.asks
+            for row in diff_bids:
+                bids[row.price] = row
+            for row in diff_asks:
+                asks[row.price] = row
+            levels_in += len(diff_bids) + len(diff_asks)
+        for row in bids.values():
+            cpp_bids.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+        for row in asks.values():
+            cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+        return levels_in, len(bids) + len(asks)
+
     def apply_snapshot(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -280,6 +311,29 @@ cdef class OrderBook(PubSub):
             yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
             inc(it)
 
+    def top_levels(self, int depth) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Reads the best depth levels of each side of the book, without iterating the rest of the book.
+        :return: the bids (best first) and the asks (best first), as arrays of [price, amount] rows
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            int bids_count = min(depth, <int>self._bid_book.size())
+            int asks_count = min(depth, <int>self._ask_book.size())
+            np.ndarray[np.float64_t, ndim=2] bids = np.empty((bids_count, 2), dtype=np.float64)
+            np.ndarray[np.float64_t, ndim=2] asks = np.empty((asks_count, 2), dtype=np.float64)
+            int i
+        for i in range(bids_count):
+            bids[i, 0] = deref(bid_it).getPrice()
+            bids[i, 1] = deref(bid_it).getAmount()
+            inc(bid_it)
+        for i in range(asks_count):
+            asks[i, 0] = deref(ask_it).getPrice()
+            asks[i, 1] = deref(ask_it).getAmount()
+            inc(ask_it)
+        return bids, asks
+
     def simulate_buy(self, amount: float) -> List[OrderBookRow]:
         amount_left = amount
         retval = []
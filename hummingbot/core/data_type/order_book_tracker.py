@@ -3,7 +3,7 @@ import logging
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -13,6 +13,7 @@ from hummingbot.core.data_type.order_book_message import OrderBookMessage, Order
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
 from hummingbot.logger import HummingbotLogger
 
 
@@ -21,8 +22,97 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class OrderBookDiffConflation(Enum):
+    # Consecutive diffs are concatenated and applied in a single apply_diffs call
+    NONE = 1
+    # Pending diffs are merged per price level (last writer wins) before being applied in a single batch
+    CONFLATE = 2
+    # Like CONFLATE, but pending messages received before the latest snapshot are not applied (the diffs newer than
+    # the snapshot are still replayed when it is restored). Intended for strategies that only read the top of the book
+    LATEST_ONLY = 3
+
+
+class OrderBookMessageDispatcher:
+    """
+    Queue-like sink handed to the data source listeners (they only use `put_nowait` and `put`). Instead of storing the
+    messages, each one is passed to the dispatch function, that routes it to the queue of its trading pair.
+    """
+
+    def __init__(self, dispatch_function: Callable[[OrderBookMessage], None]):
+        self._dispatch_function = dispatch_function
+
+    def put_nowait(self, message: OrderBookMessage):
+        self._dispatch_function(message)
+
+    async def put(self, message: OrderBookMessage):
+        self._dispatch_function(message)
+
+
+class OrderBookPairQueue:
+    """
+    Bounded FIFO of order book messages for a single trading pair. The tracking task of the pair drains all the
+    pending messages at once to apply them in batches.
+    """
+
+    def __init__(self, trading_pair: str, max_size: int):
+        self.trading_pair: str = trading_pair
+        self.max_size: int = max_size
+        self._messages: Deque[OrderBookMessage] = deque()
+        self._messages_available: asyncio.Event = asyncio.Event()
+
+        self.max_depth: int = 0
+        self.messages_in: int = 0
+        self.messages_rejected: int = 0
+        self.overflows: int = 0
+        self.applies: int = 0
+        self.messages_skipped: int = 0
+        self.levels_in: int = 0
+        self.levels_out: int = 0
+        self.apply_latency: LatencyHistogram = LatencyHistogram()
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    @property
+    def full(self) -> bool:
+        return len(self._messages) >= self.max_size
+
+    def put_nowait(self, message: OrderBookMessage):
+        self._messages.append(message)
+        self.messages_in += 1
+        if len(self._messages) > self.max_depth:
+            self.max_depth = len(self._messages)
+        self._messages_available.set()
+
+    def clear(self):
+        self._messages.clear()
+        self._messages_available.clear()
+
+    async def get_batch(self) -> List[OrderBookMessage]:
+        await self._messages_available.wait()
+        messages = list(self._messages)
+        self._messages.clear()
+        self._messages_available.clear()
+        return messages
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "depth": len(self._messages),
+            "max_depth": self.max_depth,
+            "messages_in": self.messages_in,
+            "messages_rejected": self.messages_rejected,
+            "overflows": self.overflows,
+            "applies": self.applies,
+            "messages_skipped": self.messages_skipped,
+            "levels_in": self.levels_in,
+            "levels_out": self.levels_out,
+            "apply_latency": self.apply_latency.to_dict(),
+        }
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    PAIR_QUEUE_MAX_SIZE: int = 1000
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,7 +121,21 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 per_pair_routing: bool = False,
+                 diff_conflation: OrderBookDiffConflation = OrderBookDiffConflation.NONE):
+        """
+        :param data_source: the data source providing the order book messages
+        :param trading_pairs: the trading pairs to track
+        :param domain: the domain of the exchange (if any)
+        :param per_pair_routing: if True, the data source dispatches the messages directly into a bounded queue per
+            trading pair (without the global router), and each pair applies its pending diffs in batches
+        :param diff_conflation: how the pending diffs of a pair are merged before being applied (only used with
+            per_pair_routing)
+        """
         self._domain: Optional[str] = domain
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
@@ -46,6 +150,11 @@ class OrderBookTracker:
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
 
+        self._per_pair_routing: bool = per_pair_routing
+        self._diff_conflation: OrderBookDiffConflation = diff_conflation
+        self._pair_queues: Dict[str, OrderBookPairQueue] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
+
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
         self._order_book_diff_listener_task: Optional[asyncio.Task] = None
@@ -75,6 +184,13 @@ class OrderBookTracker:
             for trading_pair, order_book in self._order_books.items()
         }
 
+    def pair_queues_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the queue depth and diff application counters per trading pair (only available when the tracker uses
+        per pair routing)
+        """
+        return {trading_pair: queue.stats() for trading_pair, queue in self._pair_queues.items()}
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -83,24 +199,34 @@ class OrderBookTracker:
         self._emit_trade_event_task = safe_ensure_future(
             self._emit_trade_event_loop()
         )
-        self._order_book_diff_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
-        )
         self._order_book_trade_listener_task = safe_ensure_future(
             self._data_source.listen_for_trades(self._ev_loop, self._order_book_trade_stream)
         )
-        self._order_book_snapshot_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
-        )
         self._order_book_stream_listener_task = safe_ensure_future(
             self._data_source.listen_for_subscriptions()
         )
-        self._order_book_diff_router_task = safe_ensure_future(
-            self._order_book_diff_router()
-        )
-        self._order_book_snapshot_router_task = safe_ensure_future(
-            self._order_book_snapshot_router()
-        )
+        if self._per_pair_routing:
+            self._order_book_diff_listener_task = safe_ensure_future(
+                self._data_source.listen_for_order_book_diffs(
+                    self._ev_loop, OrderBookMessageDispatcher(self._dispatch_diff_message))
+            )
+            self._order_book_snapshot_listener_task = safe_ensure_future(
+                self._data_source.listen_for_order_book_snapshots(
+                    self._ev_loop, OrderBookMessageDispatcher(self._dispatch_snapshot_message))
+            )
+        else:
+            self._order_book_diff_listener_task = safe_ensure_future(
+                self._data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
+            )
+            self._order_book_snapshot_listener_task = safe_ensure_future(
+                self._data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
+            )
+            self._order_book_diff_router_task = safe_ensure_future(
+                self._order_book_diff_router()
+            )
+            self._order_book_snapshot_router_task = safe_ensure_future(
+                self._order_book_snapshot_router()
+            )
         self._update_last_trade_prices_task = safe_ensure_future(
             self._update_last_trade_prices_loop()
         )
@@ -137,6 +263,11 @@ class OrderBookTracker:
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        if len(self._resync_tasks) > 0:
+            for _, task in self._resync_tasks.items():
+                task.cancel()
+            self._resync_tasks.clear()
+        self._pair_queues.clear()
         self._order_books_initialized.clear()
 
     async def wait_ready(self):
@@ -178,8 +309,12 @@ class OrderBookTracker:
         """
         for index, trading_pair in enumerate(self._trading_pairs):
             self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+            if self._per_pair_routing:
+                self._init_pair_queue(trading_pair)
+                self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book_in_batches(trading_pair))
+            else:
+                self._tracking_message_queues[trading_pair] = asyncio.Queue()
+                self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
             self.logger().info(f"Initialized order book for {trading_pair}. "
                                f"{index + 1}/{len(self._trading_pairs)} completed.")
             await self._sleep(delay=1)
@@ -295,6 +430,132 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _init_pair_queue(self, trading_pair: str):
+        pair_queue = OrderBookPairQueue(trading_pair=trading_pair, max_size=self.PAIR_QUEUE_MAX_SIZE)
+        # Diff messages received before the snapshot was ready are processed first
+        saved_messages: Deque[OrderBookMessage] = self._saved_message_queues.pop(trading_pair, deque())
+        snapshot_uid = self._order_books[trading_pair].snapshot_uid
+        for message in saved_messages:
+            if message.update_id >= snapshot_uid:
+                pair_queue.put_nowait(message)
+        self._pair_queues[trading_pair] = pair_queue
+
+    def _dispatch_diff_message(self, message: OrderBookMessage):
+        """
+        Routes a diff message from the data source directly into the queue of its trading pair.
+        """
+        trading_pair: str = message.trading_pair
+        pair_queue: Optional[OrderBookPairQueue] = self._pair_queues.get(trading_pair)
+        if pair_queue is None:
+            # Save diff messages received before snapshots are ready
+            self._saved_message_queues[trading_pair].append(message)
+            return
+        if self._order_books[trading_pair].snapshot_uid > message.update_id:
+            pair_queue.messages_rejected += 1
+            return
+        if pair_queue.full:
+            # The book is not keeping up with the updates. Discard the pending diffs and resync from a new snapshot
+            pair_queue.overflows += 1
+            pair_queue.clear()
+            self._schedule_resync(trading_pair)
+        pair_queue.put_nowait(message)
+
+    def _dispatch_snapshot_message(self, message: OrderBookMessage):
+        pair_queue: Optional[OrderBookPairQueue] = self._pair_queues.get(message.trading_pair)
+        if pair_queue is not None:
+            pair_queue.put_nowait(message)
+
+    def _schedule_resync(self, trading_pair: str):
+        resync_task = self._resync_tasks.get(trading_pair)
+        if resync_task is None or resync_task.done():
+            self._resync_tasks[trading_pair] = safe_ensure_future(self._resync_order_book(trading_pair))
+
+    async def _resync_order_book(self, trading_pair: str):
+        try:
+            snapshot_message: OrderBookMessage = await self._data_source.get_order_book_snapshot_message(trading_pair)
+            self._dispatch_snapshot_message(snapshot_message)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(
+                f"Unexpected error requesting the order book snapshot for {trading_pair}.",
+                exc_info=True,
+                app_warning_msg=f"Could not resync the order book for {trading_pair}."
+            )
+
+    async def _track_single_book_in_batches(self, trading_pair: str):
+        past_diffs_window = self._past_diffs_windows[trading_pair]
+        pair_queue: OrderBookPairQueue = self._pair_queues[trading_pair]
+        order_book: OrderBook = self._order_books[trading_pair]
+
+        while True:
+            try:
+                messages: List[OrderBookMessage] = await pair_queue.get_batch()
+                if self._diff_conflation is OrderBookDiffConflation.LATEST_ONLY:
+                    messages = self._discard_messages_before_last_snapshot(messages, pair_queue)
+                pending_diffs: List[OrderBookMessage] = []
+                for message in messages:
+                    if message.type is OrderBookMessageType.DIFF:
+                        pending_diffs.append(message)
+                    elif message.type is OrderBookMessageType.SNAPSHOT:
+                        self._apply_diffs_batch(order_book, pending_diffs, pair_queue)
+                        pending_diffs = []
+                        past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+                        order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                self._apply_diffs_batch(order_book, pending_diffs, pair_queue)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error tracking order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg="Unexpected error tracking order book. Retrying after 5 seconds."
+                )
+                await asyncio.sleep(5.0)
+
+    def _discard_messages_before_last_snapshot(
+            self, messages: List[OrderBookMessage], pair_queue: OrderBookPairQueue) -> List[OrderBookMessage]:
+        """
+        Skips the messages received before the last snapshot. The skipped diffs newer than the snapshot (usually
+        received from the websocket before the snapshot was requested) are kept in the past diffs window, so that they
+        are replayed when the snapshot is restored.
+        """
+        for index in range(len(messages) - 1, 0, -1):
+            snapshot = messages[index]
+            if snapshot.type is OrderBookMessageType.SNAPSHOT:
+                pair_queue.messages_skipped += index
+                self._past_diffs_windows[pair_queue.trading_pair].extend(
+                    message for message in messages[:index]
+                    if message.type is OrderBookMessageType.DIFF and message.update_id > snapshot.update_id)
+                return messages[index:]
+        return messages
+
+    def _apply_diffs_batch(self, order_book: OrderBook, diffs: List[OrderBookMessage], pair_queue: OrderBookPairQueue):
+        """
+        Coalesces consecutive diff messages into a single apply_diffs call (merging the updates of each price level
+        if conflation is enabled)
+        """
+        if len(diffs) == 0:
+            return
+        start = time.perf_counter()
+        if self._diff_conflation is OrderBookDiffConflation.NONE:
+            if len(diffs) == 1:
+                bids, asks = diffs[0].bids, diffs[0].asks
+            else:
+                bids, asks = [], []
+                for diff in diffs:
+                    bids.extend(diff.bids)
+                    asks.extend(diff.asks)
+            order_book.apply_diffs(bids, asks, max(diff.update_id for diff in diffs))
+            levels_in = levels_out = len(bids) + len(asks)
+        else:
+            levels_in, levels_out = order_book.apply_conflated_diffs(diffs)
+        pair_queue.levels_in += levels_in
+        pair_queue.levels_out += levels_out
+        self._past_diffs_windows[pair_queue.trading_pair].extend(diffs)
+        pair_queue.applies += 1
+        pair_queue.apply_latency.observe(time.perf_counter() - start)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
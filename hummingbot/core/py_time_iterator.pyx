@@ -5,6 +5,12 @@ cdef class PyTimeIterator(TimeIterator):
     def tick(self, double timestamp):
         raise NotImplementedError
 
+    def next_wake_up_timestamp(self, timestamp: float) -> float:
+        return float("nan")
+
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         self.tick(timestamp)
+
+    cdef double c_next_wake_up_timestamp(self, double timestamp):
+        return self.next_wake_up_timestamp(timestamp)
@@ -0,0 +1,176 @@
+from collections import deque
+from decimal import Decimal
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+from hummingbot.connector.utils import combine_to_hb_trading_pair
+from hummingbot.core.gateway.utils import unwrap_token_symbol
+
+# A conversion step: the pair whose price is used and whether the price is inverted
+RateStep = Tuple[str, bool]
+
+DEFAULT_MAX_HOPS = 4
+_NOT_CACHED = object()
+
+
+class RateGraph(Dict[str, Decimal]):
+    """
+    A dictionary of trading pair prices indexed as a token graph, to find cross rates without scanning all the
+    prices. Each priced pair BASE-QUOTE is an edge between its two tokens, usable in both directions.
+    The conversion path between two tokens (the fewest hops) is memoized until a pair is added or removed, and the
+    rate computed from it is memoized until the price of one of the pairs of the path changes.
+    """
+
+    def __init__(self,
+                 prices: Optional[Union[Mapping[str, Decimal], Iterable[Tuple[str, Decimal]]]] = None,
+                 max_hops: int = DEFAULT_MAX_HOPS):
+        super().__init__()
+        self._max_hops = max_hops
+        self._adjacency: Dict[str, Dict[str, RateStep]] = {}
+        self._paths: Dict[Tuple[str, str], Optional[List[RateStep]]] = {}
+        self._rates: Dict[Tuple[str, str], Optional[Decimal]] = {}
+        self._rate_dependents: Dict[str, Set[Tuple[str, str]]] = {}
+        self._query_tokens: Dict[str, Tuple[str, str]] = {}
+        if prices is not None:
+            self.update(prices)
+
+    def __setitem__(self, pair: str, price: Decimal):
+        previous_price = self.get(pair, _NOT_CACHED)
+        super().__setitem__(pair, price)
+        if previous_price is _NOT_CACHED or self._is_valid_price(previous_price) != self._is_valid_price(price):
+            self._rebuild_edge(pair)
+        elif previous_price != price:
+            for key in self._rate_dependents.pop(pair, ()):
+                self._rates.pop(key, None)
+
+    def __delitem__(self, pair: str):
+        super().__delitem__(pair)
+        self._rebuild_edge(pair)
+
+    def update(self, *args, **kwargs):
+        for pair, price in dict(*args, **kwargs).items():
+            self[pair] = price
+
+    def pop(self, pair: str, *default):
+        if pair in self:
+            price = self[pair]
+            del self[pair]
+            return price
+        if default:
+            return default[0]
+        raise KeyError(pair)
+
+    def setdefault(self, pair: str, default: Optional[Decimal] = None) -> Decimal:
+        if pair not in self:
+            self[pair] = default
+        return self[pair]
+
+    def popitem(self) -> Tuple[str, Decimal]:
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        pair = next(reversed(self))
+        return pair, self.pop(pair)
+
+    def clear(self):
+        super().clear()
+        self._adjacency.clear()
+        self._clear_memoized()
+
+    def find_rate(self, pair: str) -> Optional[Decimal]:
+        """
+        Finds the exchange rate of a trading pair, directly from its price or from the prices of the pairs of the
+        shortest conversion path between its tokens (see hummingbot.core.rate_oracle.utils.find_rate).
+        :return: the rate, None if there is no conversion path
+        """
+        if pair in self:
+            return super().__getitem__(pair)
+        key = self._query_tokens.get(pair)
+        if key is None:
+            base, quote = pair.split("-")
+            key = (unwrap_token_symbol(base), unwrap_token_symbol(quote))
+            self._query_tokens[pair] = key
+        if key[0] == key[1]:
+            return Decimal("1")
+        rate = self._rates.get(key, _NOT_CACHED)
+        if rate is _NOT_CACHED:
+            rate = self._compute_rate(key)
+        return rate
+
+    def conversion_path(self, base: str, quote: str) -> Optional[List[RateStep]]:
+        """
+        :return: the pairs converting base into quote, with the fewest hops. None if there is no conversion path
+        """
+        key = (base, quote)
+        path = self._paths.get(key, _NOT_CACHED)
+        if path is _NOT_CACHED:
+            path = self._shortest_path(base, quote)
+            self._paths[key] = path
+        return path
+
+    def _compute_rate(self, key: Tuple[str, str]) -> Optional[Decimal]:
+        path = self.conversion_path(*key)
+        rate = None
+        if path is not None:
+            rate = Decimal("1")
+            for pair, inverted in path:
+                price = super().__getitem__(pair)
+                rate = rate / price if inverted else rate * price
+            for pair, _ in path:
+                self._rate_dependents.setdefault(pair, set()).add(key)
+        self._rates[key] = rate
+        return rate
+
+    def _shortest_path(self, base: str, quote: str) -> Optional[List[RateStep]]:
+        if base not in self._adjacency or quote not in self._adjacency:
+            return None
+        previous: Dict[str, Tuple[str, RateStep]] = {base: (base, ("", False))}
+        queue = deque([(base, 0)])
+        while queue:
+            token, hops = queue.popleft()
+            if hops >= self._max_hops:
+                continue
+            for neighbor, step in self._adjacency[token].items():
+                if neighbor in previous:
+                    continue
+                previous[neighbor] = (token, step)
+                if neighbor == quote:
+                    path = []
+                    while neighbor != base:
+                        neighbor, step = previous[neighbor]
+                        path.append(step)
+                    return path[::-1]
+                queue.append((neighbor, hops + 1))
+        return None
+
+    def _rebuild_edge(self, pair: str):
+        tokens = pair.split("-")
+        if len(tokens) != 2:
+            return
+        base, quote = tokens
+        self._remove_edge(base, quote)
+        if pair in self and self._is_valid_price(super().__getitem__(pair)):
+            self._add_edge(base, quote, pair)
+        self._clear_memoized()
+
+    def _add_edge(self, base: str, quote: str, pair: str):
+        # When both BASE-QUOTE and QUOTE-BASE are priced, the first pair added is used in both directions
+        self._adjacency.setdefault(base, {}).setdefault(quote, (pair, False))
+        self._adjacency.setdefault(quote, {}).setdefault(base, (pair, True))
+
+    def _remove_edge(self, base: str, quote: str):
+        self._adjacency.get(base, {}).pop(quote, None)
+        self._adjacency.get(quote, {}).pop(base, None)
+        reverse_pair = combine_to_hb_trading_pair(base=quote, quote=base)
+        if reverse_pair in self and self._is_valid_price(super().__getitem__(reverse_pair)):
+            self._add_edge(quote, base, reverse_pair)
+
+    def _clear_memoized(self):
+        self._paths.clear()
+        self._rates.clear()
+        self._rate_dependents.clear()
+
+    @staticmethod
+    def _is_valid_price(price) -> bool:
+        try:
+            return price is not None and price > 0
+        except Exception:
+            return False
@@ -1,12 +1,14 @@
 import asyncio
 import logging
+import time
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 import hummingbot.client.settings  # noqa
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.rate_oracle.rate_graph import RateGraph
 from hummingbot.core.rate_oracle.sources.ascend_ex_rate_source import AscendExRateSource
 from hummingbot.core.rate_oracle.sources.binance_rate_source import BinanceRateSource
 from hummingbot.core.rate_oracle.sources.binance_us_rate_source import BinanceUSRateSource
@@ -41,12 +43,37 @@ RATE_ORACLE_SOURCES = {
     "mexc": MexcRateSource,
 }
 
+# Seconds during which a price snapshot fetched from the source is reused
+DEFAULT_PRICE_CACHE_TTL = 1.0
+
+
+class RateOraclePriceCacheStats:
+    """
+    Counters of the price snapshot cache of the rate oracle.
+    """
+
+    def __init__(self):
+        self.hits: int = 0
+        self.misses: int = 0
+        self.coalesced: int = 0
+        self.errors: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+        }
+
 
 class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
     The find_rate is then used on these prices to find a rate on a given pair.
+    The prices fetched from the source are kept as a snapshot for price_cache_ttl seconds, and concurrent requests
+    share a single in-flight fetch, so that the consumers of the oracle don't each download all the prices.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -63,13 +90,21 @@ class RateOracle(NetworkBase):
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, source: Optional[RateSourceBase] = None, quote_token: Optional[str] = None):
+    def __init__(self,
+                 source: Optional[RateSourceBase] = None,
+                 quote_token: Optional[str] = None,
+                 price_cache_ttl: float = DEFAULT_PRICE_CACHE_TTL):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
-        self._prices: Dict[str, Decimal] = {}
+        self._prices: RateGraph = RateGraph()
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
+        self._price_cache_ttl = price_cache_ttl
+        self._source_prices: Optional[Dict[str, Decimal]] = None
+        self._source_prices_timestamp: float = 0
+        self._source_prices_fetch: Optional[asyncio.Future] = None
+        self._price_cache_stats = RateOraclePriceCacheStats()
 
     def __str__(self):
         return f"{self._source.name} rate oracle"
@@ -98,6 +133,7 @@ class RateOracle(NetworkBase):
     @source.setter
     def source(self, new_source: RateSourceBase):
         self._source = new_source
+        self._clear_price_cache()
 
     @property
     def quote_token(self) -> str:
@@ -107,7 +143,8 @@ class RateOracle(NetworkBase):
     def quote_token(self, new_token: str):
         if new_token != self._quote_token:
             self._quote_token = new_token
-            self._prices = {}
+            self._prices = RateGraph()
+            self._clear_price_cache()
 
     @property
     def prices(self) -> Dict[str, Decimal]:
@@ -116,6 +153,14 @@ class RateOracle(NetworkBase):
         """
         return self._prices.copy()
 
+    @property
+    def price_cache_ttl(self) -> float:
+        return self._price_cache_ttl
+
+    @property
+    def price_cache_stats(self) -> RateOraclePriceCacheStats:
+        return self._price_cache_stats
+
     async def start_network(self):
         await self.stop_network()
         self._fetch_price_task = safe_ensure_future(self._fetch_price_loop())
@@ -127,7 +172,7 @@ class RateOracle(NetworkBase):
 
     async def check_network(self) -> NetworkStatus:
         try:
-            prices = await self._source.get_prices(quote_token=self._quote_token)
+            prices = await self._get_source_prices()
             if not prices:
                 raise Exception(f"Error fetching new prices from {self._source.name}.")
         except asyncio.CancelledError:
@@ -155,7 +200,7 @@ class RateOracle(NetworkBase):
         :param base_token: The token symbol that we want to price, e.g. BTC
         :return A conversion rate
         """
-        prices = await self._source.get_prices(quote_token=self._quote_token)
+        prices = await self._get_source_prices()
         pair = combine_to_hb_trading_pair(base=base_token, quote=self._quote_token)
         return find_rate(prices, pair)
 
@@ -167,7 +212,7 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        return find_rate(self._price_graph(), pair)
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -192,20 +237,66 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        prices = await self._source.get_prices(quote_token=self._quote_token)
+        prices = await self._get_source_prices()
         return find_rate(prices, pair)
 
     def set_price(self, pair: str, price: Decimal):
         """
         Update keys in self._prices with new prices
         """
-        self._prices[pair] = price
+        self._price_graph()[pair] = price
+
+    def _price_graph(self) -> RateGraph:
+        # The prices can be replaced by a plain dictionary (e.g. in tests), it is indexed again in that case
+        if not isinstance(self._prices, RateGraph):
+            self._prices = RateGraph(self._prices)
+        return self._prices
+
+    async def _get_source_prices(self) -> Dict[str, Decimal]:
+        """
+        Returns the prices of the source from the snapshot cache, or fetches them if the snapshot is older than the
+        cache TTL. A single fetch is in flight at a time, all the callers requesting prices meanwhile await it.
+        The returned dictionary is shared between the callers and must not be modified.
+        """
+        if (self._source_prices is not None
+                and time.monotonic() - self._source_prices_timestamp < self._price_cache_ttl):
+            self._price_cache_stats.hits += 1
+            return self._source_prices
+        fetch = self._source_prices_fetch
+        if fetch is None or fetch.done() or fetch.get_loop() is not asyncio.get_running_loop():
+            self._price_cache_stats.misses += 1
+            fetch = asyncio.ensure_future(self._source.get_prices(quote_token=self._quote_token))
+            fetch.add_done_callback(self._on_source_prices_fetched)
+            self._source_prices_fetch = fetch
+        else:
+            self._price_cache_stats.coalesced += 1
+        # The fetch is shielded so that a cancelled caller does not cancel it for the other callers
+        return await asyncio.shield(fetch)
+
+    def _on_source_prices_fetched(self, fetch: asyncio.Future):
+        if fetch is not self._source_prices_fetch:
+            # The cache was cleared while fetching (source or quote token changed)
+            if not fetch.cancelled():
+                fetch.exception()
+            return
+        self._source_prices_fetch = None
+        if fetch.cancelled():
+            return
+        if fetch.exception() is not None:
+            self._price_cache_stats.errors += 1
+            return
+        self._source_prices = fetch.result()
+        self._source_prices_timestamp = time.monotonic()
+
+    def _clear_price_cache(self):
+        self._source_prices = None
+        self._source_prices_fetch = None
 
     async def _fetch_price_loop(self):
         while True:
             try:
-                new_prices = await self._source.get_prices(quote_token=self._quote_token)
-                self._prices.update(new_prices)
+                new_prices = await self._get_source_prices()
+                self._price_graph().update(new_prices)
 
                 if self._prices:
                     self._ready_event.set()
@@ -3,6 +3,7 @@ from typing import Dict
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.gateway.utils import unwrap_token_symbol
+from hummingbot.core.rate_oracle.rate_graph import RateGraph
 
 
 def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
@@ -13,9 +14,12 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     A rate for HBOT-AAVE will be 100 / 50
     A rate for AAVE-HBOT will be 50 / 100
     A rate for HBOT-GBP will be 100 * 0.75
+    If prices is a RateGraph, the rate is found from its token graph instead, through the shortest conversion path
     :param prices: The dictionary of trading pairs and their prices
     :param pair: The trading pair
     '''
+    if isinstance(prices, RateGraph):
+        return prices.find_rate(pair)
     if pair in prices:
         return prices[pair]
     base, quote = split_hb_trading_pair(trading_pair=pair)
@@ -12,3 +12,4 @@ cdef class TimeIterator(PubSub):
     cdef c_start(self, Clock clock, double timestamp)
     cdef c_stop(self, Clock clock)
     cdef c_tick(self, double timestamp)
+    cdef double c_next_wake_up_timestamp(self, double timestamp)
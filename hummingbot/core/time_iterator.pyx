@@ -22,9 +22,21 @@ cdef class TimeIterator(PubSub):
     cdef c_tick(self, double timestamp):
         self._current_timestamp = timestamp
 
+    cdef double c_next_wake_up_timestamp(self, double timestamp):
+        return NaN
+
     def tick(self, timestamp: float):
         self.c_tick(timestamp)
 
+    def next_wake_up_timestamp(self, timestamp: float) -> float:
+        """
+        Used by the fast-forward backtesting clock to skip the ticks where nothing happens for this iterator.
+        :param timestamp: the current clock timestamp
+        :return: the earliest timestamp when the iterator needs to be ticked again (e.g. the next market data event or
+        order expiration), inf if it doesn't need more ticks, or NaN if it needs to be ticked on every clock tick
+        """
+        return self.c_next_wake_up_timestamp(timestamp)
+
     @property
     def current_timestamp(self) -> float:
         return self._current_timestamp
@@ -1,6 +1,7 @@
 import asyncio
 import importlib
 import inspect
+import json
 import logging
 import sys
 import time
@@ -9,13 +10,14 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 
+from cachetools import LRUCache
 from sqlalchemy.orm import Query, Session
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_data_types import BaseClientModel
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_strategy_starter_file
 from hummingbot.client.config.strategy_config_data_types import BaseStrategyConfigMap
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceMetrics, PerformanceMetricsAccumulator
 from hummingbot.client.settings import SCRIPT_STRATEGIES_MODULE, STRATEGIES
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
@@ -60,6 +62,7 @@ class TradingCore:
     """
 
     KILL_TIMEOUT = 20.0
+    PERFORMANCE_ACCUMULATORS_CACHE_SIZE = 100
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -105,6 +108,9 @@ class TradingCore:
         self.kill_switch: Optional[KillSwitch] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
         self.trade_fill_db: Optional[SQLConnectionManager] = None
+        self._performance_accumulators: LRUCache = LRUCache(maxsize=self.PERFORMANCE_ACCUMULATORS_CACHE_SIZE)
+        # States of the accumulators saved next to the trade fill database, loaded on first use
+        self._saved_performance_accumulators: Optional[Dict[str, Dict[str, Any]]] = None
 
         # Runtime state
         self.init_time: float = time.time()
@@ -312,13 +318,18 @@ class TradingCore:
         self.trade_fill_db = SQLConnectionManager.get_trade_fills_instance(
             self.client_config_map, db_name
         )
+        self._saved_performance_accumulators = None
 
         self.markets_recorder = MarketsRecorder(
             self.trade_fill_db,
             list(self.connector_manager.connectors.values()),
             self._strategy_file_name or db_name,
             self.strategy_name or db_name,
-            self.client_config_map.market_data_collection
+            self.client_config_map.market_data_collection,
+            write_behind=self.client_config_map.markets_recorder.recorder_write_behind,
+            write_behind_interval=self.client_config_map.markets_recorder.recorder_write_behind_interval,
+            write_behind_queue_size=self.client_config_map.markets_recorder.recorder_write_behind_queue_size,
+            trade_fills_warm_start=self.client_config_map.markets_recorder.recorder_trade_fills_warm_start,
         )
 
         self.markets_recorder.start()
@@ -705,10 +716,73 @@ class TradingCore:
             except asyncio.TimeoutError:
                 self.logger().warning("\nA network error prevented the balances retrieval to complete. See logs for more details.")
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances,
+                                                   accumulator=self.performance_accumulator(market, symbol, cur_trades))
             performance_metrics.append(perf)
         return performance_metrics
 
+    def performance_accumulator(self, market: str, symbol: str, trades: List[TradeFill]) -> PerformanceMetricsAccumulator:
+        """
+        Returns the performance accumulator of the trades of a connector and trading pair. The accumulators are kept,
+        keyed by the config and the first trade of the reported period, so that each trade is only ingested once across
+        the performance reports. Only the most recently used accumulators are kept, those of the periods no longer
+        reported are evicted. The accumulators saved by save_performance_accumulators are restored on first use.
+        """
+        first_trade = trades[0]
+        key = (self._strategy_file_name or "", market, symbol, first_trade.order_id, first_trade.exchange_trade_id)
+        accumulator = self._performance_accumulators.get(key)
+        if accumulator is None:
+            saved_state = self._load_performance_accumulators().get(self._performance_accumulator_saved_key(key))
+            if saved_state is not None:
+                accumulator = PerformanceMetricsAccumulator.from_json(saved_state)
+            else:
+                accumulator = PerformanceMetricsAccumulator(symbol)
+            self._performance_accumulators[key] = accumulator
+        return accumulator
+
+    def save_performance_accumulators(self):
+        """
+        Saves the state of the performance accumulators in a JSON file next to the trade fill database, so that the
+        trades already ingested are not ingested again after a restart. Only the states of the most recent
+        PERFORMANCE_ACCUMULATORS_CACHE_SIZE accumulators are kept in the file.
+        """
+        path = self._performance_accumulators_path()
+        if path is None or len(self._performance_accumulators) == 0:
+            return
+        saved = self._load_performance_accumulators()
+        for key, accumulator in self._performance_accumulators.items():
+            saved_key = self._performance_accumulator_saved_key(key)
+            saved.pop(saved_key, None)
+            saved[saved_key] = accumulator.to_json()
+        for saved_key in list(saved.keys())[:-self.PERFORMANCE_ACCUMULATORS_CACHE_SIZE]:
+            del saved[saved_key]
+        try:
+            temp_path = path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps(saved))
+            temp_path.replace(path)
+        except OSError as e:
+            self.logger().warning(f"Error saving the performance accumulators to {path}: {e}")
+
+    def _load_performance_accumulators(self) -> Dict[str, Dict[str, Any]]:
+        if self._saved_performance_accumulators is None:
+            self._saved_performance_accumulators = {}
+            path = self._performance_accumulators_path()
+            if path is not None and path.exists():
+                try:
+                    self._saved_performance_accumulators = json.loads(path.read_text())
+                except (OSError, ValueError) as e:
+                    self.logger().warning(f"Error loading the performance accumulators from {path}: {e}")
+        return self._saved_performance_accumulators
+
+    def _performance_accumulators_path(self) -> Optional[Path]:
+        if self.trade_fill_db is None:
+            return None
+        return Path(self.trade_fill_db.db_path).with_suffix(".performance.json")
+
+    @staticmethod
+    def _performance_accumulator_saved_key(key: Tuple[str, str, str, str, str]) -> str:
+        return "|".join(key)
+
     @staticmethod
     def _get_trades_from_session(start_timestamp: int,
                                  session: Session,
@@ -764,6 +838,8 @@ class TradingCore:
             if self._is_running:
                 await self.stop_clock()
 
+            self.save_performance_accumulators()
+
             # Stop markets recorder
             if self.markets_recorder:
                 self.markets_recorder.stop()
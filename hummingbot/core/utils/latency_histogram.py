@@ -0,0 +1,80 @@
+from bisect import bisect_left
+from typing import Any, Dict, List, Sequence
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket histogram of durations in seconds.
+    Recording a value is O(log(buckets)) and the memory used does not depend on the number of values recorded, which
+    makes it suitable for instrumenting hot paths.
+    """
+
+    __slots__ = ("_bounds", "_counts", "count", "total", "max")
+
+    def __init__(self, bucket_bounds: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """
+        :param bucket_bounds: sorted upper bounds (inclusive) of the buckets. Values above the last bound are counted
+            in an overflow bucket
+        """
+        self._bounds: List[float] = list(bucket_bounds)
+        self._counts: List[int] = [0] * (len(self._bounds) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count > 0 else 0.0
+
+    def observe(self, value: float):
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, pct: float) -> float:
+        """
+        Returns an upper estimation of the requested percentile, using the bound of the bucket where it falls
+        :param pct: percentile in the range [0, 100]
+        """
+        if self.count == 0:
+            return 0.0
+        threshold = self.count * pct / 100
+        accumulated = 0
+        for index, bucket_count in enumerate(self._counts):
+            accumulated += bucket_count
+            if accumulated >= threshold and accumulated > 0:
+                return min(self._bounds[index], self.max) if index < len(self._bounds) else self.max
+        return self.max
+
+    def buckets(self) -> Dict[float, int]:
+        """
+        :return: the number of values recorded in each bucket, keyed by the bucket upper bound (inf for overflow)
+        """
+        bounds = self._bounds + [float("inf")]
+        return {bound: bucket_count for bound, bucket_count in zip(bounds, self._counts)}
+
+    def reset(self):
+        self._counts = [0] * (len(self._bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+    def __repr__(self):
+        return (f"LatencyHistogram(count={self.count}, mean={self.mean:.6f}, p50={self.percentile(50)}, "
+                f"p99={self.percentile(99)}, max={self.max:.6f})")
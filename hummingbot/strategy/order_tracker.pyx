@@ -10,6 +10,7 @@ from typing import (
 )
 
 import pandas as pd
+from libc.math cimport INFINITY
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.limit_order cimport LimitOrder
@@ -127,6 +128,12 @@ cdef class OrderTracker(TimeIterator):
         TimeIterator.c_tick(self, timestamp)
         self.c_check_and_cleanup_shadow_records()
 
+    cdef double c_next_wake_up_timestamp(self, double timestamp):
+        # Shadow records are removed on the first tick after their keep alive duration expires
+        if len(self._shadow_gc_requests) > 0:
+            return self._shadow_gc_requests[0][0]
+        return INFINITY
+
     cdef dict c_get_limit_orders(self):
         return self._tracked_limit_orders
 
@@ -1,3 +1,5 @@
+from libc.math cimport isnan
+
 from hummingbot.strategy.strategy_base cimport StrategyBase
 from hummingbot.core.clock import Clock
 from hummingbot.core.clock cimport Clock
@@ -46,6 +48,21 @@ cdef class StrategyPyBase(StrategyBase):
     def tick(self, timestamp: float):
         raise NotImplementedError
 
+    cdef double c_next_wake_up_timestamp(self, double timestamp):
+        cdef double wake_up_timestamp = self.next_wake_up_timestamp(timestamp)
+        if isnan(wake_up_timestamp):
+            return wake_up_timestamp
+        return min(wake_up_timestamp, self._sb_order_tracker.c_next_wake_up_timestamp(timestamp))
+
+    def next_wake_up_timestamp(self, timestamp: float) -> float:
+        """
+        Strategies whose tick only acts at known times (e.g. a schedule of orders) can return the next of them, so that
+        the fast-forward backtesting clock skips the ticks in between. The shadow records of the order tracker are
+        taken into account by the strategy base.
+        :return: NaN (the default) to be ticked on every clock tick
+        """
+        return float("nan")
+
     cdef c_did_create_buy_order(self, object order_created_event):
         self.did_create_buy_order(order_created_event)
 
@@ -36,6 +36,7 @@ from hummingbot.strategy_v2.models.executor_actions import (
     StoreExecutorAction,
 )
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
 
 
 class StrategyV2ConfigBase(BaseClientModel):
@@ -62,6 +63,13 @@ class StrategyV2ConfigBase(BaseClientModel):
             "prompt_on_new": True,
         }
     )
+    shared_control_loop: bool = Field(
+        default=False,
+        json_schema_extra={
+            "prompt": "Run the controllers and executors from a shared scheduler instead of a loop each? (True/False): ",
+            "prompt_on_new": False,
+        }
+    )
 
     @field_validator("controllers_config", mode="before")
     @classmethod
@@ -195,6 +203,9 @@ class StrategyV2Base(ScriptStrategyBase):
         self.market_data_provider = MarketDataProvider(connectors)
         self.market_data_provider.initialize_candles_feed_list(config.candles_config)
 
+        # Shared scheduler for the control tasks of the controllers and executors, if enabled
+        self.runnable_scheduler: Optional[RunnableScheduler] = RunnableScheduler() if config.shared_control_loop else None
+
         # Initialize the controllers
         self.actions_queue = asyncio.Queue()
         self.listen_to_executor_actions_task: asyncio.Task = asyncio.create_task(self.listen_to_executor_actions())
@@ -204,7 +215,8 @@ class StrategyV2Base(ScriptStrategyBase):
         # Collect initial positions from all controller configs
         self.executor_orchestrator = ExecutorOrchestrator(
             strategy=self,
-            initial_positions_by_controller=self._collect_initial_positions()
+            initial_positions_by_controller=self._collect_initial_positions(),
+            runnable_scheduler=self.runnable_scheduler,
         )
         self.mqtt_enabled = False
         self._pub: Optional[ETopicPublisher] = None
@@ -264,6 +276,7 @@ class StrategyV2Base(ScriptStrategyBase):
     def add_controller(self, config: ControllerConfigBase):
         try:
             controller = config.get_controller_class()(config, self.market_data_provider, self.actions_queue)
+            controller.set_scheduler(self.runnable_scheduler)
             self.controllers[config.id] = controller
         except Exception as e:
             self.logger().error(f"Error adding controller: {e}", exc_info=True)
@@ -326,6 +339,8 @@ class StrategyV2Base(ScriptStrategyBase):
         await self.executor_orchestrator.stop(self.max_executors_close_attempts)
         for controller in self.controllers.values():
             controller.stop()
+        if self.runnable_scheduler is not None:
+            self.runnable_scheduler.stop()
         self.market_data_provider.stop()
         self.executor_orchestrator.store_all_executors()
         if self.mqtt_enabled:
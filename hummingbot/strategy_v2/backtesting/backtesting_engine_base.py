@@ -13,9 +13,13 @@ from hummingbot.core.data_type.common import LazyDict, TradeType
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.exceptions import InvalidController
 from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
-from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation, ExecutorSimulatorBase
 from hummingbot.strategy_v2.backtesting.executors_simulator.dca_executor_simulator import DCAExecutorSimulator
-from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import PositionExecutorSimulator
+from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import (
+    ArrayPositionExecutorSimulator,
+    PositionExecutorSimulator,
+)
+from hummingbot.strategy_v2.backtesting.market_data_arrays import MarketDataArrays
 from hummingbot.strategy_v2.controllers.controller_base import ControllerBase, ControllerConfigBase
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerConfigBase,
@@ -37,6 +41,7 @@ class BacktestingEngineBase:
         self.backtesting_resolution = None
         self.backtesting_data_provider = BacktestingDataProvider(connectors={})
         self.position_executor_simulator = PositionExecutorSimulator()
+        self.array_position_executor_simulator = ArrayPositionExecutorSimulator()
         self.dca_executor_simulator = DCAExecutorSimulator()
 
     @classmethod
@@ -83,7 +88,9 @@ class BacktestingEngineBase:
                               controller_config: ControllerConfigBase,
                               start: int, end: int,
                               backtesting_resolution: str = "1m",
-                              trade_cost=0.0006):
+                              trade_cost=0.0006,
+                              fast_mode: bool = False,
+                              processed_data_columns: Optional[List[str]] = None):
         controller_class = self.__controller_class_cache.get_or_add(controller_config.controller_name, controller_config.get_controller_class)
         # controller_class = controller_config.get_controller_class()
         # Load historical candles
@@ -94,7 +101,11 @@ class BacktestingEngineBase:
         self.backtesting_resolution = backtesting_resolution
         await self.initialize_backtesting_data_provider()
         await self.controller.update_processed_data()
-        executors_info = await self.simulate_execution(trade_cost=trade_cost)
+        if fast_mode:
+            executors_info = await self.simulate_execution_fast(trade_cost=trade_cost,
+                                                                processed_data_columns=processed_data_columns)
+        else:
+            executors_info = await self.simulate_execution(trade_cost=trade_cost)
         results = self.summarize_results(executors_info, controller_config.total_amount_quote)
         return {
             "executors": executors_info,
@@ -137,6 +148,48 @@ class BacktestingEngineBase:
 
         return self.controller.executors_info
 
+    async def simulate_execution_fast(self, trade_cost: float,
+                                      processed_data_columns: Optional[List[str]] = None) -> list:
+        """
+        Same simulation as simulate_execution, but iterating the market data as NumPy column arrays by integer
+        position. Rows are only materialized for the processed data of the controller, and the executor simulators
+        receive the column arrays with the start position instead of a label based slice of the data frame.
+
+        Args:
+            trade_cost (float): The cost per trade.
+            processed_data_columns (Optional[List[str]]): Columns of the market data the controller reads from its
+                processed data. All the columns are updated if not provided, and none if it's an empty list.
+
+        Returns:
+            List[ExecutorInfo]: List of executor information objects detailing the simulation results.
+        """
+        market_data = MarketDataArrays(self.prepare_market_data())
+        self.active_executor_simulations: List[ExecutorSimulation] = []
+        self.stopped_executors_info: List[ExecutorInfo] = []
+        price_key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
+        for i in range(len(market_data)):
+            timestamp = market_data.timestamp(i)
+            self.update_state_at_index(market_data, i, timestamp, price_key, processed_data_columns)
+            for action in self.controller.determine_executor_actions():
+                if isinstance(action, CreateExecutorAction):
+                    executor_simulation = self.simulate_executor_from_arrays(
+                        action.executor_config, market_data, i, trade_cost)
+                    if executor_simulation is not None and executor_simulation.close_type != CloseType.FAILED:
+                        self.manage_active_executors(executor_simulation)
+                elif isinstance(action, StopExecutorAction):
+                    self.handle_stop_action(action, timestamp)
+
+        return self.controller.executors_info
+
+    def update_state_at_index(self, market_data: MarketDataArrays, index: int, timestamp: float, price_key: str,
+                              processed_data_columns: Optional[List[str]]):
+        close_price = market_data.columns["close_bt"][index]
+        self.controller.market_data_provider.prices = {price_key: Decimal(float(close_price))}
+        self.controller.market_data_provider._time = timestamp
+        if processed_data_columns is None or len(processed_data_columns) > 0:
+            self.controller.processed_data.update(market_data.row(index, processed_data_columns))
+        self.update_executors_info(timestamp)
+
     async def update_state(self, row):
         key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
         self.controller.market_data_provider.prices = {key: Decimal(row["close_bt"])}
@@ -219,6 +272,30 @@ class BacktestingEngineBase:
             return self.position_executor_simulator.simulate(df, config, trade_cost)
         return None
 
+    def simulate_executor_from_arrays(self, config: Union[PositionExecutorConfig, DCAExecutorConfig],
+                                      market_data: MarketDataArrays, start_index: int,
+                                      trade_cost: float) -> Optional[ExecutorSimulation]:
+        """
+        Simulates the execution of a trading strategy from the candle at start_index onwards.
+
+        Args:
+            config (PositionExecutorConfig): The configuration of the executor.
+            market_data (MarketDataArrays): The market data column arrays.
+            start_index (int): Position of the candle where the executor is created.
+            trade_cost (float): The cost per trade.
+
+        Returns:
+            ExecutorSimulation: The results of the simulation.
+        """
+        simulator: Optional[ExecutorSimulatorBase] = None
+        if isinstance(config, DCAExecutorConfig):
+            simulator = self.dca_executor_simulator
+        elif isinstance(config, PositionExecutorConfig):
+            simulator = self.array_position_executor_simulator
+        if simulator is None:
+            return None
+        return simulator.simulate_from_arrays(market_data, start_index, config, trade_cost)
+
     def manage_active_executors(self, simulation: ExecutorSimulation):
         """
         Manages the list of active executors based on the simulation results.
@@ -0,0 +1,203 @@
+import asyncio
+import itertools
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
+
+# Layout of each data frame in the shared memory block: number of rows and (column, dtype, offset) of each column
+CandlesLayout = Dict[str, Tuple[int, List[Tuple[str, str, int]]]]
+
+
+class SharedCandlesFeeds:
+    """
+    Candles data frames stored column by column in a single shared memory block, so they can be loaded once and
+    read by every worker process of the sweep instead of being pickled with each task.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, layout: CandlesLayout):
+        self._shm = shm
+        self._layout = layout
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def layout(self) -> CandlesLayout:
+        return self._layout
+
+    @classmethod
+    def create(cls, candles_feeds: Dict[str, pd.DataFrame]) -> "SharedCandlesFeeds":
+        layout: CandlesLayout = {}
+        columns_values: List[Tuple[np.ndarray, int]] = []
+        offset = 0
+        for key, candles_df in candles_feeds.items():
+            columns = []
+            for column in candles_df.columns:
+                values = candles_df[column].to_numpy()
+                if not np.issubdtype(values.dtype, np.number):
+                    raise ValueError(f"Column {column} of the {key} candles is not numeric and can't be shared.")
+                columns.append((column, values.dtype.str, offset))
+                columns_values.append((values, offset))
+                offset += values.nbytes
+            layout[key] = (len(candles_df), columns)
+        shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for values, values_offset in columns_values:
+            shared_values = np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf, offset=values_offset)
+            shared_values[:] = values
+        return cls(shm=shm, layout=layout)
+
+    @classmethod
+    def attach(cls, name: str, layout: CandlesLayout) -> "SharedCandlesFeeds":
+        return cls(shm=shared_memory.SharedMemory(name=name), layout=layout)
+
+    def candles_feeds(self) -> Dict[str, pd.DataFrame]:
+        """
+        Builds the candles data frames from the shared memory block. The data frames own their data, so the block
+        can be closed afterwards.
+        """
+        candles_feeds = {}
+        for key, (rows, columns) in self._layout.items():
+            candles_feeds[key] = pd.DataFrame({
+                column: np.ndarray((rows,), dtype=np.dtype(dtype), buffer=self._shm.buf, offset=offset).copy()
+                for column, dtype, offset in columns
+            })
+        return candles_feeds
+
+    def close(self):
+        self._shm.close()
+
+    def unlink(self):
+        self._shm.unlink()
+
+
+_worker_candles_feeds: Dict[str, pd.DataFrame] = {}
+_worker_trading_rules: Dict[str, Dict] = {}
+
+
+def _initialize_worker(shared_candles_name: str, layout: CandlesLayout, trading_rules: Dict[str, Dict]):
+    global _worker_candles_feeds, _worker_trading_rules
+    shared_candles = SharedCandlesFeeds.attach(shared_candles_name, layout)
+    try:
+        _worker_candles_feeds = shared_candles.candles_feeds()
+    finally:
+        shared_candles.close()
+    _worker_trading_rules = trading_rules
+
+
+def _run_backtesting(controller_config: ControllerConfigBase, start: int, end: int, backtesting_resolution: str,
+                     trade_cost: float, fast_mode: bool) -> Dict[str, Any]:
+    engine = BacktestingEngineBase()
+    engine.backtesting_data_provider.candles_feeds.update(_worker_candles_feeds)
+    engine.backtesting_data_provider.trading_rules.update(_worker_trading_rules)
+    backtesting_result = asyncio.run(engine.run_backtesting(controller_config=controller_config,
+                                                            start=start,
+                                                            end=end,
+                                                            backtesting_resolution=backtesting_resolution,
+                                                            trade_cost=trade_cost,
+                                                            fast_mode=fast_mode))
+    return backtesting_result["results"]
+
+
+class BacktestingParameterSweep:
+    """
+    Runs the backtesting of every combination of a parameter grid applied to a base controller configuration. The
+    candles are downloaded once in the main process and shared with a pool of worker processes through shared memory,
+    each worker running the backtesting of one configuration at a time.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, mp_context=None):
+        self._max_workers = max_workers or os.cpu_count()
+        self._mp_context = mp_context
+        self.backtesting_engine = BacktestingEngineBase()
+
+    @staticmethod
+    def expand_parameter_grid(controller_config: ControllerConfigBase,
+                              parameter_grid: Dict[str, List[Any]]) -> List[Tuple[Dict[str, Any], ControllerConfigBase]]:
+        """
+        Creates a controller configuration for each combination of the parameter values.
+        :param controller_config: the base configuration
+        :param parameter_grid: values to test for each configuration field
+        :return: the parameters of each combination with its configuration
+        """
+        config_class = type(controller_config)
+        parameter_names = list(parameter_grid.keys())
+        configs = []
+        for values in itertools.product(*(parameter_grid[name] for name in parameter_names)):
+            parameters = dict(zip(parameter_names, values))
+            configs.append((parameters, config_class.model_validate({**dict(controller_config), **parameters})))
+        return configs
+
+    async def load_market_data(self, controller_configs: List[ControllerConfigBase], start: int, end: int,
+                               backtesting_resolution: str) -> Tuple[Dict[str, pd.DataFrame], Dict[str, Dict]]:
+        """
+        Downloads the candles and trading rules required by all the configurations.
+        :return: the candles feeds by feed key and the trading rules by connector
+        """
+        data_provider = self.backtesting_engine.backtesting_data_provider
+        data_provider.update_backtesting_time(start, end)
+        for controller_config in controller_configs:
+            await data_provider.initialize_trading_rules(controller_config.connector_name)
+            await data_provider.initialize_candles_feed(CandlesConfig(
+                connector=controller_config.connector_name,
+                trading_pair=controller_config.trading_pair,
+                interval=backtesting_resolution
+            ))
+            for candles_config in controller_config.candles_config:
+                await data_provider.initialize_candles_feed(candles_config)
+        return dict(data_provider.candles_feeds), dict(data_provider.trading_rules)
+
+    def _executor(self, shared_candles: SharedCandlesFeeds, trading_rules: Dict[str, Dict]) -> Executor:
+        return ProcessPoolExecutor(max_workers=self._max_workers,
+                                   mp_context=self._mp_context,
+                                   initializer=_initialize_worker,
+                                   initargs=(shared_candles.name, shared_candles.layout, trading_rules))
+
+    async def run(self,
+                  controller_config: ControllerConfigBase,
+                  parameter_grid: Dict[str, List[Any]],
+                  start: int, end: int,
+                  backtesting_resolution: str = "1m",
+                  trade_cost: float = 0.0006,
+                  rank_by: str = "net_pnl_quote",
+                  fast_mode: bool = True) -> pd.DataFrame:
+        """
+        Runs the backtesting of every combination of the parameter grid in parallel.
+        :param controller_config: the base configuration
+        :param parameter_grid: values to test for each configuration field
+        :param start: backtesting start timestamp
+        :param end: backtesting end timestamp
+        :param backtesting_resolution: interval of the candles used to simulate the executors
+        :param trade_cost: the cost per trade
+        :param rank_by: the summarize_results metric used to rank the combinations (descending)
+        :param fast_mode: whether to use the array based execution mode of the backtesting engine
+        :return: a data frame with the parameters and results of each combination, ranked by the metric
+        """
+        configs = self.expand_parameter_grid(controller_config, parameter_grid)
+        candles_feeds, trading_rules = await self.load_market_data(
+            [config for _, config in configs], start, end, backtesting_resolution)
+        shared_candles = SharedCandlesFeeds.create(candles_feeds)
+        try:
+            loop = asyncio.get_running_loop()
+            with self._executor(shared_candles, trading_rules) as executor:
+                results = await asyncio.gather(*[
+                    loop.run_in_executor(executor, _run_backtesting, config, start, end, backtesting_resolution,
+                                         trade_cost, fast_mode)
+                    for _, config in configs
+                ])
+        finally:
+            shared_candles.close()
+            shared_candles.unlink()
+
+        sweep_results = pd.DataFrame([{**parameters, **result} for (parameters, _), result in zip(configs, results)])
+        if rank_by in sweep_results.columns:
+            sweep_results = sweep_results.sort_values(rank_by, ascending=False, kind="stable").reset_index(drop=True)
+        return sweep_results
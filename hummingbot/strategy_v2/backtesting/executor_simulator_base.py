@@ -4,6 +4,7 @@ from typing import Union
 import pandas as pd
 from pydantic import BaseModel, ConfigDict, field_validator
 
+from hummingbot.strategy_v2.backtesting.market_data_arrays import MarketDataArrays
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.models.base import RunnableStatus
@@ -87,3 +88,11 @@ class ExecutorSimulatorBase:
         """Simulates trading based on provided configuration and market data."""
         # This method should be generic enough to handle various trading strategies.
         raise NotImplementedError
+
+    def simulate_from_arrays(self, market_data: MarketDataArrays, start_index: int, config,
+                             trade_cost: float) -> ExecutorSimulation:
+        """
+        Simulates trading from the candle at start_index onwards. Simulators able to work on the column arrays
+        should override this method, by default the market data frame from start_index is simulated.
+        """
+        return self.simulate(market_data.frame(start_index), config, trade_cost)
@@ -1,7 +1,11 @@
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation, ExecutorSimulatorBase
+from hummingbot.strategy_v2.backtesting.market_data_arrays import MarketDataArrays
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.models.executors import CloseType
 
@@ -86,3 +90,161 @@ class PositionExecutorSimulator(ExecutorSimulatorBase):
             close_type=close_type
         )
         return simulation
+
+
+class ArrayPositionExecutorSimulator(PositionExecutorSimulator):
+    """
+    Position executor simulator working on the market data column arrays. The entry and the barriers are searched
+    with forward scans over growing chunks of candles that stop at the first crossing, and the executor timeline is
+    only materialized up to the close. The results are the same as the ones of PositionExecutorSimulator.
+    """
+    INITIAL_CHUNK_SIZE = 256
+    MAX_CHUNK_SIZE = 65536
+
+    def simulate(self, df: pd.DataFrame, config: PositionExecutorConfig, trade_cost: float) -> ExecutorSimulation:
+        return self.simulate_from_arrays(MarketDataArrays(df), 0, config, trade_cost)
+
+    def simulate_from_arrays(self, market_data: MarketDataArrays, start_index: int, config: PositionExecutorConfig,
+                             trade_cost: float) -> ExecutorSimulation:
+        timestamps = market_data.column("timestamp", start_index)
+        close = market_data.column("close", start_index)
+        triple_barrier_config = config.triple_barrier_config
+        side_multiplier = 1 if config.side == TradeType.BUY else -1
+
+        if triple_barrier_config.open_order_type.is_limit_type():
+            entry_price = float(config.entry_price)
+            if config.side == TradeType.BUY:
+                entry_index = self._first_crossing(lambda start, end: close[start:end] <= entry_price, 0, len(close))
+            else:
+                entry_index = self._first_crossing(lambda start, end: close[start:end] >= entry_price, 0, len(close))
+        else:
+            entry_index = 0 if len(close) > 0 else None
+
+        tl = triple_barrier_config.time_limit if triple_barrier_config.time_limit else None
+        tl_timestamp = config.timestamp + tl if tl else timestamps[-1]
+        end_index = int(np.searchsorted(timestamps, tl_timestamp, side="right"))
+
+        if entry_index is None:
+            executor_simulation = self._executor_timeline(
+                market_data.frame(start_index), end_index, np.zeros(end_index), 0.0, end_index, config, trade_cost)
+            return ExecutorSimulation(config=config, executor_simulation=executor_simulation,
+                                      close_type=CloseType.TIME_LIMIT)
+
+        filled_amount_quote = float(config.amount) * close[entry_index]
+        tp = float(triple_barrier_config.take_profit) if triple_barrier_config.take_profit else None
+        sl_price = None
+        if triple_barrier_config.stop_loss:
+            sl_price = close[entry_index] * (1 - float(triple_barrier_config.stop_loss) * side_multiplier)
+            sl_prices = market_data.column("low" if config.side == TradeType.BUY else "high", start_index)
+        trailing_sl_trigger_pct = None
+        trailing_sl_delta_pct = None
+        if triple_barrier_config.trailing_stop:
+            trailing_sl_trigger_pct = float(triple_barrier_config.trailing_stop.activation_price)
+            trailing_sl_delta_pct = float(triple_barrier_config.trailing_stop.trailing_delta)
+        check_trailing_stop = bool(trailing_sl_trigger_pct and trailing_sl_delta_pct)
+
+        net_pnl_pct_chunks = []
+        cumulative_growth = 1.0
+        trailing_stop_active = False
+        trailing_stop_pct = -np.inf
+        close_index = end_index - 1
+        close_type = CloseType.TIME_LIMIT
+        chunk_start = 0
+        chunk_size = self.INITIAL_CHUNK_SIZE
+        while chunk_start < end_index:
+            chunk_end = min(end_index, chunk_start + chunk_size)
+            net_pnl_pct, cumulative_growth = self._net_pnl_pct(
+                close, entry_index, chunk_start, chunk_end, cumulative_growth, side_multiplier, trade_cost)
+            net_pnl_pct_chunks.append(net_pnl_pct)
+
+            # Candidates in order of precedence when they happen at the same candle
+            crossings = []
+            if tp:
+                crossings.append((self._first_index(net_pnl_pct > tp), CloseType.TAKE_PROFIT))
+            if sl_price is not None:
+                if config.side == TradeType.BUY:
+                    sl_condition = sl_prices[chunk_start:chunk_end] <= sl_price
+                else:
+                    sl_condition = sl_prices[chunk_start:chunk_end] >= sl_price
+                crossings.append((self._first_index(sl_condition), CloseType.STOP_LOSS))
+            if check_trailing_stop:
+                activated = np.logical_or.accumulate(net_pnl_pct > trailing_sl_trigger_pct) | trailing_stop_active
+                trailing_stop = np.maximum.accumulate(
+                    np.concatenate(([trailing_stop_pct], net_pnl_pct - trailing_sl_delta_pct)))[1:]
+                trailing_stop_active = bool(activated[-1])
+                trailing_stop_pct = trailing_stop[-1]
+                crossings.append((self._first_index(activated & (net_pnl_pct < trailing_stop)),
+                                  CloseType.TRAILING_STOP))
+
+            crossings = [crossing for crossing in crossings if crossing[0] is not None]
+            if len(crossings) > 0:
+                crossing_index, close_type = min(crossings, key=lambda crossing: crossing[0])
+                close_index = chunk_start + crossing_index
+                break
+            chunk_start = chunk_end
+            chunk_size = min(chunk_size * 2, self.MAX_CHUNK_SIZE)
+
+        executor_simulation = self._executor_timeline(
+            market_data.frame(start_index), close_index + 1, np.concatenate(net_pnl_pct_chunks),
+            filled_amount_quote, entry_index, config, trade_cost,
+            trailing_sl_trigger_pct=trailing_sl_trigger_pct, trailing_sl_delta_pct=trailing_sl_delta_pct)
+        return ExecutorSimulation(config=config, executor_simulation=executor_simulation, close_type=close_type)
+
+    @staticmethod
+    def _net_pnl_pct(close: np.ndarray, entry_index: int, start: int, end: int, cumulative_growth: float,
+                     side_multiplier: int, trade_cost: float):
+        """
+        Computes the net pnl pct between the start and end positions, carrying the cumulative growth of the
+        previous chunk so the products are evaluated in the same order as a full cumulative product.
+        """
+        net_pnl_pct = np.zeros(end - start)
+        first = max(start, entry_index)
+        if first < end:
+            offset = 1 if first == entry_index else 0
+            growth = np.ones(end - first)
+            growth[offset:] = 1 + (close[first + offset:end] / close[first + offset - 1:end - 1] - 1)
+            cumulative = np.cumprod(np.concatenate(([cumulative_growth], growth)))[1:]
+            cumulative_growth = cumulative[-1]
+            net_pnl_pct[first - start:] = ((cumulative - 1) * side_multiplier) - trade_cost
+        return net_pnl_pct, cumulative_growth
+
+    def _first_crossing(self, condition, start: int, end: int) -> Optional[int]:
+        chunk_size = self.INITIAL_CHUNK_SIZE
+        while start < end:
+            chunk_end = min(end, start + chunk_size)
+            index = self._first_index(condition(start, chunk_end))
+            if index is not None:
+                return start + index
+            start = chunk_end
+            chunk_size = min(chunk_size * 2, self.MAX_CHUNK_SIZE)
+        return None
+
+    @staticmethod
+    def _first_index(condition: np.ndarray) -> Optional[int]:
+        if len(condition) == 0:
+            return None
+        index = int(np.argmax(condition))
+        return index if condition[index] else None
+
+    @staticmethod
+    def _executor_timeline(df: pd.DataFrame, rows: int, net_pnl_pct: np.ndarray, filled_amount_quote: float,
+                           entry_index: int, config: PositionExecutorConfig, trade_cost: float,
+                           trailing_sl_trigger_pct: Optional[float] = None,
+                           trailing_sl_delta_pct: Optional[float] = None) -> pd.DataFrame:
+        executor_simulation = df.iloc[:rows].copy()
+        net_pnl_pct = net_pnl_pct[:rows]
+        filled_amount = np.zeros(rows)
+        filled_amount[entry_index:] = filled_amount_quote
+        executor_simulation["net_pnl_pct"] = net_pnl_pct
+        executor_simulation["net_pnl_quote"] = net_pnl_pct * filled_amount
+        executor_simulation["cum_fees_quote"] = trade_cost * filled_amount
+        executor_simulation["filled_amount_quote"] = filled_amount
+        executor_simulation["current_position_average_price"] = float(config.entry_price)
+        if trailing_sl_trigger_pct is not None and trailing_sl_delta_pct is not None:
+            activated = np.logical_or.accumulate(net_pnl_pct > trailing_sl_trigger_pct)
+            trailing_stop = np.maximum.accumulate(net_pnl_pct - trailing_sl_delta_pct)
+            executor_simulation["ts"] = np.where(activated, trailing_stop, np.nan)
+        if rows > 0:
+            filled_amount_column = executor_simulation.columns.get_loc("filled_amount_quote")
+            executor_simulation.iloc[-1, filled_amount_column] = filled_amount[-1] * 2
+        return executor_simulation
@@ -0,0 +1,62 @@
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class MarketDataArrays:
+    """
+    Column oriented view of the backtesting market data. Each column is kept as a NumPy array so the backtesting
+    loop can address candles by integer position instead of iterating DataFrame rows, and the simulators can work
+    on array views (slices share memory with the original columns).
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self._df = df
+        self._columns: Dict[str, np.ndarray] = {column: df[column].to_numpy() for column in df.columns}
+        self._timestamps: np.ndarray = self._columns["timestamp"]
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    @property
+    def df(self) -> pd.DataFrame:
+        return self._df
+
+    @property
+    def columns(self) -> Dict[str, np.ndarray]:
+        return self._columns
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps
+
+    def timestamp(self, index: int) -> float:
+        return float(self._timestamps[index])
+
+    def column(self, name: str, start: int = 0, end: Optional[int] = None) -> np.ndarray:
+        """
+        Returns a view of the column values between the start (inclusive) and end (exclusive) positions
+        """
+        return self._columns[name][start:end]
+
+    def frame(self, start: int = 0) -> pd.DataFrame:
+        """
+        Returns the market data frame starting at the given position. Positional slicing doesn't need to search the
+        index, unlike label based slicing.
+        """
+        return self._df.iloc[start:]
+
+    def row(self, index: int, columns: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Materializes the values of a single candle as a dictionary with Python native values.
+        :param index: position of the candle
+        :param columns: the columns to include, all of them if not provided
+        """
+        if columns is None:
+            columns = self._columns.keys()
+        return {column: self._to_native(self._columns[column][index]) for column in columns}
+
+    @staticmethod
+    def _to_native(value: Any) -> Any:
+        return value.item() if isinstance(value, np.generic) else value
@@ -8,7 +8,6 @@ from pydantic import ConfigDict, Field, field_validator
 
 from hummingbot.client.config.config_data_types import BaseClientModel
 from hummingbot.core.data_type.common import MarketDict
-from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 from hummingbot.strategy_v2.models.base import RunnableStatus
@@ -151,7 +150,7 @@ class ControllerBase(RunnableBase):
             self.terminated.clear()
             self._status = RunnableStatus.RUNNING
             self.executors_update_event.set()
-            safe_ensure_future(self.control_loop())
+            self._start_control_loop()
         self.initialize_candles()
 
     def initialize_candles(self):
@@ -1,6 +1,6 @@
 from decimal import Decimal
-from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
@@ -25,6 +25,9 @@ from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 from hummingbot.strategy_v2.runnable_base import RunnableBase
 
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.executors.executor_event_dispatcher import ExecutorEventDispatcher
+
 
 class ExecutorBase(RunnableBase):
     """
@@ -39,6 +42,8 @@ class ExecutorBase(RunnableBase):
         :param connectors: The connectors to be used by the executor.
         :param update_interval: The update interval for the executor.
         """
+        # The executor info is rebuilt only after a state change marked it dirty
+        self._executor_info_dirty: bool = True
         super().__init__(update_interval)
         self.config = config
         self.close_type: Optional[CloseType] = None
@@ -49,13 +54,15 @@ class ExecutorBase(RunnableBase):
                            connector_name in connectors}
 
         # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
+        self._create_buy_order_forwarder = SourceInfoEventForwarder(partial(self.process_event, "process_order_created_event"))
+        self._create_sell_order_forwarder = SourceInfoEventForwarder(partial(self.process_event, "process_order_created_event"))
+        self._fill_order_forwarder = SourceInfoEventForwarder(partial(self.process_event, "process_order_filled_event"))
+        self._complete_buy_order_forwarder = SourceInfoEventForwarder(
+            partial(self.process_event, "process_order_completed_event"))
+        self._complete_sell_order_forwarder = SourceInfoEventForwarder(
+            partial(self.process_event, "process_order_completed_event"))
+        self._cancel_order_forwarder = SourceInfoEventForwarder(partial(self.process_event, "process_order_canceled_event"))
+        self._failed_order_forwarder = SourceInfoEventForwarder(partial(self.process_event, "process_order_failed_event"))
 
         # Pairs of market events and their corresponding event forwarders
         self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
@@ -67,6 +74,17 @@ class ExecutorBase(RunnableBase):
             (MarketEvent.SellOrderCompleted, self._complete_sell_order_forwarder),
             (MarketEvent.OrderFailure, self._failed_order_forwarder),
         ]
+        # When set, the dispatcher delivers the events of the orders placed by the executor instead of the forwarders
+        self._event_dispatcher: Optional["ExecutorEventDispatcher"] = None
+        # Last executor info built, with the state it was built from
+        self._executor_info_cache: Optional[Tuple[Tuple, ExecutorInfo]] = None
+        self._executor_info_version: int = 0
+
+    def set_event_dispatcher(self, event_dispatcher: "ExecutorEventDispatcher"):
+        """
+        Sets the dispatcher that routes the connector events to the executor. Must be called before starting it.
+        """
+        self._event_dispatcher = event_dispatcher
 
     @property
     def status(self):
@@ -75,6 +93,56 @@ class ExecutorBase(RunnableBase):
         """
         return self._status
 
+    @property
+    def _status(self) -> RunnableStatus:
+        return self._executor_status
+
+    @_status.setter
+    def _status(self, status: RunnableStatus):
+        self._executor_status = status
+        self._executor_info_dirty = True
+
+    @property
+    def close_type(self) -> Optional[CloseType]:
+        """
+        Returns the close type of the executor, None while it is not closed.
+        """
+        return self._close_type
+
+    @close_type.setter
+    def close_type(self, close_type: Optional[CloseType]):
+        self._close_type = close_type
+        self._executor_info_dirty = True
+
+    @property
+    def close_timestamp(self) -> Optional[float]:
+        """
+        Returns the timestamp when the executor was closed, None while it is not closed.
+        """
+        return self._close_timestamp
+
+    @close_timestamp.setter
+    def close_timestamp(self, close_timestamp: Optional[float]):
+        self._close_timestamp = close_timestamp
+        self._executor_info_dirty = True
+
+    def mark_executor_info_dirty(self):
+        """
+        Marks the executor info to be rebuilt on the next access. Called on every order event, status or close change
+        and after every run of the control task, since the metrics depend on the market prices.
+        """
+        self._executor_info_dirty = True
+
+    def on_control_task_executed(self):
+        self.mark_executor_info_dirty()
+
+    def process_event(self, handler_name: str, event_tag: int, market: ConnectorBase, event):
+        """
+        Marks the executor info dirty and delivers the order event to the handler with the given name.
+        """
+        self.mark_executor_info_dirty()
+        getattr(self, handler_name)(event_tag, market, event)
+
     @property
     def is_trading(self):
         """
@@ -106,30 +174,61 @@ class ExecutorBase(RunnableBase):
     @property
     def executor_info(self) -> ExecutorInfo:
         """
-        Returns the executor info.
-        """
-        ei = ExecutorInfo(
-            id=self.config.id,
-            timestamp=self.config.timestamp,
-            type=self.config.type,
-            status=self.status,
-            close_type=self.close_type,
-            close_timestamp=self.close_timestamp,
-            config=self.config,
-            net_pnl_pct=self.net_pnl_pct,
-            net_pnl_quote=self.net_pnl_quote,
-            cum_fees_quote=self.cum_fees_quote,
-            filled_amount_quote=self.filled_amount_quote,
-            is_active=self.is_active,
-            is_trading=self.is_trading,
-            custom_info=self.get_custom_info(),
-            controller_id=self.config.controller_id,
+        Returns the executor info. While the executor info is not marked dirty the cached instance is returned without
+        evaluating the metrics. Otherwise the state is evaluated, and the info is rebuilt only if it changed since the
+        last build, so the same instance is returned when nothing changed (see executor_info_version).
+        """
+        if self._executor_info_cache is not None and not self._executor_info_dirty:
+            return self._executor_info_cache[1]
+        state = (
+            self.status,
+            self.close_type,
+            self.close_timestamp,
+            self._nan_to_zero(self.net_pnl_pct),
+            self._nan_to_zero(self.net_pnl_quote),
+            self._nan_to_zero(self.cum_fees_quote),
+            self._nan_to_zero(self.filled_amount_quote),
+            self.is_active,
+            self.is_trading,
+            self.get_custom_info(),
+            self.config.controller_id,
         )
-        ei.filled_amount_quote = ei.filled_amount_quote if not ei.filled_amount_quote.is_nan() else Decimal("0")
-        ei.net_pnl_quote = ei.net_pnl_quote if not ei.net_pnl_quote.is_nan() else Decimal("0")
-        ei.cum_fees_quote = ei.cum_fees_quote if not ei.cum_fees_quote.is_nan() else Decimal("0")
-        ei.net_pnl_pct = ei.net_pnl_pct if not ei.net_pnl_pct.is_nan() else Decimal("0")
-        return ei
+        if self._executor_info_cache is None or self._executor_info_cache[0] != state:
+            (status, close_type, close_timestamp, net_pnl_pct, net_pnl_quote, cum_fees_quote, filled_amount_quote,
+             is_active, is_trading, custom_info, controller_id) = state
+            ei = ExecutorInfo(
+                id=self.config.id,
+                timestamp=self.config.timestamp,
+                type=self.config.type,
+                status=status,
+                close_type=close_type,
+                close_timestamp=close_timestamp,
+                config=self.config,
+                net_pnl_pct=net_pnl_pct,
+                net_pnl_quote=net_pnl_quote,
+                cum_fees_quote=cum_fees_quote,
+                filled_amount_quote=filled_amount_quote,
+                is_active=is_active,
+                is_trading=is_trading,
+                custom_info=custom_info,
+                controller_id=controller_id,
+            )
+            self._executor_info_cache = (state, ei)
+            self._executor_info_version += 1
+        self._executor_info_dirty = False
+        return self._executor_info_cache[1]
+
+    @property
+    def executor_info_version(self) -> int:
+        """
+        Returns a counter increased every time the executor info changes.
+        """
+        return self._executor_info_version
+
+    @staticmethod
+    def _nan_to_zero(value: Union[Decimal, float]) -> Decimal:
+        value = value if isinstance(value, Decimal) else Decimal(str(value))
+        return value if not value.is_nan() else Decimal("0")
 
     def get_custom_info(self) -> Dict:
         """
@@ -247,6 +346,9 @@ class ExecutorBase(RunnableBase):
         """
         Registers the events with the connectors.
         """
+        if self._event_dispatcher is not None:
+            self._event_dispatcher.register_executor(self)
+            return
         for connector in self.connectors.values():
             for event_pair in self._event_pairs:
                 connector.add_listener(event_pair[0], event_pair[1])
@@ -255,6 +357,9 @@ class ExecutorBase(RunnableBase):
         """
         Unregisters the events from the connectors.
         """
+        if self._event_dispatcher is not None:
+            self._event_dispatcher.unregister_executor(self)
+            return
         for connector in self.connectors.values():
             for event_pair in self._event_pairs:
                 connector.remove_listener(event_pair[0], event_pair[1])
@@ -287,9 +392,12 @@ class ExecutorBase(RunnableBase):
         :return: The result of the order placement.
         """
         if side == TradeType.BUY:
-            return self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
         else:
-            return self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+        if self._event_dispatcher is not None:
+            self._event_dispatcher.register_order(self, order_id)
+        return order_id
 
     def get_price(self, connector_name: str, trading_pair: str, price_type: PriceType = PriceType.MidPrice):
         """
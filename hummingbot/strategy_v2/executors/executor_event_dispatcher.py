@@ -0,0 +1,89 @@
+from typing import TYPE_CHECKING, Dict, List, Set
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent
+
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+
+# Name of the executor method that processes each market event
+EXECUTOR_EVENT_HANDLERS: Dict[MarketEvent, str] = {
+    MarketEvent.OrderCancelled: "process_order_canceled_event",
+    MarketEvent.BuyOrderCreated: "process_order_created_event",
+    MarketEvent.SellOrderCreated: "process_order_created_event",
+    MarketEvent.OrderFilled: "process_order_filled_event",
+    MarketEvent.BuyOrderCompleted: "process_order_completed_event",
+    MarketEvent.SellOrderCompleted: "process_order_completed_event",
+    MarketEvent.OrderFailure: "process_order_failed_event",
+}
+
+
+class ExecutorEventDispatcher:
+    """
+    Delivers the order events of the connectors to the executors. Instead of every executor listening to every
+    connector, the dispatcher listens once to each connector and sends each event only to the executor that placed the
+    order. Events of orders not placed through ExecutorBase.place_order are delivered to all the executors using the
+    connector, as when each executor listened to the connectors.
+    """
+
+    def __init__(self):
+        self._handlers_by_event_tag: Dict[int, str] = {
+            event.value: handler_name for event, handler_name in EXECUTOR_EVENT_HANDLERS.items()
+        }
+        self._forwarder = SourceInfoEventForwarder(self._dispatch_event)
+        self._connectors: List[ConnectorBase] = []
+        self._executors_by_connector: Dict[int, Set["ExecutorBase"]] = {}
+        self._executors_by_order_id: Dict[str, "ExecutorBase"] = {}
+        self._order_ids_by_executor: Dict["ExecutorBase", Set[str]] = {}
+
+    @property
+    def tracked_orders_count(self) -> int:
+        return len(self._executors_by_order_id)
+
+    def register_executor(self, executor: "ExecutorBase"):
+        for connector in executor.connectors.values():
+            connector_executors = self._executors_by_connector.get(id(connector))
+            if connector_executors is None:
+                connector_executors = set()
+                self._executors_by_connector[id(connector)] = connector_executors
+                self._connectors.append(connector)
+                for event in EXECUTOR_EVENT_HANDLERS:
+                    connector.add_listener(event, self._forwarder)
+            connector_executors.add(executor)
+        self._order_ids_by_executor.setdefault(executor, set())
+
+    def unregister_executor(self, executor: "ExecutorBase"):
+        for connector_executors in self._executors_by_connector.values():
+            connector_executors.discard(executor)
+        for order_id in self._order_ids_by_executor.pop(executor, set()):
+            if self._executors_by_order_id.get(order_id) is executor:
+                del self._executors_by_order_id[order_id]
+
+    def register_order(self, executor: "ExecutorBase", order_id: str):
+        """
+        Routes the events of the order only to the executor that placed it
+        """
+        if executor in self._order_ids_by_executor:
+            self._executors_by_order_id[order_id] = executor
+            self._order_ids_by_executor[executor].add(order_id)
+
+    def stop(self):
+        for connector in self._connectors:
+            for event in EXECUTOR_EVENT_HANDLERS:
+                connector.remove_listener(event, self._forwarder)
+        self._connectors.clear()
+        self._executors_by_connector.clear()
+        self._executors_by_order_id.clear()
+        self._order_ids_by_executor.clear()
+
+    def _dispatch_event(self, event_tag: int, market: ConnectorBase, event):
+        handler_name = self._handlers_by_event_tag.get(event_tag)
+        if handler_name is None:
+            return
+        executor = self._executors_by_order_id.get(getattr(event, "order_id", None))
+        if executor is not None:
+            executor.process_event(handler_name, event_tag, market, event)
+        else:
+            for executor in list(self._executors_by_connector.get(id(market), ())):
+                executor.process_event(handler_name, event_tag, market, event)
@@ -3,7 +3,7 @@ import logging
 import uuid
 from collections import deque
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import PositionAction, PositionMode, PriceType, TradeType
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
 from hummingbot.strategy_v2.executors.arbitrage_executor.arbitrage_executor import ArbitrageExecutor
 from hummingbot.strategy_v2.executors.data_types import PositionSummary
 from hummingbot.strategy_v2.executors.dca_executor.dca_executor import DCAExecutor
+from hummingbot.strategy_v2.executors.executor_event_dispatcher import ExecutorEventDispatcher
 from hummingbot.strategy_v2.executors.grid_executor.grid_executor import GridExecutor
 from hummingbot.strategy_v2.executors.order_executor.order_executor import OrderExecutor
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
@@ -29,6 +30,7 @@ from hummingbot.strategy_v2.models.executor_actions import (
 )
 from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, PerformanceReport
+from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
 
 
 class PositionHold:
@@ -132,6 +134,54 @@ class PositionHold:
             cum_fees_quote=self.cum_fees_quote)
 
 
+class ExecutorsPerformance:
+    """
+    Running totals of the performance of the active executors of a controller. Each update only adds the difference
+    of the executors whose info changed since the previous update (executors return the same ExecutorInfo instance
+    while their state does not change).
+    """
+    def __init__(self):
+        self.unrealized_pnl_quote = Decimal("0")
+        self.realized_pnl_quote = Decimal("0")
+        self.volume_traded = Decimal("0")
+        self.close_type_counts: Dict[CloseType, int] = {}
+        self._executors_info: Dict[object, ExecutorInfo] = {}
+
+    def update(self, executors_with_info: List[Tuple[object, ExecutorInfo]]):
+        """
+        :param executors_with_info: the active executors of the controller with their current info
+        """
+        for executor, executor_info in executors_with_info:
+            previous_info = self._executors_info.get(executor)
+            if previous_info is not executor_info:
+                if previous_info is not None:
+                    self._add(previous_info, -1)
+                self._add(executor_info, 1)
+                self._executors_info[executor] = executor_info
+        if len(self._executors_info) > len(executors_with_info):
+            active_executors = {executor for executor, _ in executors_with_info}
+            for executor in [executor for executor in self._executors_info if executor not in active_executors]:
+                self._add(self._executors_info.pop(executor), -1)
+        if len(self._executors_info) == 0:
+            # Reset instead of keeping the rounding differences of the subtractions
+            self.unrealized_pnl_quote = Decimal("0")
+            self.realized_pnl_quote = Decimal("0")
+            self.volume_traded = Decimal("0")
+
+    def _add(self, executor_info: ExecutorInfo, sign: int):
+        if not executor_info.is_done:
+            self.unrealized_pnl_quote += sign * executor_info.net_pnl_quote
+        else:
+            self.realized_pnl_quote += sign * executor_info.net_pnl_quote
+            if executor_info.close_type:
+                count = self.close_type_counts.get(executor_info.close_type, 0) + sign
+                if count == 0:
+                    del self.close_type_counts[executor_info.close_type]
+                else:
+                    self.close_type_counts[executor_info.close_type] = count
+        self.volume_traded += sign * executor_info.filled_amount_quote
+
+
 class ExecutorOrchestrator:
     """
     Orchestrator for various executors.
@@ -157,7 +207,12 @@ class ExecutorOrchestrator:
                  strategy: "StrategyV2Base",
                  executors_update_interval: float = 1.0,
                  executors_max_retries: int = 10,
-                 initial_positions_by_controller: Optional[dict] = None):
+                 initial_positions_by_controller: Optional[dict] = None,
+                 runnable_scheduler: Optional[RunnableScheduler] = None):
+        """
+        :param runnable_scheduler: shared scheduler running the control tasks of the executors, None to run each
+        executor in its own control loop
+        """
         self.strategy = strategy
         self.executors_update_interval = executors_update_interval
         self.executors_max_retries = executors_max_retries
@@ -165,7 +220,10 @@ class ExecutorOrchestrator:
         self.positions_held = {}
         self.executors_ids_position_held = deque(maxlen=50)
         self.cached_performance = {}
+        self.executors_performance: Dict[str, ExecutorsPerformance] = {}
         self.initial_positions_by_controller = initial_positions_by_controller or {}
+        self.event_dispatcher = ExecutorEventDispatcher()
+        self.runnable_scheduler = runnable_scheduler
         self._initialize_cached_performance()
 
     def _initialize_cached_performance(self):
@@ -303,6 +361,7 @@ class ExecutorOrchestrator:
             await asyncio.sleep(2.0)
         # Store all positions
         self.store_all_positions()
+        self.event_dispatcher.stop()
         # Clear executors and trigger garbage collection
         self.active_executors.clear()
 
@@ -397,6 +456,8 @@ class ExecutorOrchestrator:
         else:
             raise ValueError("Unsupported executor config type")
 
+        executor.set_event_dispatcher(self.event_dispatcher)
+        executor.set_scheduler(self.runnable_scheduler)
         executor.start()
         self.active_executors[controller_id].append(executor)
         # MarketsRecorder.get_instance().store_or_update_executor(executor)
@@ -538,14 +599,21 @@ class ExecutorOrchestrator:
         """
         Generate a report of all positions held.
         """
+        return {controller_id: [position_summary for _, _, position_summary in positions_with_summary]
+                for controller_id, positions_with_summary in self._get_positions_with_summary().items()}
+
+    def _get_positions_with_summary(self) -> Dict[str, List[Tuple[PositionHold, Decimal, PositionSummary]]]:
+        """
+        Returns the positions held by each controller with the current mid price and the position summary.
+        """
         report = {}
         for controller_id, positions_list in self.positions_held.items():
-            positions_summary = []
+            positions_with_summary = []
             for position in positions_list:
                 mid_price = self.strategy.market_data_provider.get_price_by_type(
                     position.connector_name, position.trading_pair, PriceType.MidPrice)
-                positions_summary.append(position.get_position_summary(mid_price))
-            report[controller_id] = positions_summary
+                positions_with_summary.append((position, mid_price, position.get_position_summary(mid_price)))
+            report[controller_id] = positions_with_summary
         return report
 
     def get_all_reports(self) -> Dict[str, Dict]:
@@ -556,9 +624,9 @@ class ExecutorOrchestrator:
         # Update any pending position holds from done executors
         self._update_positions_from_done_executors()
 
-        # Generate all reports
+        # Generate all reports, reusing the executors info and the position summaries for the performance
         executors_report = self.get_executors_report()
-        positions_report = self.get_positions_report()
+        positions_with_summary = self._get_positions_with_summary()
 
         # Get all controller IDs
         all_controller_ids = set(list(self.active_executors.keys()) +
@@ -569,13 +637,28 @@ class ExecutorOrchestrator:
         return {
             controller_id: {
                 "executors": executors_report.get(controller_id, []),
-                "positions": positions_report.get(controller_id, []),
-                "performance": self.generate_performance_report(controller_id)
+                "positions": [position_summary for _, _, position_summary in
+                              positions_with_summary.get(controller_id, [])],
+                "performance": self.generate_performance_report(
+                    controller_id,
+                    executors_info=executors_report.get(controller_id),
+                    positions_with_summary=positions_with_summary.get(controller_id))
             }
             for controller_id in all_controller_ids
         }
 
-    def generate_performance_report(self, controller_id: str) -> PerformanceReport:
+    def generate_performance_report(
+            self,
+            controller_id: str,
+            executors_info: Optional[List[ExecutorInfo]] = None,
+            positions_with_summary: Optional[List[Tuple[PositionHold, Decimal, PositionSummary]]] = None,
+    ) -> PerformanceReport:
+        """
+        :param controller_id: the controller of the report
+        :param executors_info: the info of the active executors of the controller, if already generated
+        :param positions_with_summary: the positions of the controller with their mid price and summary, if already
+        generated
+        """
         # Create a new report starting from cached base values
         report = PerformanceReport()
         cached_report = self.cached_performance.get(controller_id, PerformanceReport())
@@ -585,33 +668,39 @@ class ExecutorOrchestrator:
         report.volume_traded = cached_report.volume_traded
         report.close_type_counts = cached_report.close_type_counts.copy() if cached_report.close_type_counts else {}
 
-        # Add data from active executors
-        active_executors = self.active_executors.get(controller_id, [])
-        positions = self.positions_held.get(controller_id, [])
-
-        for executor in active_executors:
-            executor_info = executor.executor_info
-            if not executor_info.is_done:
-                report.unrealized_pnl_quote += executor_info.net_pnl_quote
-            else:
-                report.realized_pnl_quote += executor_info.net_pnl_quote
-                if executor_info.close_type:
-                    report.close_type_counts[executor_info.close_type] = report.close_type_counts.get(executor_info.close_type, 0) + 1
-
-            report.volume_traded += executor_info.filled_amount_quote
+        # Add data from active executors, updating the running totals only with the executors that changed
+        active_executors = [executor for executor in self.active_executors.get(controller_id, []) if executor]
+        if executors_info is None:
+            executors_info = [executor.executor_info for executor in active_executors]
+        executors_performance = self.executors_performance.get(controller_id)
+        if executors_performance is None:
+            executors_performance = ExecutorsPerformance()
+            self.executors_performance[controller_id] = executors_performance
+        executors_performance.update(list(zip(active_executors, executors_info)))
+
+        report.unrealized_pnl_quote += executors_performance.unrealized_pnl_quote
+        report.realized_pnl_quote += executors_performance.realized_pnl_quote
+        report.volume_traded += executors_performance.volume_traded
+        for close_type, count in executors_performance.close_type_counts.items():
+            report.close_type_counts[close_type] = report.close_type_counts.get(close_type, 0) + count
 
         # Add data from positions held and collect position summaries
+        if positions_with_summary is None:
+            positions_with_summary = [(position, None, None) for position in self.positions_held.get(controller_id, [])]
         positions_summary = []
-        for position in positions:
+        for position, mid_price, position_summary in positions_with_summary:
             # Skip if the connector/trading pair is not in the current strategy markets
             if (position.connector_name not in self.strategy.markets or
                     position.trading_pair not in self.strategy.markets.get(position.connector_name, set())):
                 self.logger().warning(f"Skipping position in performance report for {position.connector_name}.{position.trading_pair} - "
                                       f"not available in current strategy markets")
                 continue
-            mid_price = self.strategy.market_data_provider.get_price_by_type(
-                position.connector_name, position.trading_pair, PriceType.MidPrice)
-            position_summary = position.get_position_summary(mid_price if not mid_price.is_nan() else Decimal("0"))
+            if mid_price is None:
+                mid_price = self.strategy.market_data_provider.get_price_by_type(
+                    position.connector_name, position.trading_pair, PriceType.MidPrice)
+            # The summary of the positions report is reused unless it was calculated with a NaN mid price
+            if position_summary is None or mid_price.is_nan():
+                position_summary = position.get_position_summary(mid_price if not mid_price.is_nan() else Decimal("0"))
 
             # Update report with position data
             report.realized_pnl_quote += position_summary.realized_pnl_quote - position_summary.cum_fees_quote
@@ -1,8 +1,8 @@
 from decimal import Decimal
 from enum import Enum
-from typing import Literal, Optional
+from typing import Callable, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
@@ -58,6 +58,16 @@ class GridLevel(BaseModel):
     active_close_order: Optional[TrackedOrder] = None
     state: GridLevelStates = GridLevelStates.NOT_ACTIVE
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    # Called every time an active order of the level is set or reset, so that its state is updated
+    _orders_listener: Optional[Callable[["GridLevel"], None]] = PrivateAttr(default=None)
+
+    def set_orders_listener(self, listener: Optional[Callable[["GridLevel"], None]]):
+        self._orders_listener = listener
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ("active_open_order", "active_close_order") and self._orders_listener is not None:
+            self._orders_listener(self)
 
     def update_state(self):
         if self.active_open_order is None:
@@ -1,8 +1,9 @@
 import asyncio
 import logging
 import math
+from bisect import bisect_left, insort
 from decimal import Decimal
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
@@ -59,6 +60,15 @@ class GridExecutor(ExecutorBase):
         # Grid levels
         self.grid_levels = self._generate_grid_levels()
         self.levels_by_state = {state: [] for state in GridLevelStates}
+        # The levels of each state are kept in grid order, updated only for the levels with active orders or whose
+        # orders were set or reset. The not active levels are also kept sorted by price, to select the ones closer to
+        # the mid price without scanning the whole grid.
+        self._indexed_levels_by_state: Optional[Dict[GridLevelStates, List[GridLevel]]] = None
+        self._level_positions: Dict[str, int] = {}
+        self._level_states: Dict[str, GridLevelStates] = {}
+        self._level_positions_by_state: Dict[GridLevelStates, List[int]] = {}
+        self._not_active_levels_by_price: List[Tuple[Decimal, int]] = []
+        self._levels_to_update: Dict[str, GridLevel] = {}
         self._close_order: Optional[TrackedOrder] = None
         self._filled_orders = []
         self._failed_orders = []
@@ -282,11 +292,13 @@ class GridExecutor(ExecutorBase):
         self.close_type = CloseType.POSITION_HOLD if keep_position else CloseType.EARLY_STOP
 
     def update_grid_levels(self):
-        self.levels_by_state = {state: [] for state in GridLevelStates}
-        for level in self.grid_levels:
-            level.update_state()
-            self.levels_by_state[level.state].append(level)
-        completed = self.levels_by_state[GridLevelStates.COMPLETE]
+        if self.levels_by_state is not self._indexed_levels_by_state:
+            self._index_grid_levels()
+        levels_to_update = list(self._levels_to_update.values()) + self._get_levels_with_orders()
+        self._levels_to_update.clear()
+        for level in levels_to_update:
+            self._update_level_state(level)
+        completed = list(self.levels_by_state[GridLevelStates.COMPLETE])
         # Get completed orders and store them in the filled orders list
         for level in completed:
             if level.active_open_order.order.completely_filled_event.is_set() and level.active_close_order.order.completely_filled_event.is_set():
@@ -294,9 +306,62 @@ class GridExecutor(ExecutorBase):
                 close_order = level.active_close_order.order.to_json()
                 self._filled_orders.append(open_order)
                 self._filled_orders.append(close_order)
-                self.levels_by_state[GridLevelStates.COMPLETE].remove(level)
                 level.reset_level()
-                self.levels_by_state[GridLevelStates.NOT_ACTIVE].append(level)
+                self._update_level_state(level)
+                self._levels_to_update.pop(level.id, None)
+
+    def _index_grid_levels(self):
+        """
+        Builds the levels by state from all the grid levels.
+        """
+        self.levels_by_state = {state: [] for state in GridLevelStates}
+        self._indexed_levels_by_state = self.levels_by_state
+        self._level_positions = {level.id: position for position, level in enumerate(self.grid_levels)}
+        self._level_states = {}
+        self._level_positions_by_state = {state: [] for state in GridLevelStates}
+        self._not_active_levels_by_price = []
+        self._levels_to_update = {}
+        for level in self.grid_levels:
+            level.set_orders_listener(self._on_level_orders_changed)
+            level.update_state()
+            self._add_level_to_state(level)
+
+    def _get_levels_with_orders(self) -> List[GridLevel]:
+        return [level for state in (GridLevelStates.OPEN_ORDER_PLACED, GridLevelStates.OPEN_ORDER_FILLED,
+                                    GridLevelStates.CLOSE_ORDER_PLACED, GridLevelStates.COMPLETE)
+                for level in self.levels_by_state[state]]
+
+    def _on_level_orders_changed(self, level: GridLevel):
+        self._levels_to_update[level.id] = level
+
+    def _update_level_state(self, level: GridLevel):
+        level.update_state()
+        if self._level_states.get(level.id) != level.state:
+            self._remove_level_from_state(level)
+            self._add_level_to_state(level)
+
+    def _add_level_to_state(self, level: GridLevel):
+        grid_position = self._level_positions[level.id]
+        positions = self._level_positions_by_state[level.state]
+        index = bisect_left(positions, grid_position)
+        positions.insert(index, grid_position)
+        self.levels_by_state[level.state].insert(index, level)
+        self._level_states[level.id] = level.state
+        if level.state == GridLevelStates.NOT_ACTIVE:
+            insort(self._not_active_levels_by_price, (level.price, grid_position))
+
+    def _remove_level_from_state(self, level: GridLevel):
+        state = self._level_states.pop(level.id, None)
+        if state is None:
+            return
+        grid_position = self._level_positions[level.id]
+        positions = self._level_positions_by_state[state]
+        index = bisect_left(positions, grid_position)
+        del positions[index]
+        del self.levels_by_state[state][index]
+        if state == GridLevelStates.NOT_ACTIVE:
+            del self._not_active_levels_by_price[bisect_left(self._not_active_levels_by_price,
+                                                             (level.price, grid_position))]
 
     async def control_shutdown_process(self):
         """
@@ -482,9 +547,7 @@ class GridExecutor(ExecutorBase):
         if (self.max_open_creation_timestamp > self._strategy.current_timestamp - self.config.order_frequency or
                 n_open_orders >= self.config.max_open_orders):
             return []
-        levels_allowed = self._filter_levels_by_activation_bounds()
-        sorted_levels_by_proximity = self._sort_levels_by_proximity(levels_allowed)
-        return sorted_levels_by_proximity[:self.config.max_orders_per_batch]
+        return self._get_not_active_levels_by_proximity(self.config.max_orders_per_batch)
 
     def get_close_orders_to_create(self):
         """
@@ -539,19 +602,43 @@ class GridExecutor(ExecutorBase):
             return close_orders_to_cancel
         return []
 
-    def _filter_levels_by_activation_bounds(self):
-        not_active_levels = self.levels_by_state[GridLevelStates.NOT_ACTIVE]
+    def _get_not_active_levels_by_proximity(self, max_levels: Optional[int] = None) -> List[GridLevel]:
+        """
+        Returns the not active levels within the activation bounds, sorted by their distance to the mid price. The
+        levels are taken walking the price sorted not active levels from the mid price outwards.
+
+        :param max_levels: The maximum number of levels to return, None to return all of them.
+        """
+        not_active_levels = self._not_active_levels_by_price
+        min_price = max_price = None
         if self.config.activation_bounds:
             if self.config.side == TradeType.BUY:
-                activation_bounds_price = self.mid_price * (1 - self.config.activation_bounds)
-                return [level for level in not_active_levels if level.price >= activation_bounds_price]
+                min_price = self.mid_price * (1 - self.config.activation_bounds)
             else:
-                activation_bounds_price = self.mid_price * (1 + self.config.activation_bounds)
-                return [level for level in not_active_levels if level.price <= activation_bounds_price]
-        return not_active_levels
-
-    def _sort_levels_by_proximity(self, levels: List[GridLevel]):
-        return sorted(levels, key=lambda level: abs(level.price - self.mid_price))
+                max_price = self.mid_price * (1 + self.config.activation_bounds)
+        lower = bisect_left(not_active_levels, (self.mid_price,)) - 1
+        upper = lower + 1
+        levels = []
+        while max_levels is None or len(levels) < max_levels:
+            lower_valid = lower >= 0 and (min_price is None or not_active_levels[lower][0] >= min_price)
+            upper_valid = upper < len(not_active_levels) and (max_price is None or
+                                                              not_active_levels[upper][0] <= max_price)
+            if not lower_valid and not upper_valid:
+                break
+            if lower_valid and upper_valid:
+                lower_price, lower_position = not_active_levels[lower]
+                upper_price, upper_position = not_active_levels[upper]
+                take_lower = ((self.mid_price - lower_price, lower_position) <
+                              (upper_price - self.mid_price, upper_position))
+            else:
+                take_lower = lower_valid
+            if take_lower:
+                levels.append(self.grid_levels[not_active_levels[lower][1]])
+                lower -= 1
+            else:
+                levels.append(self.grid_levels[not_active_levels[upper][1]])
+                upper += 1
+        return levels
 
     def control_triple_barrier(self):
         """
@@ -677,7 +764,7 @@ class GridExecutor(ExecutorBase):
         ])
 
         return {
-            "levels_by_state": {key.name: value for key, value in self.levels_by_state.items()},
+            "levels_by_state": {key.name: list(value) for key, value in self.levels_by_state.items()},
             "filled_orders": self._filled_orders,
             "held_position_orders": self._held_position_orders,
             "held_position_value": held_position_value,
@@ -733,7 +820,7 @@ class GridExecutor(ExecutorBase):
         self.update_grid_levels()
         in_flight_order = self.get_in_flight_order(self.config.connector_name, order_id)
         if in_flight_order:
-            for level in self.grid_levels:
+            for level in self._get_levels_with_orders():
                 if level.active_open_order and level.active_open_order.order_id == order_id:
                     level.active_open_order.order = in_flight_order
                 if level.active_close_order and level.active_close_order.order_id == order_id:
@@ -1,11 +1,15 @@
 import asyncio
 import logging
 from abc import ABC
+from typing import TYPE_CHECKING, Optional
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.models.base import RunnableStatus
 
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
+
 
 class RunnableBase(ABC):
     """
@@ -29,6 +33,14 @@ class RunnableBase(ABC):
         self.update_interval = update_interval
         self._status: RunnableStatus = RunnableStatus.NOT_STARTED
         self.terminated = asyncio.Event()
+        # When set, the scheduler runs the control task instead of the own control loop
+        self._scheduler: Optional["RunnableScheduler"] = None
+
+    def set_scheduler(self, scheduler: Optional["RunnableScheduler"]):
+        """
+        Sets the shared scheduler that runs the control task of the smart component. Must be called before starting it.
+        """
+        self._scheduler = scheduler
 
     @property
     def status(self):
@@ -47,6 +59,12 @@ class RunnableBase(ABC):
         if self._status == RunnableStatus.NOT_STARTED:
             self.terminated.clear()
             self._status = RunnableStatus.RUNNING
+            self._start_control_loop()
+
+    def _start_control_loop(self):
+        if self._scheduler is not None:
+            self._scheduler.add(self)
+        else:
             safe_ensure_future(self.control_loop())
 
     def stop(self):
@@ -70,6 +88,7 @@ class RunnableBase(ABC):
             except Exception as e:
                 self.logger().error(e, exc_info=True)
             finally:
+                self.on_control_task_executed()
                 await asyncio.sleep(self.update_interval)
         self.on_stop()
 
@@ -87,6 +106,13 @@ class RunnableBase(ABC):
         """
         pass
 
+    def on_control_task_executed(self):
+        """
+        Method to be executed after every run of the control task, also when it failed.
+        This method should be overridden in subclasses to provide specific behavior.
+        """
+        pass
+
     async def control_task(self):
         """
         The main task to be executed in the control loop.
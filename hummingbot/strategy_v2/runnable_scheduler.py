@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import math
+import time
+from typing import TYPE_CHECKING, Dict, Optional
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.runnable_base import RunnableBase
+
+
+class RunnableTaskStats:
+    """
+    Durations of the control tasks executed by the scheduler for a runnable.
+    """
+
+    def __init__(self):
+        self.executions_count: int = 0
+        self.last_duration: float = 0.0
+        self.max_duration: float = 0.0
+        self.total_duration: float = 0.0
+        self.deferred_ticks: int = 0
+        self.shed_ticks_count: int = 0
+
+    @property
+    def average_duration(self) -> float:
+        return self.total_duration / self.executions_count if self.executions_count > 0 else 0.0
+
+    def record(self, duration: float):
+        self.executions_count += 1
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+        self.total_duration += duration
+
+
+class _TickGroup:
+    def __init__(self, update_interval: float):
+        self.update_interval = update_interval
+        self.runnables: Dict["RunnableBase", RunnableTaskStats] = {}
+        self.missed_ticks_count: int = 0
+
+
+class RunnableScheduler:
+    """
+    Runs the control tasks of many runnables from a single loop per update interval, instead of one control loop with
+    its own sleep per runnable. The runnables sharing an update interval are executed together at ticks aligned to the
+    interval, so that their timing does not drift.
+    The duration of each control task is measured, and the runnables whose control task takes longer than
+    max_task_duration are deferred for as many ticks as intervals it took, reducing their rate to one they can keep.
+    """
+    _logger = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, max_task_duration: Optional[float] = None):
+        """
+        :param max_task_duration: duration in seconds above which a runnable is deferred, None to never defer them
+        """
+        self._max_task_duration = max_task_duration
+        self._groups: Dict[float, _TickGroup] = {}
+        self._group_tasks: Dict[float, asyncio.Task] = {}
+
+    @property
+    def runnables_count(self) -> int:
+        return sum(len(group.runnables) for group in self._groups.values())
+
+    def task_stats(self, runnable: "RunnableBase") -> Optional[RunnableTaskStats]:
+        group = self._groups.get(runnable.update_interval)
+        return group.runnables.get(runnable) if group is not None else None
+
+    def missed_ticks_count(self, update_interval: float) -> int:
+        group = self._groups.get(update_interval)
+        return group.missed_ticks_count if group is not None else 0
+
+    def add(self, runnable: "RunnableBase"):
+        """
+        Starts running the control task of the runnable, after its on_start, until it is terminated.
+        """
+        safe_ensure_future(self._start_runnable(runnable))
+
+    def stop(self):
+        """
+        Stops running the control tasks. The runnables already terminated are stopped as in their own control loop.
+        """
+        for group in self._groups.values():
+            for runnable in group.runnables:
+                if runnable.terminated.is_set():
+                    runnable.on_stop()
+        for task in self._group_tasks.values():
+            task.cancel()
+        self._group_tasks.clear()
+        self._groups.clear()
+
+    async def _start_runnable(self, runnable: "RunnableBase"):
+        await runnable.on_start()
+        if runnable.terminated.is_set():
+            runnable.on_stop()
+            return
+        group = self._groups.get(runnable.update_interval)
+        if group is None:
+            group = _TickGroup(runnable.update_interval)
+            self._groups[runnable.update_interval] = group
+            self._group_tasks[runnable.update_interval] = safe_ensure_future(self._run_group(group))
+        group.runnables.setdefault(runnable, RunnableTaskStats())
+
+    async def _run_group(self, group: _TickGroup):
+        next_tick = time.monotonic()
+        while len(group.runnables) > 0:
+            due_runnables = []
+            for runnable, stats in list(group.runnables.items()):
+                if runnable.terminated.is_set():
+                    del group.runnables[runnable]
+                    runnable.on_stop()
+                elif stats.deferred_ticks > 0:
+                    stats.deferred_ticks -= 1
+                    stats.shed_ticks_count += 1
+                else:
+                    due_runnables.append((runnable, stats))
+            if len(due_runnables) > 0:
+                await asyncio.gather(*[self._run_control_task(runnable, stats, group.update_interval)
+                                       for runnable, stats in due_runnables])
+
+            next_tick += group.update_interval
+            now = time.monotonic()
+            if next_tick < now:
+                # The tick took longer than the interval, skip the ticks already missed to keep the alignment
+                missed_ticks = math.ceil((now - next_tick) / group.update_interval)
+                group.missed_ticks_count += missed_ticks
+                next_tick += missed_ticks * group.update_interval
+            await asyncio.sleep(next_tick - now)
+        del self._groups[group.update_interval]
+        del self._group_tasks[group.update_interval]
+
+    async def _run_control_task(self, runnable: "RunnableBase", stats: RunnableTaskStats, update_interval: float):
+        start = time.perf_counter()
+        try:
+            await runnable.control_task()
+        except Exception as e:
+            runnable.logger().error(e, exc_info=True)
+        finally:
+            runnable.on_control_task_executed()
+        duration = time.perf_counter() - start
+        stats.record(duration)
+        if self._max_task_duration is not None and duration > self._max_task_duration:
+            stats.deferred_ticks = math.ceil(duration / update_interval)
+            self.logger().warning(f"Control task of {type(runnable).__name__} took {duration:.3f}s, deferring it "
+                                  f"{stats.deferred_ticks} ticks.")
@@ -56,7 +56,7 @@ def main():
         "async-timeout>=4.0.2,<5",
         "bidict>=0.22.1",
         "bip-utils",
-        "cachetools>=5.3.1",
+        "cachetools>=5.4.0",
         "commlib-py>=0.11",
         "cryptography>=41.0.2",
         "eth-account>=0.13.0",
@@ -0,0 +1,35 @@
+"""
+Compares the time per candle of the fast backtesting loop over 1M synthetic candles against the row iteration over
+20k candles. Not part of the unit tests, run it with:
+
+    python -m test.benchmarks.backtesting_fast_mode_benchmark
+"""
+import asyncio
+import time
+from test.hummingbot.strategy_v2.backtesting.test_backtesting_engine_base import BacktestingEngineBaseTests
+
+FAST_CANDLES = 1_000_000
+ROW_CANDLES = 20_000
+
+
+async def main():
+    tests = BacktestingEngineBaseTests()
+    candles = tests._candles(FAST_CANDLES)
+    entry_timestamps = [candles["timestamp"].iloc[i] for i in range(0, FAST_CANDLES, 100_000)]
+
+    engine = tests._engine(candles.iloc[:ROW_CANDLES].reset_index(drop=True), entry_timestamps[:1])
+    start = time.perf_counter()
+    await engine.simulate_execution(trade_cost=0.0006)
+    rows_elapsed = time.perf_counter() - start
+
+    fast_engine = tests._engine(candles, entry_timestamps)
+    start = time.perf_counter()
+    await fast_engine.simulate_execution_fast(trade_cost=0.0006, processed_data_columns=["close"])
+    fast_elapsed = time.perf_counter() - start
+
+    print(f"Row iteration: {rows_elapsed * 1e6 / ROW_CANDLES:.2f} us/candle ({ROW_CANDLES} candles)")
+    print(f"Fast mode:     {fast_elapsed * 1e6 / FAST_CANDLES:.2f} us/candle ({FAST_CANDLES} candles)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
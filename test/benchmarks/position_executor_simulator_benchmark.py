@@ -0,0 +1,41 @@
+"""
+Compares the array and the data frame position executor simulators for a take profit hit in the first candles of a
+500k candles data frame. Not part of the unit tests, run it with:
+
+    python -m test.benchmarks.position_executor_simulator_benchmark
+"""
+import time
+from decimal import Decimal
+from test.hummingbot.strategy_v2.backtesting.executors_simulator.test_position_executor_simulator import (
+    ArrayPositionExecutorSimulatorTests,
+)
+
+from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import (
+    ArrayPositionExecutorSimulator,
+    PositionExecutorSimulator,
+)
+from hummingbot.strategy_v2.backtesting.market_data_arrays import MarketDataArrays
+
+CANDLES = 500_000
+
+
+def main():
+    tests = ArrayPositionExecutorSimulatorTests()
+    tests.df = tests._candles(size=CANDLES, seed=5)
+    config = tests._config(take_profit=Decimal("0.001"), stop_loss=Decimal("0.05"))
+
+    start = time.perf_counter()
+    PositionExecutorSimulator().simulate(tests.df, config, trade_cost=0.0006)
+    dataframe_elapsed = time.perf_counter() - start
+
+    market_data = MarketDataArrays(tests.df)
+    start = time.perf_counter()
+    ArrayPositionExecutorSimulator().simulate_from_arrays(market_data, 0, config, trade_cost=0.0006)
+    array_elapsed = time.perf_counter() - start
+
+    print(f"Data frame simulator: {dataframe_elapsed * 1e3:.2f} ms ({CANDLES} candles)")
+    print(f"Array simulator:      {array_elapsed * 1e3:.2f} ms ({CANDLES} candles)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Compares the capacity checks of AsyncThrottler and SlidingWindowThrottler with 10k outstanding task logs spread
+across 100 limits, checked against one of them. Not part of the unit tests, run it with:
+
+    python -m test.benchmarks.sliding_window_throttler_benchmark
+"""
+import time
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
+
+ITERATIONS = 20
+
+
+def main():
+    rate_limits = [RateLimit(limit_id=f"limit_{i}", limit=1000, time_interval=60) for i in range(100)]
+    now = time.time()
+
+    throttler = AsyncThrottler(rate_limits=rate_limits)
+    sliding_window_throttler = SlidingWindowThrottler(rate_limits=rate_limits)
+    for i in range(10_000):
+        throttler._task_logs.append(TaskLog(timestamp=now, rate_limit=throttler._rate_limits[i % 100], weight=1))
+        sliding_window_throttler._window_for(sliding_window_throttler._rate_limits[i % 100]).record(now, 1)
+
+    for name, context in (("AsyncThrottler", throttler.execute_task(limit_id="limit_0")),
+                          ("SlidingWindowThrottler", sliding_window_throttler.execute_task(limit_id="limit_0"))):
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            context.flush()
+            context.within_capacity()
+        elapsed = time.perf_counter() - start
+        print(f"{name}: {elapsed * 1e6 / ITERATIONS:.2f} us per capacity check")
+
+
+if __name__ == "__main__":
+    main()
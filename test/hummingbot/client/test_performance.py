@@ -1,11 +1,12 @@
 import asyncio
+import json
 import time
 import unittest
 from decimal import Decimal
 from typing import Awaitable
 from unittest.mock import MagicMock, patch
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceMetrics, PerformanceMetricsAccumulator
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
@@ -24,8 +25,9 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         RateOracle._shared_instance = None
         super().tearDown()
 
-    def mock_trade(self, id, amount, price, position="OPEN", type="BUY", fee=None):
+    def mock_trade(self, id, amount, price, position="OPEN", type="BUY", fee=None, timestamp=1):
         trade = MagicMock()
+        trade.timestamp = timestamp
         trade.order_id = id
         trade.position = position
         trade.trade_type = type
@@ -36,6 +38,38 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
 
         return trade
 
+    def trade_fill(self, order_id, exchange_trade_id, trade_type, position, price, amount, timestamp=1, fee=None):
+        fee = fee or AddedToCostTradeFee(percent=Decimal("0.001"), flat_fees=[TokenAmount("BNB", Decimal("0.01"))])
+        return TradeFill(
+            config_file_path="some-strategy.yml",
+            strategy="pure_market_making",
+            market="binance_perpetual",
+            symbol=trading_pair,
+            base_asset=base,
+            quote_asset=quote,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=Decimal(price),
+            amount=Decimal(amount),
+            trade_fee=fee.to_json(),
+            exchange_trade_id=exchange_trade_id,
+            position=position,
+        )
+
+    def derivative_trade_fills(self):
+        return [
+            self.trade_fill("order1", "fill1", "BUY", "OPEN", "10", "60", timestamp=1),
+            self.trade_fill("order2", "fill2", "SELL", "OPEN", "12", "50", timestamp=2),
+            self.trade_fill("order1", "fill3", "BUY", "OPEN", "11", "40", timestamp=3),
+            self.trade_fill("order3", "fill4", "SELL", "CLOSE", "13", "100", timestamp=4),
+            self.trade_fill("order4", "fill5", "BUY", "OPEN", "9", "20", timestamp=5),
+            self.trade_fill("order5", "fill6", "BUY", "CLOSE", "11", "30", timestamp=6),
+            self.trade_fill("order5", "fill7", "BUY", "CLOSE", "10", "20", timestamp=6),
+            self.trade_fill("order6", "fill8", "SELL", "CLOSE", "8", "20", timestamp=7),
+        ]
+
     def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
         ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
         return ret
@@ -341,3 +375,125 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         performance_metric = PerformanceMetrics()
         returned_impact = performance_metric._process_deducted_fees_impact_in_quote_vol(dummy_trade)
         self.assertEqual(returned_impact, Decimal("-100.0"))
+
+    def test_accumulator_matches_positions_like_full_pairing(self):
+        trades = self.derivative_trade_fills()
+        accumulator = PerformanceMetricsAccumulator(trading_pair)
+        accumulator.add_trades(trades)
+
+        buys = [t for t in trades if t.trade_type == "BUY"]
+        sells = [t for t in trades if t.trade_type == "SELL"]
+        buys, sells = PerformanceMetrics.aggregate_position_order(
+            [MagicMock(order_id=t.order_id, position=t.position, price=t.price, amount=t.amount) for t in buys],
+            [MagicMock(order_id=t.order_id, position=t.position, price=t.price, amount=t.amount) for t in sells])
+        long, short = [], []
+        while True:
+            lng = PerformanceMetrics.position_order(buys, sells)
+            if lng is not None:
+                long.append(lng)
+            sht = PerformanceMetrics.position_order(sells, buys)
+            if sht is not None:
+                short.append(sht)
+            if lng is None and sht is None:
+                break
+        expected_pnl = Decimal(str(sum(PerformanceMetrics.derivative_pnl(long, short))))
+
+        self.assertTrue(accumulator.are_derivatives)
+        # Long: (13 - 10.5) * 100 + (8 - 9) * 20, short: (12 - 10.5) * 50
+        self.assertEqual(Decimal("305"), expected_pnl)
+        self.assertEqual(expected_pnl, accumulator.positions_pnl)
+
+    def test_accumulator_metrics(self):
+        RateOracle._shared_instance = RateOracle()
+        RateOracle.get_instance()._prices["BNB-USDT"] = Decimal("100")
+        RateOracle.get_instance()._prices[trading_pair] = Decimal("8")
+        trades = self.derivative_trade_fills()
+
+        metrics = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades, {quote: Decimal("1000")}))
+
+        self.assertEqual(5, metrics.num_buys)
+        self.assertEqual(3, metrics.num_sells)
+        self.assertEqual(Decimal("170"), metrics.b_vol_base)
+        self.assertEqual(Decimal("-170"), metrics.s_vol_base)
+        self.assertEqual(Decimal("-1750"), metrics.b_vol_quote)
+        self.assertEqual(Decimal("2060"), metrics.s_vol_quote)
+        self.assertEqual(Decimal("10"), metrics.start_price)
+        self.assertEqual(Decimal("8"), metrics.cur_price)
+        self.assertEqual(Decimal("305"), metrics.trade_pnl)
+        expected_fees = (Decimal("1750") + Decimal("2060")) * Decimal("0.001") + 8 * Decimal("0.01") * 100
+        self.assertEqual(expected_fees, metrics.fee_in_quote)
+        self.assertEqual(Decimal("305") - expected_fees, metrics.total_pnl)
+
+    def test_accumulator_without_positions_uses_value_difference(self):
+        RateOracle._shared_instance = RateOracle()
+        RateOracle.get_instance()._prices["BNB-USDT"] = Decimal("100")
+        RateOracle.get_instance()._prices[trading_pair] = Decimal("120")
+        trades = [
+            self.trade_fill("order1", "fill1", "BUY", PositionAction.NIL.value, "100", "10"),
+            self.trade_fill("order2", "fill2", "SELL", PositionAction.NIL.value, "120", "15"),
+        ]
+        accumulator = PerformanceMetricsAccumulator(trading_pair)
+        accumulator.add_trades(trades)
+
+        self.assertFalse(accumulator.are_derivatives)
+        metrics = self.async_run_with_timeout(accumulator.metrics({base: Decimal("100"), quote: Decimal("10000")}))
+        self.assertEqual(Decimal("200"), metrics.trade_pnl)
+
+    def test_accumulator_ingests_trade_fills_once(self):
+        RateOracle._shared_instance = RateOracle()
+        RateOracle.get_instance()._prices["BNB-USDT"] = Decimal("100")
+        RateOracle.get_instance()._prices[trading_pair] = Decimal("8")
+        trades = self.derivative_trade_fills()
+        accumulator = PerformanceMetricsAccumulator(trading_pair)
+
+        self.assertEqual(6, accumulator.add_trade_fills(trades[:6]))
+        # The fills already ingested are read again with the new ones
+        self.assertEqual(2, accumulator.add_trade_fills(trades))
+        self.assertEqual(0, accumulator.add_trade_fills(trades))
+
+        full_metrics = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades, {}))
+        metrics = self.async_run_with_timeout(
+            PerformanceMetrics.create(trading_pair, trades, {}, accumulator=accumulator))
+        self.assertEqual(8, metrics.num_trades)
+        self.assertEqual(full_metrics.trade_pnl, metrics.trade_pnl)
+        self.assertEqual(full_metrics.tot_vol_quote, metrics.tot_vol_quote)
+        self.assertEqual(full_metrics.fees, metrics.fees)
+
+    def test_accumulator_ingests_trade_fills_recorded_late(self):
+        trades = self.derivative_trade_fills()
+        full_accumulator = PerformanceMetricsAccumulator(trading_pair)
+        full_accumulator.add_trade_fills(trades)
+        accumulator = PerformanceMetricsAccumulator(trading_pair)
+
+        # The fill with timestamp 5 is recorded after the ones with a later timestamp were ingested
+        self.assertEqual(7, accumulator.add_trade_fills(trades[:4] + trades[5:]))
+        self.assertEqual(1, accumulator.add_trade_fills(trades))
+        self.assertEqual(0, accumulator.add_trade_fills(trades))
+
+        self.assertEqual(8, accumulator.num_trades)
+        self.assertEqual(full_accumulator.b_vol_base, accumulator.b_vol_base)
+        self.assertEqual(full_accumulator.s_vol_quote, accumulator.s_vol_quote)
+
+    def test_accumulator_prices_follow_trade_timestamps(self):
+        trades = self.derivative_trade_fills()
+        accumulator = PerformanceMetricsAccumulator(trading_pair)
+
+        # The first and the last fills are recorded after the others
+        accumulator.add_trade_fills(trades[1:-1])
+        accumulator.add_trade_fills(trades)
+
+        self.assertEqual(Decimal("10"), accumulator.start_price)
+        self.assertEqual(Decimal("8"), accumulator.last_price)
+
+    def test_accumulator_state_round_trip(self):
+        trades = self.derivative_trade_fills()
+        accumulator = PerformanceMetricsAccumulator(trading_pair)
+        accumulator.add_trade_fills(trades[:5])
+
+        restored = PerformanceMetricsAccumulator.from_json(json.loads(json.dumps(accumulator.to_json())))
+        self.assertEqual(accumulator.to_json(), restored.to_json())
+
+        accumulator.add_trade_fills(trades)
+        self.assertEqual(3, restored.add_trade_fills(trades))
+        self.assertEqual(accumulator.to_json(), restored.to_json())
+        self.assertEqual(Decimal("305"), restored.positions_pnl)
@@ -14,7 +14,8 @@ from hummingbot.connector.exchange.binance.binance_api_order_book_data_source im
 from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookMessageDispatcher, OrderBookTracker
 
 
 class BinanceAPIOrderBookDataSourceUnitTests(IsolatedAsyncioWrapperTestCase):
@@ -152,6 +153,52 @@ class BinanceAPIOrderBookDataSourceUnitTests(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(12, asks[0].amount)
         self.assertEqual(expected_update_id, asks[0].update_id)
 
+    @aioresponses()
+    async def test_get_order_book_snapshot_message(self, mock_api):
+        url = web_utils.public_rest_url(path_url=CONSTANTS.SNAPSHOT_PATH_URL, domain=self.domain)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        resp = self._snapshot_response()
+        mock_api.get(regex_url, body=json.dumps(resp))
+
+        snapshot_message: OrderBookMessage = await self.data_source.get_order_book_snapshot_message(self.trading_pair)
+
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, snapshot_message.type)
+        self.assertEqual(self.trading_pair, snapshot_message.trading_pair)
+        self.assertEqual(resp["lastUpdateId"], snapshot_message.update_id)
+
+    @aioresponses()
+    async def test_order_book_tracker_routes_diffs_per_pair(self, mock_api):
+        url = web_utils.public_rest_url(path_url=CONSTANTS.SNAPSHOT_PATH_URL, domain=self.domain)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.get(regex_url, body=json.dumps(self._snapshot_response()))
+        self.connector._set_order_book_tracker(OrderBookTracker(
+            data_source=self.data_source,
+            trading_pairs=[self.trading_pair],
+            domain=self.domain,
+            per_pair_routing=BinanceExchange.ORDER_BOOK_PER_PAIR_ROUTING))
+        tracker = self.connector.order_book_tracker
+        with patch.object(OrderBookTracker, "_sleep", AsyncMock()):
+            await tracker._init_order_books()
+
+        diff_event = self._order_diff_event()
+        diff_event["U"] = 1027025
+        diff_event["u"] = 1027026
+        mock_queue = AsyncMock()
+        mock_queue.get.side_effect = [diff_event, asyncio.CancelledError()]
+        self.data_source._message_queue[CONSTANTS.DIFF_EVENT_TYPE] = mock_queue
+        try:
+            await self.data_source.listen_for_order_book_diffs(
+                self.local_event_loop, OrderBookMessageDispatcher(tracker._dispatch_diff_message))
+        except asyncio.CancelledError:
+            pass
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        order_book: OrderBook = tracker.order_books[self.trading_pair]
+        self.assertEqual(diff_event["u"], order_book.last_diff_uid)
+        self.assertEqual(1, tracker.pair_queues_stats()[self.trading_pair]["applies"])
+        tracker.stop()
+
     @aioresponses()
     async def test_get_new_order_book_raises_exception(self, mock_api):
         url = web_utils.public_rest_url(path_url=CONSTANTS.SNAPSHOT_PATH_URL, domain=self.domain)
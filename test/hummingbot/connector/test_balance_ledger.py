@@ -0,0 +1,69 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.connector.balance_ledger import BalanceLedger
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+
+
+class BalanceLedgerTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ledger = BalanceLedger()
+
+    def order(self, client_order_id: str, trade_type: TradeType, price: str, amount: str) -> InFlightOrder:
+        return InFlightOrder(
+            client_order_id=client_order_id,
+            trading_pair="COINALPHA-HBOT",
+            order_type=OrderType.LIMIT,
+            trade_type=trade_type,
+            amount=Decimal(amount),
+            price=Decimal(price),
+            creation_timestamp=1640000000,
+            initial_state=OrderState.OPEN,
+        )
+
+    def test_locked_balances_of_buy_and_sell_orders(self):
+        self.ledger.update_order(self.order("OID1", TradeType.BUY, "100", "1"))
+        self.ledger.update_order(self.order("OID2", TradeType.BUY, "100", "2"))
+        self.ledger.update_order(self.order("OID3", TradeType.SELL, "110", "1.5"))
+
+        balances = self.ledger.locked_balances(fee_pct=Decimal("0.01"))
+
+        self.assertEqual(Decimal("303"), balances["HBOT"])
+        self.assertEqual(Decimal("1.5"), balances["COINALPHA"])
+
+    def test_partially_filled_and_finished_orders(self):
+        order = self.order("OID1", TradeType.SELL, "100", "2")
+        self.ledger.update_order(order)
+        self.ledger.update_order(self.order("OID2", TradeType.SELL, "100", "1"))
+
+        order.executed_amount_base = Decimal("0.5")
+        self.ledger.update_order(order)
+        self.assertEqual(Decimal("2.5"), self.ledger.locked_balances(fee_pct=Decimal("0"))["COINALPHA"])
+
+        order.current_state = OrderState.CANCELED
+        self.ledger.update_order(order)
+        self.ledger.remove_order("OID2")
+        self.assertEqual({}, self.ledger.locked_balances(fee_pct=Decimal("0")))
+
+    def test_filled_balances_since_timestamp(self):
+        self.ledger.record_fill(1640000001, "COINALPHA-HBOT", TradeType.BUY, Decimal("10"), Decimal("2"))
+        self.ledger.record_fill(1640000003, "COINALPHA-HBOT", TradeType.SELL, Decimal("11"), Decimal("1"))
+        self.ledger.record_fill(1640000002, "WETH-HBOT", TradeType.BUY, Decimal("100"), Decimal("1"))
+
+        self.assertEqual(
+            {"COINALPHA": Decimal("1"), "HBOT": Decimal("-109"), "WETH": Decimal("1")},
+            self.ledger.filled_balances())
+        self.assertEqual(
+            {"COINALPHA": Decimal("-1"), "HBOT": Decimal("11")},
+            self.ledger.filled_balances(starting_timestamp=1640000002))
+        self.assertEqual({}, self.ledger.filled_balances(starting_timestamp=1640000003))
+
+        # A fill previous to the last queried timestamp is only included in the earlier queries
+        self.ledger.record_fill(1640000000, "COINALPHA-HBOT", TradeType.BUY, Decimal("10"), Decimal("1"))
+        self.assertEqual({}, self.ledger.filled_balances(starting_timestamp=1640000003))
+        self.assertEqual(
+            {"COINALPHA": Decimal("2"), "HBOT": Decimal("-119"), "WETH": Decimal("1")},
+            self.ledger.filled_balances(starting_timestamp=0))
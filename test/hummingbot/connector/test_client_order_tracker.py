@@ -1,7 +1,7 @@
 import asyncio
 import unittest
 from decimal import Decimal
-from typing import Awaitable, Dict
+from typing import Awaitable, Dict, Optional
 from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -1132,3 +1132,93 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.tracker.lost_order_count_limit = 2
 
         self.assertEqual(2, self.tracker.lost_order_count_limit)
+
+    def _create_order(self, client_order_id: str, exchange_order_id: Optional[str] = None) -> InFlightOrder:
+        return InFlightOrder(
+            client_order_id=client_order_id,
+            exchange_order_id=exchange_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+
+    def test_order_indexes_follow_state_transitions(self):
+        active_order = self._create_order("OID1", "EOID1")
+        cached_order = self._create_order("OID2", "EOID2")
+        lost_order = self._create_order("OID3", "EOID3")
+        for order in (active_order, cached_order, lost_order):
+            self.tracker.start_tracking_order(order)
+        self.tracker.stop_tracking_order(cached_order.client_order_id)
+        del self.tracker._in_flight_orders[lost_order.client_order_id]
+        self.tracker._lost_orders[lost_order.client_order_id] = lost_order
+
+        self.assertEqual({"OID1": active_order, "OID2": cached_order}, dict(self.tracker.all_orders))
+        self.assertEqual({"OID2": cached_order}, dict(self.tracker.cached_orders))
+        self.assertEqual(
+            {"OID1": active_order, "OID2": cached_order, "OID3": lost_order}, dict(self.tracker.all_fillable_orders))
+        self.assertEqual({"OID1": active_order, "OID3": lost_order}, dict(self.tracker.all_updatable_orders))
+        self.assertEqual(
+            {"EOID1": active_order, "EOID2": cached_order, "EOID3": lost_order},
+            dict(self.tracker.all_fillable_orders_by_exchange_order_id))
+        self.assertEqual(
+            {"EOID1": active_order, "EOID3": lost_order},
+            dict(self.tracker.all_updatable_orders_by_exchange_order_id))
+
+        self.tracker._lost_orders.pop(lost_order.client_order_id)
+        self.tracker._cached_orders.clear()
+
+        self.assertEqual({"EOID1": active_order}, dict(self.tracker.all_fillable_orders_by_exchange_order_id))
+        self.assertEqual({"OID1": active_order}, dict(self.tracker.all_fillable_orders))
+
+    def test_order_indexes_are_read_only_views(self):
+        order = self._create_order("OID1", "EOID1")
+        fillable_orders = self.tracker.all_fillable_orders
+        active_orders = self.tracker.active_orders
+        self.tracker.start_tracking_order(order)
+
+        self.assertEqual({"OID1": order}, dict(fillable_orders))
+        self.assertEqual({"OID1": order}, dict(active_orders))
+        with self.assertRaises(TypeError):
+            fillable_orders["OID2"] = order
+        with self.assertRaises(TypeError):
+            active_orders["OID2"] = order
+
+    def test_fetch_fillable_order(self):
+        active_order = self._create_order("OID1", "EOID1")
+        lost_order = self._create_order("OID2", "EOID2")
+        self.tracker.start_tracking_order(active_order)
+        self.tracker._lost_orders[lost_order.client_order_id] = lost_order
+
+        self.assertEqual(active_order, self.tracker.fetch_fillable_order(client_order_id="OID1"))
+        self.assertEqual(lost_order, self.tracker.fetch_fillable_order(exchange_order_id="EOID2"))
+        self.assertIsNone(self.tracker.fetch_fillable_order(client_order_id="OID3", exchange_order_id="EOID3"))
+
+    def test_exchange_order_id_assigned_after_tracking_is_indexed(self):
+        order = self._create_order("OID1")
+        self.tracker.start_tracking_order(order)
+        self.assertEqual({}, dict(self.tracker.all_fillable_orders_by_exchange_order_id))
+
+        # Connectors can assign the exchange order id directly to the order
+        order.update_exchange_order_id("EOID1")
+        self.assertEqual({"EOID1": order}, dict(self.tracker.all_fillable_orders_by_exchange_order_id))
+        self.assertEqual(order, self.tracker.fetch_order(exchange_order_id="EOID1"))
+
+        self.tracker.update_exchange_order_id(order.client_order_id, "EOID2")
+        self.assertEqual({"EOID2": order}, dict(self.tracker.all_updatable_orders_by_exchange_order_id))
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="EOID1"))
+
+    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.CACHED_ORDER_TTL", 0.1)
+    def test_expired_cached_orders_are_removed_from_indexes(self):
+        tracker = ClientOrderTracker(self.connector)
+        order = self._create_order("OID1", "EOID1")
+        tracker.start_tracking_order(order)
+        tracker.stop_tracking_order(order.client_order_id)
+        self.assertIn("EOID1", tracker.all_fillable_orders_by_exchange_order_id)
+
+        self.ev_loop.run_until_complete(asyncio.sleep(0.2))
+
+        self.assertNotIn("EOID1", tracker.all_fillable_orders_by_exchange_order_id)
+        self.assertNotIn(order.client_order_id, tracker.all_orders)
@@ -11,6 +11,7 @@ from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent
 
 
 class InFightOrderTest(InFlightOrderBase):
@@ -570,3 +571,56 @@ class ConnectorBaseUnitTest(unittest.TestCase):
                                 + (current_sell_order.executed_amount_quote)
                                 - (extra_fill_event.amount * extra_fill_event.price))
         self.assertEqual(expected_hbot_amount, estimated_hbot_balance)
+
+    def test_balance_ledger_matches_full_recalculation(self):
+        connector = MockTestConnector(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+
+        def create_order(order_id: str, trade_type: TradeType, price: str, amount: str) -> InFlightOrder:
+            return InFlightOrder(
+                client_order_id=order_id,
+                exchange_order_id=f"E{order_id}",
+                trading_pair="COINALPHA-HBOT",
+                order_type=OrderType.LIMIT,
+                trade_type=trade_type,
+                price=Decimal(price),
+                amount=Decimal(amount),
+                creation_timestamp=1640000000
+            )
+
+        # Orders present when the ledger is enabled are seeded into it
+        for order in [create_order("OID1", TradeType.BUY, "900", "1"),
+                      create_order("OID2", TradeType.SELL, "1100", "0.5")]:
+            connector.in_flight_orders[order.client_order_id] = order
+        connector.enable_balance_ledger(consistency_check=True)
+
+        # Orders added and removed later are reported to the ledger
+        new_order = create_order("OID3", TradeType.BUY, "1000", "3")
+        connector.in_flight_orders[new_order.client_order_id] = new_order
+        connector.update_balance_ledger_order(new_order.client_order_id)
+        del connector.in_flight_orders["OID2"]
+        connector.update_balance_ledger_order("OID2")
+
+        fill_event = OrderFilledEvent(
+            timestamp=1640000002,
+            order_id="OID1",
+            trading_pair="COINALPHA-HBOT",
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1050),
+            amount=Decimal(2),
+            trade_fee=AddedToCostTradeFee(),
+        )
+        connector.event_logs.append(fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, fill_event)
+
+        with self.assertNoLogs(level="WARNING"):
+            expected_locked_balances = connector.in_flight_asset_balances(connector.in_flight_orders)
+            self.assertEqual({"HBOT": Decimal("3900")}, expected_locked_balances)
+            self.assertEqual(expected_locked_balances, connector._balance_ledger.locked_balances(Decimal("0")))
+            self.assertEqual(expected_locked_balances, connector._in_flight_orders_locked_balances())
+
+            self.assertEqual(connector.order_filled_balances(1640000000),
+                             connector._balance_ledger.filled_balances(1640000000))
+            self.assertEqual({}, connector._balance_ledger.filled_balances(1640000002))
+            self.assertEqual({"COINALPHA": Decimal("2"), "HBOT": Decimal("-2100")},
+                             connector._order_filled_balances_since(0))
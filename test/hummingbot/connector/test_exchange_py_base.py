@@ -0,0 +1,325 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List
+from unittest.mock import AsyncMock, PropertyMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+s_decimal_NaN = Decimal("nan")
+
+
+class NonceIdBinanceExchange(BinanceExchange):
+    """
+    Connector building its own numeric client order ids in buy and sell
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.last_nonce = 0
+
+    def buy(self, trading_pair: str, amount: Decimal, order_type=OrderType.LIMIT, price: Decimal = s_decimal_NaN,
+            **kwargs) -> str:
+        return self._create_nonce_order(TradeType.BUY, trading_pair, amount, order_type, price, **kwargs)
+
+    def sell(self, trading_pair: str, amount: Decimal, order_type=OrderType.LIMIT, price: Decimal = s_decimal_NaN,
+             **kwargs) -> str:
+        return self._create_nonce_order(TradeType.SELL, trading_pair, amount, order_type, price, **kwargs)
+
+    def _create_nonce_order(self, trade_type: TradeType, trading_pair: str, amount: Decimal, order_type: OrderType,
+                            price: Decimal, **kwargs) -> str:
+        self.last_nonce += 1
+        order_id = str(self.last_nonce)
+        safe_ensure_future(self._create_order(trade_type=trade_type, order_id=order_id, trading_pair=trading_pair,
+                                              amount=amount, order_type=order_type, price=price, **kwargs))
+        return order_id
+
+
+class ExchangePyBaseOrderReconciliationTests(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = BinanceExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+        self.requested_orders: List[str] = []
+        self.concurrent_requests = 0
+        self.max_concurrent_requests = 0
+
+    def track_orders(self, count: int) -> List[InFlightOrder]:
+        for i in range(count):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{i}",
+                exchange_order_id=f"EOID{i}",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10"),
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+            )
+        return list(self.exchange.in_flight_orders.values())
+
+    def order_update(self, order: InFlightOrder, new_state: OrderState = OrderState.OPEN) -> OrderUpdate:
+        return OrderUpdate(
+            trading_pair=order.trading_pair,
+            update_timestamp=1640000000,
+            new_state=new_state,
+            client_order_id=order.client_order_id,
+            exchange_order_id=order.exchange_order_id,
+        )
+
+    def trade_update(self, order: InFlightOrder) -> TradeUpdate:
+        return TradeUpdate(
+            trade_id=f"T{order.client_order_id}",
+            client_order_id=order.client_order_id,
+            exchange_order_id=order.exchange_order_id,
+            trading_pair=order.trading_pair,
+            fill_timestamp=1640000000,
+            fill_price=Decimal("10"),
+            fill_base_amount=Decimal("0.5"),
+            fill_quote_amount=Decimal("5"),
+            fee=AddedToCostTradeFee(),
+        )
+
+    async def request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
+        self.requested_orders.append(tracked_order.client_order_id)
+        self.concurrent_requests += 1
+        self.max_concurrent_requests = max(self.max_concurrent_requests, self.concurrent_requests)
+        await asyncio.sleep(0.01)
+        self.concurrent_requests -= 1
+        return self.order_update(tracked_order)
+
+    async def test_orders_are_updated_one_by_one_by_default(self):
+        orders = self.track_orders(5)
+        self.exchange._request_order_status = self.request_order_status
+
+        await self.exchange._update_orders()
+
+        self.assertEqual(1, self.max_concurrent_requests)
+        self.assertEqual([order.client_order_id for order in orders], self.requested_orders)
+
+    async def test_orders_are_updated_with_bounded_concurrency(self):
+        self.track_orders(20)
+        self.exchange.ORDER_UPDATE_CONCURRENCY = 5
+        self.exchange._request_order_status = self.request_order_status
+        self.exchange._all_trade_updates_for_order = AsyncMock(return_value=[])
+
+        await self.exchange._update_order_status()
+
+        self.assertEqual(5, self.max_concurrent_requests)
+        self.assertEqual(20, len(set(self.requested_orders)))
+        self.assertEqual(20, self.exchange._all_trade_updates_for_order.call_count)
+        self.assertEqual(1, self.exchange.order_update_cycle_durations()["active_orders"].count)
+        self.assertEqual(0, self.exchange.order_update_cycle_durations()["lost_orders"].count)
+
+    async def test_concurrency_is_limited_by_throttler_capacity(self):
+        self.track_orders(10)
+        self.exchange.ORDER_UPDATE_CONCURRENCY = 5
+        self.exchange._request_order_status = self.request_order_status
+        self.exchange._throttler.available_capacity = lambda limit_id: 2
+
+        with patch.object(BinanceExchange, "order_update_rate_limit_id", new_callable=PropertyMock) as limit_id_mock:
+            limit_id_mock.return_value = CONSTANTS.ORDER_PATH_URL
+            await self.exchange._update_orders()
+
+        self.assertEqual(2, self.max_concurrent_requests)
+        self.assertEqual(10, len(self.requested_orders))
+
+    async def test_bulk_open_orders_status_reconciles_reported_orders(self):
+        orders = self.track_orders(4)
+        self.exchange._request_order_status = self.request_order_status
+        self.exchange._request_open_orders_status = AsyncMock(return_value={
+            orders[0].client_order_id: self.order_update(orders[0]),
+            orders[1].client_order_id: self.order_update(orders[1], OrderState.PARTIALLY_FILLED),
+        })
+
+        await self.exchange._update_orders()
+
+        self.exchange._request_open_orders_status.assert_awaited_once_with(orders=orders)
+        self.assertEqual([orders[2].client_order_id, orders[3].client_order_id], self.requested_orders)
+        self.assertEqual(OrderState.PARTIALLY_FILLED, orders[1].current_state)
+
+    async def test_bulk_open_orders_status_failure_falls_back_to_order_requests(self):
+        orders = self.track_orders(3)
+        self.exchange._request_order_status = self.request_order_status
+        self.exchange._request_open_orders_status = AsyncMock(side_effect=IOError("Test error"))
+
+        await self.exchange._update_orders()
+
+        self.assertEqual([order.client_order_id for order in orders], self.requested_orders)
+
+    async def test_bulk_recent_trade_updates_reconcile_all_orders(self):
+        orders = self.track_orders(3)
+        self.exchange._all_trade_updates_for_order = AsyncMock()
+        self.exchange._request_recent_trade_updates = AsyncMock(
+            return_value=[self.trade_update(order) for order in orders])
+
+        await self.exchange._update_orders_fills(orders)
+
+        self.exchange._all_trade_updates_for_order.assert_not_called()
+        for order in orders:
+            self.assertEqual(Decimal("0.5"), order.executed_amount_base)
+
+    async def test_no_bulk_request_without_orders(self):
+        self.exchange._request_recent_trade_updates = AsyncMock()
+        self.exchange._request_open_orders_status = AsyncMock()
+
+        await self.exchange._update_order_status()
+
+        self.exchange._request_recent_trade_updates.assert_not_called()
+        self.exchange._request_open_orders_status.assert_not_called()
+
+
+class ExchangePyBaseOrderBatchingTests(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = BinanceExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+        self.exchange._trading_rules[self.trading_pair] = TradingRule(
+            trading_pair=self.trading_pair,
+            min_order_size=Decimal("0.01"),
+            min_price_increment=Decimal("0.01"),
+            min_base_amount_increment=Decimal("0.01"),
+            min_notional_size=Decimal("1"),
+        )
+        self.exchange._set_current_timestamp(1640000000)
+        self.placed_batches: List[List[str]] = []
+        self.canceled_batches: List[List[str]] = []
+
+    def limit_order(self, price: Decimal, is_buy: bool = True) -> LimitOrder:
+        return LimitOrder(
+            client_order_id="",
+            trading_pair=self.trading_pair,
+            is_buy=is_buy,
+            base_currency="COINALPHA",
+            quote_currency="HBOT",
+            price=price,
+            quantity=Decimal("1"),
+        )
+
+    async def place_order_batch(self, orders: List[InFlightOrder]):
+        self.placed_batches.append([order.client_order_id for order in orders])
+        return [(f"E{order.client_order_id}", 1640000001) for order in orders]
+
+    async def place_cancel_batch(self, orders: List[InFlightOrder]):
+        self.canceled_batches.append([order.client_order_id for order in orders])
+        return [True for _ in orders]
+
+    async def test_orders_created_in_one_tick_are_sent_in_chunked_batches(self):
+        self.exchange.BATCH_ORDER_CREATE_MAX_SIZE = 2
+        self.exchange._place_order_batch = self.place_order_batch
+        self.exchange._place_order = AsyncMock()
+
+        first = self.exchange.batch_order_create([self.limit_order(Decimal("10")), self.limit_order(Decimal("11"))])
+        second = self.exchange.batch_order_create([self.limit_order(Decimal("12"), is_buy=False)])
+        await asyncio.sleep(0.01)
+
+        created_ids = [order.client_order_id for order in first + second]
+        self.assertEqual([created_ids[:2], created_ids[2:]], self.placed_batches)
+        self.exchange._place_order.assert_not_called()
+        for client_order_id in created_ids:
+            order = self.exchange.in_flight_orders[client_order_id]
+            self.assertEqual(OrderState.OPEN, order.current_state)
+            self.assertEqual(f"E{client_order_id}", order.exchange_order_id)
+
+    async def test_batch_creation_maps_rejections_to_orders(self):
+        self.exchange.BATCH_ORDER_CREATE_MAX_SIZE = 5
+        self.exchange._place_order_batch = AsyncMock(
+            side_effect=lambda orders: [("EOID1", 1640000001), IOError("Rejected")])
+        failures = []
+        self.exchange._update_order_after_failure = lambda order_id, trading_pair, exception=None: failures.append(
+            order_id)
+
+        orders = self.exchange.batch_order_create([self.limit_order(Decimal("10")), self.limit_order(Decimal("11"))])
+        await self.exchange._process_order_batches()
+
+        self.assertEqual(OrderState.OPEN, self.exchange.in_flight_orders[orders[0].client_order_id].current_state)
+        self.assertEqual([orders[1].client_order_id], failures)
+
+    async def test_orders_are_created_with_concurrent_single_requests_without_batch_endpoint(self):
+        self.exchange._place_order = AsyncMock(return_value=("EOID", 1640000001))
+        self.exchange._place_order_batch = AsyncMock()
+
+        orders = self.exchange.batch_order_create([self.limit_order(Decimal("10")), self.limit_order(Decimal("11"))])
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(2, self.exchange._place_order.await_count)
+        self.exchange._place_order_batch.assert_not_called()
+        for order in orders:
+            self.assertEqual(OrderState.OPEN, self.exchange.in_flight_orders[order.client_order_id].current_state)
+
+    async def test_orders_are_created_with_connector_buy_and_sell_without_batch_endpoint(self):
+        exchange = NonceIdBinanceExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+        exchange._trading_rules = self.exchange._trading_rules
+        exchange._place_order = AsyncMock(return_value=("EOID", 1640000001))
+
+        orders = exchange.batch_order_create([self.limit_order(Decimal("10")), self.limit_order(Decimal("11"), False)])
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(["1", "2"], [order.client_order_id for order in orders])
+        self.assertEqual(2, exchange._place_order.await_count)
+        self.assertEqual(TradeType.BUY, exchange.in_flight_orders["1"].trade_type)
+        self.assertEqual(TradeType.SELL, exchange.in_flight_orders["2"].trade_type)
+
+    async def test_batch_creation_uses_connector_order_id_and_price(self):
+        self.exchange.BATCH_ORDER_CREATE_MAX_SIZE = 5
+        self.exchange._place_order_batch = self.place_order_batch
+        self.exchange._batch_order_client_order_id = lambda order: f"CUSTOM-{order.price}"
+        self.exchange._batch_order_price = lambda order: order.price - Decimal("1")
+
+        orders = self.exchange.batch_order_create([self.limit_order(Decimal("10")), self.limit_order(Decimal("11"))])
+        await self.exchange._process_order_batches()
+
+        self.assertEqual(["CUSTOM-10", "CUSTOM-11"], [order.client_order_id for order in orders])
+        self.assertEqual([["CUSTOM-10", "CUSTOM-11"]], self.placed_batches)
+        self.assertEqual(Decimal("9"), self.exchange.in_flight_orders["CUSTOM-10"].price)
+        self.assertEqual(Decimal("10"), self.exchange.in_flight_orders["CUSTOM-11"].price)
+
+    async def test_orders_canceled_in_one_tick_are_sent_in_chunked_batches(self):
+        self.exchange.BATCH_ORDER_CANCEL_MAX_SIZE = 2
+        self.exchange._place_cancel_batch = self.place_cancel_batch
+        self.exchange._place_cancel = AsyncMock()
+        orders = []
+        for i in range(3):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{i}",
+                exchange_order_id=f"EOID{i}",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10"),
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+            )
+            orders.append(self.exchange.in_flight_orders[f"OID{i}"].to_limit_order())
+
+        self.exchange.batch_order_cancel(orders)
+        await self.exchange._process_order_batches()
+
+        self.assertEqual([["OID0", "OID1"], ["OID2"]], self.canceled_batches)
+        self.exchange._place_cancel.assert_not_called()
+        for i in range(3):
+            self.assertEqual(OrderState.CANCELED, self.exchange._order_tracker.fetch_order(f"OID{i}").current_state)
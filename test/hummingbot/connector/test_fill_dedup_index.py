@@ -0,0 +1,96 @@
+import unittest
+
+from hummingbot.connector.fill_dedup_index import BloomFilter, ExchangeOrderIdIndex, TradeFillDedupIndex
+from hummingbot.connector.utils import TradeFillOrderDetails
+
+
+class TradeFillDedupIndexTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = 1640000000.0
+
+    def trade_fill(self, trade_id: int) -> TradeFillOrderDetails:
+        return TradeFillOrderDetails("binance", str(trade_id), "COINALPHA-HBOT")
+
+    def test_membership_and_hit_rate(self):
+        index = TradeFillDedupIndex()
+        index.update({self.trade_fill(1), self.trade_fill(2)})
+        index.add(self.trade_fill(3))
+
+        self.assertIn(self.trade_fill(1), index)
+        self.assertIn(self.trade_fill(3), index)
+        self.assertNotIn(self.trade_fill(4), index)
+        self.assertEqual(3, len(index))
+        self.assertEqual(3, index.lookups)
+        self.assertAlmostEqual(2 / 3, index.hit_rate)
+
+    def test_oldest_entries_are_evicted_when_full(self):
+        index = TradeFillDedupIndex(max_entries=2)
+        for trade_id in range(3):
+            index.add(self.trade_fill(trade_id))
+
+        self.assertEqual(2, len(index))
+        self.assertNotIn(self.trade_fill(0), index)
+        self.assertIn(self.trade_fill(2), index)
+        self.assertEqual(1, index.stats()["evictions"])
+
+    def test_entries_are_evicted_when_too_old(self):
+        index = TradeFillDedupIndex(max_age=60, time_provider=lambda: self.now)
+        index.add(self.trade_fill(1))
+        self.now += 30
+        index.add(self.trade_fill(2))
+        self.now += 40
+
+        self.assertNotIn(self.trade_fill(1), index)
+        self.assertIn(self.trade_fill(2), index)
+        self.assertEqual(1, len(index))
+
+    def test_evicted_entries_are_kept_in_bloom_filter(self):
+        index = TradeFillDedupIndex(max_entries=1, bloom_filter_capacity=100)
+        index.add(self.trade_fill(1))
+        index.add(self.trade_fill(2))
+
+        self.assertEqual(1, len(index))
+        self.assertIn(self.trade_fill(1), index)
+
+    def test_warm_start_loads_bloom_filter_only(self):
+        index = TradeFillDedupIndex(bloom_filter_capacity=1000)
+        index.warm_start(self.trade_fill(trade_id) for trade_id in range(500))
+
+        self.assertEqual(0, len(index))
+        self.assertTrue(all(self.trade_fill(trade_id) in index for trade_id in range(500)))
+
+    def test_warm_start_without_bloom_filter_fills_the_index(self):
+        index = TradeFillDedupIndex(max_entries=10)
+        index.warm_start(self.trade_fill(trade_id) for trade_id in range(20))
+
+        self.assertEqual(10, len(index))
+
+
+class ExchangeOrderIdIndexTests(unittest.TestCase):
+
+    def test_mapping_access(self):
+        index = ExchangeOrderIdIndex(max_entries=2)
+        index.update({"EOID1": "OID1", "EOID2": "OID2"})
+        index["EOID3"] = "OID3"
+
+        self.assertEqual(["EOID2", "EOID3"], list(index.keys()))
+        self.assertIsNone(index.get("EOID1"))
+        self.assertEqual("OID2", index.get("EOID2"))
+        self.assertEqual("OID3", index["EOID3"])
+        self.assertIn("EOID3", index)
+        self.assertNotIn("EOID1", index)
+        self.assertEqual(0.5, index.hit_rate)
+
+
+class BloomFilterTests(unittest.TestCase):
+
+    def test_no_false_negatives(self):
+        bloom_filter = BloomFilter(capacity=1000, false_positive_rate=0.01)
+        for i in range(1000):
+            bloom_filter.add(f"item{i}")
+
+        self.assertTrue(all(f"item{i}" in bloom_filter for i in range(1000)))
+        false_positives = sum(f"other{i}" in bloom_filter for i in range(1000))
+        self.assertLess(false_positives, 50)
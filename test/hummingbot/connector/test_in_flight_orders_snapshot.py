@@ -0,0 +1,52 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.connector.in_flight_orders_snapshot import InFlightOrdersSnapshotter
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+
+
+class InFlightOrdersSnapshotterTests(unittest.TestCase):
+
+    def order(self, client_order_id: str) -> InFlightOrder:
+        return InFlightOrder(
+            client_order_id=client_order_id,
+            trading_pair="COINALPHA-HBOT",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1"),
+            price=Decimal("100"),
+            creation_timestamp=1640000000,
+        )
+
+    def test_snapshot_copies_the_orders(self):
+        snapshotter = InFlightOrdersSnapshotter()
+        order = self.order("OID1")
+
+        snapshot = snapshotter.take_snapshot({"OID1": order})
+        order.current_state = OrderState.OPEN
+
+        self.assertIsNot(order, snapshot["OID1"])
+        self.assertEqual(OrderState.PENDING_CREATE, snapshot["OID1"].current_state)
+
+    def test_only_changed_orders_are_copied_again(self):
+        snapshotter = InFlightOrdersSnapshotter()
+        orders = {"OID1": self.order("OID1"), "OID2": self.order("OID2")}
+        first_snapshot = snapshotter.take_snapshot(orders)
+
+        orders["OID2"].executed_amount_base = Decimal("0.5")
+        orders["OID3"] = self.order("OID3")
+        second_snapshot = snapshotter.take_snapshot(orders)
+
+        self.assertIs(first_snapshot["OID1"], second_snapshot["OID1"])
+        self.assertIsNot(first_snapshot["OID2"], second_snapshot["OID2"])
+        self.assertEqual(Decimal("0"), first_snapshot["OID2"].executed_amount_base)
+        self.assertEqual(Decimal("0.5"), second_snapshot["OID2"].executed_amount_base)
+        self.assertEqual(4, snapshotter.copied_orders_count)
+        self.assertEqual(1, snapshotter.reused_orders_count)
+
+    def test_removed_orders_are_not_in_the_snapshot(self):
+        snapshotter = InFlightOrdersSnapshotter()
+        snapshotter.take_snapshot({"OID1": self.order("OID1")})
+
+        self.assertEqual({}, snapshotter.take_snapshot({}))
@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from hummingbot.connector.market_data_snapshots import MarketDataSnapshotBuffer, MarketDataSnapshotStore
+
+
+class MarketDataSnapshotsTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.store = MarketDataSnapshotStore(os.path.join(self.temp_dir.name, "snapshots"))
+
+    @staticmethod
+    def _levels(price: float, count: int) -> np.ndarray:
+        return np.array([[price + i, 1.0] for i in range(count)])
+
+    def _record(self, buffer: MarketDataSnapshotBuffer, timestamps, pairs):
+        for timestamp in timestamps:
+            for exchange, trading_pair in pairs:
+                buffer.append(timestamp=timestamp,
+                              pair_index=self.store.pair_index(exchange, trading_pair),
+                              mid_price=timestamp / 1000,
+                              best_bid=timestamp / 1000 - 1,
+                              best_ask=timestamp / 1000 + 1,
+                              bids=self._levels(timestamp / 1000 - 1, 2),
+                              asks=self._levels(timestamp / 1000 + 1, 3))
+
+    def test_buffer_take_sorts_by_pair_and_timestamp_and_pads_levels(self):
+        buffer = MarketDataSnapshotBuffer(depth=3, capacity=4)
+        self._record(buffer, [1000, 2000], [("binance", "BTC-USDT"), ("binance", "ETH-USDT")])
+
+        self.assertTrue(buffer.is_full)
+        with self.assertRaises(ValueError):
+            buffer.append(3000, 0, 1, 1, 1, self._levels(1, 1), self._levels(1, 1))
+
+        columns = buffer.take()
+
+        self.assertEqual(0, len(buffer))
+        self.assertEqual([1000, 2000, 1000, 2000], columns["timestamp"].tolist())
+        self.assertEqual([0, 0, 1, 1], columns["pair_index"].tolist())
+        self.assertEqual((4, 3, 2), columns["bids"].shape)
+        self.assertTrue(np.isnan(columns["bids"][:, 2]).all())
+        self.assertFalse(np.isnan(columns["asks"]).any())
+
+        buffer.append(3000, 0, 3, 2, 4, self._levels(2, 1), self._levels(4, 1))
+        self.assertTrue(np.isnan(buffer.take()["bids"][0, 1:]).all())
+
+    def test_store_reads_snapshots_by_pair_and_time_range(self):
+        pairs = [("binance", "BTC-USDT"), ("binance", "ETH-USDT"), ("kucoin", "BTC-USDT")]
+        buffer = MarketDataSnapshotBuffer(depth=3, capacity=30)
+        self._record(buffer, [1000, 2000, 3000], pairs)
+        self.store.write_chunk(buffer.take())
+        self._record(buffer, [4000, 5000], pairs)
+        self.store.write_chunk(buffer.take())
+        self.assertIsNone(self.store.write_chunk(buffer.take()))
+
+        self.assertEqual(2, len(os.listdir(self.store.directory)))
+
+        snapshots = self.store.read()
+        self.assertEqual(15, len(snapshots["timestamp"]))
+
+        snapshots = self.store.read(exchange="binance", trading_pair="BTC-USDT", start=2000, end=4000)
+        self.assertEqual([2000, 3000, 4000], snapshots["timestamp"].tolist())
+        self.assertEqual({"binance"}, set(snapshots["exchange"]))
+        self.assertEqual({"BTC-USDT"}, set(snapshots["trading_pair"]))
+        self.assertEqual([2.0, 3.0, 4.0], snapshots["mid_price"].tolist())
+        self.assertEqual([[1.0, 1.0], [2.0, 1.0]], snapshots["bids"][0, :2].tolist())
+
+        snapshots = self.store.read(trading_pair="BTC-USDT", start=4500)
+        self.assertEqual([5000, 5000], snapshots["timestamp"].tolist())
+        self.assertEqual(["binance", "kucoin"], snapshots["exchange"].tolist())
+
+        self.assertEqual({}, self.store.read(exchange="okx"))
+        self.assertEqual({}, self.store.read(end=500))
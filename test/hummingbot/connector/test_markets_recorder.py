@@ -1,4 +1,7 @@
 import asyncio
+import csv
+import os
+import tempfile
 import time
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
@@ -7,6 +10,7 @@ from unittest.mock import MagicMock, PropertyMock, patch
 
 import numpy as np
 from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
 
 from hummingbot.client.config.client_config_map import ClientConfigMap, MarketDataCollectionConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -24,6 +28,7 @@ from hummingbot.core.event.events import (
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.executors import Executors
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.position import Position
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
@@ -92,6 +97,9 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def remove_listener(self, event_tag, listener):
+        pass
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -349,6 +357,48 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(self.config_file_path, trade_fills[0].config_file_path)
         self.assertEqual(fill_event.order_id, trade_fills[0].order_id)
 
+    def test_append_to_csv_keeps_file_open_and_appends_rows(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path="test_config.yml",
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        trades = [TradeFill(config_file_path="test_config.yml",
+                            strategy=self.strategy_name,
+                            market=self.display_name,
+                            symbol=self.trading_pair,
+                            base_asset=self.base,
+                            quote_asset=self.quote,
+                            timestamp=1640001112223,
+                            order_id=f"//OID{i}",
+                            trade_type=TradeType.BUY.name,
+                            order_type=OrderType.LIMIT.name,
+                            price=Decimal(1000),
+                            amount=Decimal(1),
+                            leverage=1,
+                            trade_fee=AddedToCostTradeFee().to_json(),
+                            exchange_trade_id=f"EOID{i}",
+                            position=PositionAction.NIL.value) for i in range(3)]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch("hummingbot.connector.markets_recorder.data_path", return_value=temp_dir):
+                for trade in trades:
+                    recorder.append_to_csv(trade)
+                recorder.stop()
+            with open(os.path.join(temp_dir, "trades_test_config.csv"), newline="") as csv_file:
+                rows = list(csv.reader(csv_file))
+
+        self.assertEqual(4, len(rows))
+        self.assertEqual(TradeFill.attribute_names_for_file_export() + ["age"], rows[0])
+        self.assertEqual(["EOID0", "EOID1", "EOID2"], [row[0] for row in rows[1:]])
+        self.assertEqual("n/a", rows[1][-1])
+
     def test_create_order_and_completed(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -442,6 +492,45 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
 
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder._sleep")
+    def test_market_data_collection_columnar(self, sleep_mock):
+        sleep_mock.side_effect = [0.1, asyncio.CancelledError]
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path="test_config.yml",
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=True,
+                market_data_collection_interval=1,
+                market_data_collection_depth=2,
+                market_data_collection_columnar=True,
+            ),
+        )
+        order_book = OrderBook(dex=False)
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3], [3.5, 1, 3]], dtype=np.float64),
+                                        np.array([[4, 1, 1], [5, 1, 2]], dtype=np.float64))
+        prices = {PriceType.MidPrice: Decimal("3.75"), PriceType.BestBid: Decimal("3.5"), PriceType.BestAsk: Decimal("4")}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch("hummingbot.connector.markets_recorder.data_path", return_value=temp_dir), \
+                    patch.object(self, "get_price_by_type", side_effect=lambda pair, price_type: prices[price_type]), \
+                    patch.object(self, "get_order_book", return_value=order_book):
+                with self.assertRaises(asyncio.CancelledError):
+                    self.async_run_with_timeout(recorder._record_market_data())
+            snapshots = recorder.market_data_snapshot_store.read(exchange=self.display_name,
+                                                                 trading_pair=self.trading_pair)
+            self.assertEqual(os.path.join(temp_dir, "market_data", "test_config"),
+                             recorder.market_data_snapshot_store.directory)
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, session.query(MarketData).count())
+        self.assertEqual(2, len(snapshots["timestamp"]))
+        self.assertEqual([3.75, 3.75], snapshots["mid_price"].tolist())
+        self.assertEqual([[3.5, 1], [3, 1], [2, 1]], snapshots["bids"][0].tolist())
+        self.assertEqual([4, 1], snapshots["asks"][0, 0].tolist())
+        self.assertTrue(np.isnan(snapshots["asks"][0, 2]).all())
+
     def test_store_position(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -970,3 +1059,140 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
         self.assertEqual("integration_test_market", orders[0].market)
         self.assertEqual("BTC-USDT", orders[0].symbol)
         self.assertEqual("NEW_MARKET_OID1", orders[0].id)
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def _write_behind_recorder(self, engine_mock, **kwargs) -> MarketsRecorder:
+        # A single shared connection, so that the writer thread and the test see the same in-memory database
+        engine_mock.return_value = create_engine(
+            "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            write_behind=True,
+            **kwargs,
+        )
+        self.addCleanup(recorder.stop)
+        return recorder
+
+    def _create_event(self, order_id: str) -> BuyOrderCreatedEvent:
+        return BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id=order_id,
+            creation_timestamp=1640001112.223,
+            exchange_order_id=f"E{order_id}",
+        )
+
+    def _fill_event(self, order_id: str) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=order_id,
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1010),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id=f"T{order_id}",
+        )
+
+    def test_write_behind_batches_events_and_updates_reconciliation_sets_immediately(self):
+        recorder = self._write_behind_recorder(write_behind_interval=10)
+        trade_fills = set()
+        exchange_order_ids = {}
+        self.add_trade_fills_from_market_recorder = trade_fills.update
+        self.add_exchange_order_ids_from_market_recorder = exchange_order_ids.update
+
+        for i in range(5):
+            self.tracking_states = {"orders": i}
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_event(f"OID{i}"))
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, self._fill_event(f"OID{i}"))
+            recorder._did_complete_order(MarketEvent.BuyOrderCompleted.value, self, BuyOrderCompletedEvent(
+                timestamp=1642030000, order_id=f"OID{i}", base_asset=self.base, quote_asset=self.quote,
+                base_asset_amount=Decimal(1), quote_asset_amount=Decimal(1010), order_type=OrderType.LIMIT))
+
+        self.assertEqual(5, len(trade_fills))
+        self.assertEqual({f"EOID{i}": f"OID{i}" for i in range(5)}, exchange_order_ids)
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, session.query(Order).count())
+
+        self.assertTrue(recorder.flush(timeout=5))
+
+        with self.manager.get_new_session() as session:
+            orders = session.query(Order).order_by(Order.id).all()
+            statuses = [[status.status for status in order.status] for order in orders]
+            fills_count = session.query(TradeFill).count()
+            market_states = session.query(MarketState).all()
+            saved_state = market_states[0].saved_state
+        stats = recorder.write_behind_stats()
+
+        self.assertEqual(5, len(orders))
+        self.assertEqual(MarketEvent.BuyOrderCompleted.name, orders[0].last_status)
+        self.assertEqual([[MarketEvent.BuyOrderCreated.name, MarketEvent.OrderFilled.name,
+                           MarketEvent.BuyOrderCompleted.name]] * 5, statuses)
+        self.assertEqual(5, fills_count)
+        self.assertEqual(1, len(market_states))
+        self.assertEqual({"orders": 4}, saved_state)
+        self.assertEqual(1, stats["batches"])
+        self.assertEqual(30, stats["enqueued"])
+        self.assertEqual(14, stats["coalesced"])
+        self.assertEqual(16, stats["written"])
+        self.assertEqual(0, stats["errors"])
+        self.assertEqual(0, stats["queue_depth"])
+
+    def test_write_behind_stop_flushes_pending_events(self):
+        recorder = self._write_behind_recorder(write_behind_interval=10)
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_event("OID1"))
+        recorder.stop()
+
+        self.assertFalse(recorder.write_behind)
+        with self.manager.get_new_session() as session:
+            self.assertEqual(["OID1"], [order.id for order in session.query(Order).all()])
+
+        # Once stopped, events are written synchronously
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_event("OID2"))
+        with self.manager.get_new_session() as session:
+            self.assertEqual(2, session.query(Order).count())
+
+    def test_write_behind_retries_failed_batch_one_record_at_a_time(self):
+        recorder = self._write_behind_recorder(write_behind_interval=10)
+
+        def failing_write(session):
+            raise ValueError("Invalid record")
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_event("OID1"))
+        recorder._writer.enqueue(failing_write)
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_event("OID2"))
+        with self.assertLogs("hummingbot.connector.markets_recorder_writer", level="ERROR"):
+            self.assertTrue(recorder.flush(timeout=5))
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(2, session.query(Order).count())
+        self.assertEqual(1, recorder.write_behind_stats()["errors"])
+
+    def test_write_behind_blocks_when_queue_is_full(self):
+        recorder = self._write_behind_recorder(write_behind_interval=0.01, write_behind_queue_size=2)
+
+        for i in range(20):
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_event(f"OID{i}"))
+        recorder.stop()
+
+        stats = recorder.write_behind_stats()
+        with self.manager.get_new_session() as session:
+            self.assertEqual(20, session.query(Order).count())
+        self.assertGreater(stats["full_queue_waits"], 0)
+        self.assertLessEqual(stats["max_queue_depth"], 2)
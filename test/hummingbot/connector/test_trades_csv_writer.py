@@ -0,0 +1,118 @@
+import asyncio
+import csv
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from hummingbot.connector.trades_csv_writer import TradesCsvWriter
+
+
+class TradesCsvWriterTests(unittest.TestCase):
+    header = ("exchange_trade_id", "price", "amount")
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.csv_path = os.path.join(self.temp_dir.name, "trades_test.csv")
+
+    def _read_rows(self, path: str):
+        with open(path, newline="") as csv_file:
+            return [tuple(row) for row in csv.reader(csv_file)]
+
+    def _csv_files(self):
+        return sorted(os.listdir(self.temp_dir.name))
+
+    def test_writes_header_once_and_appends_rows(self):
+        writer = TradesCsvWriter(self.csv_path, self.header)
+        writer.write_row(("T1", "100.5", "1"))
+        writer.close()
+        writer = TradesCsvWriter(self.csv_path, self.header)
+        writer.write_row(("T2", "101", None))
+        writer.close()
+
+        self.assertEqual([self.header, ("T1", "100.5", "1"), ("T2", "101", "")], self._read_rows(self.csv_path))
+        self.assertEqual(["trades_test.csv"], self._csv_files())
+
+    def test_file_with_different_header_is_moved_aside(self):
+        with open(self.csv_path, "w", newline="") as csv_file:
+            csv.writer(csv_file).writerows([("exchange_trade_id", "price"), ("T0", "99")])
+
+        writer = TradesCsvWriter(self.csv_path, self.header)
+        writer.write_row(("T1", "100", "1"))
+        writer.close()
+
+        files = self._csv_files()
+        self.assertEqual(2, len(files))
+        self.assertTrue(files[1].startswith("trades_test_old_"))
+        self.assertEqual([("exchange_trade_id", "price"), ("T0", "99")],
+                         self._read_rows(os.path.join(self.temp_dir.name, files[1])))
+        self.assertEqual([self.header, ("T1", "100", "1")], self._read_rows(self.csv_path))
+
+    def test_rows_are_flushed_after_flush_interval(self):
+        writer = TradesCsvWriter(self.csv_path, self.header, flush_interval=60)
+        self.addCleanup(writer.close)
+
+        with patch("hummingbot.connector.trades_csv_writer.time.time", return_value=writer._last_flush_time + 1):
+            writer.open()
+            writer.write_row(("T1", "100", "1"))
+        self.assertEqual([self.header], self._read_rows(self.csv_path))
+
+        with patch("hummingbot.connector.trades_csv_writer.time.time", return_value=writer._last_flush_time + 61):
+            writer.write_row(("T2", "100", "1"))
+        self.assertEqual([self.header, ("T1", "100", "1"), ("T2", "100", "1")], self._read_rows(self.csv_path))
+
+    def test_single_row_is_flushed_after_flush_interval_without_other_writes(self):
+        writer = TradesCsvWriter(self.csv_path, self.header, flush_interval=0.05)
+        self.addCleanup(writer.close)
+        writer.open()
+
+        async def write_row_and_idle():
+            writer.write_row(("T1", "100", "1"))
+            self.assertEqual([self.header], self._read_rows(self.csv_path))
+            await asyncio.sleep(0.1)
+
+        asyncio.run(write_row_and_idle())
+        self.assertEqual([self.header, ("T1", "100", "1")], self._read_rows(self.csv_path))
+
+    def test_close_flushes_rows_and_cancels_scheduled_flush(self):
+        writer = TradesCsvWriter(self.csv_path, self.header, flush_interval=60)
+
+        async def write_row_and_close():
+            writer.write_row(("T1", "100", "1"))
+            flush_timer = writer._flush_timer
+            self.assertIsNotNone(flush_timer)
+            writer.close()
+            self.assertTrue(flush_timer.cancelled())
+
+        asyncio.run(write_row_and_close())
+        self.assertEqual([self.header, ("T1", "100", "1")], self._read_rows(self.csv_path))
+
+    def test_rotates_file_when_size_exceeded(self):
+        writer = TradesCsvWriter(self.csv_path, self.header, flush_interval=0, max_file_size=50)
+        for i in range(6):
+            writer.write_row((f"T{i}", "100.0", "1.0"))
+        writer.close()
+
+        files = self._csv_files()
+        self.assertGreater(len(files), 1)
+        rows = []
+        for file_name in files:
+            file_rows = self._read_rows(os.path.join(self.temp_dir.name, file_name))
+            self.assertEqual(self.header, file_rows[0])
+            rows.extend(file_rows[1:])
+        self.assertEqual({f"T{i}" for i in range(6)}, {row[0] for row in rows})
+
+    def test_rotates_file_when_date_changes(self):
+        writer = TradesCsvWriter(self.csv_path, self.header, flush_interval=0, rotate_daily=True)
+        with patch.object(TradesCsvWriter, "_utc_date", return_value="20240101"):
+            writer.write_row(("T1", "100", "1"))
+        with patch.object(TradesCsvWriter, "_utc_date", return_value="20240102"):
+            writer.write_row(("T2", "100", "1"))
+        writer.close()
+
+        files = self._csv_files()
+        self.assertEqual(2, len(files))
+        self.assertEqual([self.header, ("T1", "100", "1")], self._read_rows(os.path.join(self.temp_dir.name, files[1])))
+        self.assertEqual([self.header, ("T2", "100", "1")], self._read_rows(self.csv_path))
@@ -275,3 +275,56 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         time_mock.return_value = 1640000000.2100
         result = context.within_capacity()
         self.assertTrue(result)
+
+    def test_next_capacity_timestamp_returns_oldest_blocking_task_expiration(self):
+        rate_limit, related_limits = self.throttler.get_related_limits(limit_id=TEST_PATH_URL)
+        pool_limit = related_limits[0][0]
+        self.throttler._task_logs.append(TaskLog(timestamp=1000.0, rate_limit=pool_limit, weight=1))
+        self.throttler._task_logs.append(TaskLog(timestamp=1001.0, rate_limit=rate_limit, weight=1))
+
+        context = self.throttler.execute_task(limit_id=TEST_PATH_URL)
+
+        # Both limits are exhausted, so the task has to wait for the most recent of them to expire
+        self.assertEqual(1001.0 + 5.0 * 1.05, context.next_capacity_timestamp())
+        self.assertIsNone(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).next_capacity_timestamp())
+
+    def test_acquire_with_waiter_queue_wakes_up_when_blocking_task_expires(self):
+        rate_limit = RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.2)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], retry_interval=10.0, use_waiter_queue=True)
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_POOL_ID, throttler))
+
+        # The retry interval would make the request wait 10 seconds if the capacity was polled
+        self.ev_loop.run_until_complete(
+            asyncio.wait_for(self.execute_requests(1, TEST_POOL_ID, throttler), 1.0)
+        )
+
+        self.assertEqual(2, self._req_counters[TEST_POOL_ID])
+        histogram = throttler.wait_time_histograms()[TEST_POOL_ID]
+        self.assertEqual(2, histogram.count)
+        self.assertGreater(histogram.max, 0.15)
+
+    def test_acquire_with_waiter_queue_serves_requests_in_fifo_order(self):
+        rate_limit = RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.05)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], safety_margin_pct=0, use_waiter_queue=True)
+        served = []
+
+        async def request(request_number: int):
+            async with throttler.execute_task(limit_id=TEST_POOL_ID):
+                served.append(request_number)
+
+        async def run_requests():
+            await asyncio.gather(*[request(i) for i in range(5)])
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 2.0))
+
+        self.assertEqual([0, 1, 2, 3, 4], served)
+
+    def test_available_capacity_considers_linked_limits(self):
+        self.assertIsNone(self.throttler.available_capacity("unknown_limit"))
+        self.assertEqual(2, self.throttler.available_capacity(TEST_WEIGHTED_TASK_1_ID))
+        self.assertEqual(10, self.throttler.available_capacity(TEST_WEIGHTED_TASK_2_ID))
+
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_WEIGHTED_TASK_1_ID, self.throttler))
+
+        self.assertEqual(1, self.throttler.available_capacity(TEST_WEIGHTED_TASK_1_ID))
+        self.assertEqual(5, self.throttler.available_capacity(TEST_WEIGHTED_TASK_2_ID))
@@ -0,0 +1,181 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Dict, List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindow, SlidingWindowThrottler
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+
+
+class SlidingWindowThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = SlidingWindowThrottler(rate_limits=self.rate_limits)
+        self._req_counters: Dict[str, int] = {limit.limit_id: 0 for limit in self.rate_limits}
+
+    async def execute_requests(self, no_request: int, limit_id: str, throttler: SlidingWindowThrottler):
+        for _ in range(no_request):
+            async with throttler.execute_task(limit_id=limit_id):
+                self._req_counters[limit_id] += 1
+
+    def test_window_expire_only_removes_elapsed_entries(self):
+        rate_limit = RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=1.0)
+        window = SlidingWindow(rate_limit=rate_limit, safety_margin_pct=0.05)
+        window.record(timestamp=100.0, weight=2)
+        window.record(timestamp=100.5, weight=3)
+
+        window.expire(now=101.0)
+        self.assertEqual(5, window.capacity_used)
+        self.assertEqual(2, len(window))
+
+        window.expire(now=101.06)
+        self.assertEqual(3, window.capacity_used)
+        self.assertEqual(1, len(window))
+        self.assertEqual(100.5 + 1.05, window.next_expiration_timestamp())
+
+        window.expire(now=102.0)
+        self.assertEqual(0, window.capacity_used)
+        self.assertIsNone(window.next_expiration_timestamp())
+
+    def test_execute_task_shares_windows_between_related_limits(self):
+        context = self.throttler.execute_task(limit_id=TEST_PATH_URL)
+        self.ev_loop.run_until_complete(context.acquire())
+
+        self.assertEqual(1, self.throttler._windows[TEST_PATH_URL].capacity_used)
+        self.assertEqual(1, self.throttler._windows[TEST_POOL_ID].capacity_used)
+
+        # The pool limit has been consumed by the linked request
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_POOL_ID).within_capacity())
+
+    def test_within_capacity_pool_weighted_tasks(self):
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_WEIGHTED_TASK_1_ID, self.throttler))
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_WEIGHTED_TASK_2_ID, self.throttler))
+
+        # Another Task 1(weight=5) will exceed the capacity(11/10)
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        # However Task 2(weight=1) will not exceed the capacity(7/10)
+        self.assertTrue(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_within_capacity_returns_true_for_throttler_without_configured_limits(self):
+        throttler = SlidingWindowThrottler(rate_limits=[])
+        context = throttler.execute_task(limit_id="test_limit_id")
+        self.assertTrue(context.within_capacity())
+        self.ev_loop.run_until_complete(context.acquire())
+
+    def test_acquire_awaits_when_exceed_capacity(self):
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_POOL_ID, self.throttler))
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+        with self.assertRaises(asyncio.exceptions.TimeoutError):
+            self.ev_loop.run_until_complete(
+                asyncio.wait_for(context.acquire(), 1.0)
+            )
+
+    def test_set_rate_limits_keeps_consumed_capacity(self):
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_WEIGHTED_TASK_1_ID, self.throttler))
+        self.throttler.set_rate_limits(self.rate_limits)
+
+        context = self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID)
+        self.assertIs(self.throttler._id_to_limit_map[TEST_WEIGHTED_POOL_ID],
+                      self.throttler._windows[TEST_WEIGHTED_POOL_ID].rate_limit)
+        self.assertTrue(context.within_capacity())
+        self.assertEqual(5, self.throttler._windows[TEST_WEIGHTED_POOL_ID].capacity_used)
+
+    def test_init_with_rate_limits_share_pct(self):
+        throttler = SlidingWindowThrottler(rate_limits=self.rate_limits, limits_share_percentage=Decimal("55"))
+        self.assertEqual(5, throttler._id_to_limit_map[TEST_WEIGHTED_POOL_ID].limit)
+
+    @patch("hummingbot.core.api_throttler.sliding_window_throttler.SlidingWindowRequestContext._time")
+    def test_within_capacity_for_limits_with_milliseconds_interval(self, time_mock):
+        per_second_limit = RateLimit(limit_id="generic_per_second", limit=3, time_interval=1)
+        per_millisecond_limit = RateLimit(limit_id="generic_per_millisecond", limit=2, time_interval=0.2)
+        specific_limit = RateLimit(limit_id="specific_limit", limit=1000, time_interval=1, linked_limits=[
+            LinkedLimitWeightPair(per_second_limit.limit_id),
+            LinkedLimitWeightPair(per_millisecond_limit.limit_id),
+        ])
+        throttler = SlidingWindowThrottler(
+            rate_limits=[per_second_limit, per_millisecond_limit, specific_limit], safety_margin_pct=0)
+
+        time_mock.return_value = 1640000000.0000
+        throttler.execute_task(limit_id=specific_limit.limit_id).log_task(timestamp=1640000000.0000)
+
+        context = throttler.execute_task(limit_id=specific_limit.limit_id)
+        time_mock.return_value = 1640000000.0100
+        context.flush()
+        self.assertTrue(context.within_capacity())
+
+        context.log_task(timestamp=1640000000.1000)
+
+        for now, expected in ((1640000000.1000, False),
+                              (1640000000.1900, False),
+                              (1640000000.2000, False),
+                              (1640000000.2100, True)):
+            time_mock.return_value = now
+            context.flush()
+            self.assertEqual(expected, context.within_capacity())
+
+    @patch("hummingbot.core.api_throttler.sliding_window_throttler.SlidingWindowRequestContext._time")
+    def test_capacity_check_only_prunes_windows_of_the_request_with_10k_logs(self, time_mock):
+        # 10k outstanding task logs spread across 100 limits, checked against one of them
+        rate_limits = [RateLimit(limit_id=f"limit_{i}", limit=1000, time_interval=60) for i in range(100)]
+        throttler = SlidingWindowThrottler(rate_limits=rate_limits, safety_margin_pct=0)
+        windows = [throttler._window_for(throttler._rate_limits[i]) for i in range(100)]
+        for i in range(10_000):
+            windows[i % 100].record(1640000000.0 + (i // 100), 1)
+
+        context = throttler.execute_task(limit_id="limit_0")
+        time_mock.return_value = 1640000060.0 + 49.5
+        context.flush()
+
+        self.assertTrue(context.within_capacity())
+        self.assertEqual(50, len(windows[0]))
+        self.assertEqual(50, windows[0].capacity_used)
+        self.assertEqual([100] * 99, [len(window) for window in windows[1:]])
+
+    def test_acquire_with_waiter_queue_sleeps_until_window_expiration(self):
+        rate_limit = RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.2)
+        throttler = SlidingWindowThrottler(rate_limits=[rate_limit], retry_interval=10.0, use_waiter_queue=True)
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_POOL_ID, throttler))
+
+        context = throttler.execute_task(limit_id=TEST_POOL_ID)
+        self.assertEqual(throttler._windows[TEST_POOL_ID].next_expiration_timestamp(),
+                         context.next_capacity_timestamp())
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(context.acquire(), 1.0))
+        self.assertEqual(2, throttler.wait_time_histograms()[TEST_POOL_ID].count)
+
+    def test_available_capacity_considers_linked_limits(self):
+        self.assertIsNone(self.throttler.available_capacity("unknown_limit"))
+        self.assertEqual(2, self.throttler.available_capacity(TEST_WEIGHTED_TASK_1_ID))
+        self.assertEqual(10, self.throttler.available_capacity(TEST_WEIGHTED_TASK_2_ID))
+
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_WEIGHTED_TASK_1_ID, self.throttler))
+
+        self.assertEqual(1, self.throttler.available_capacity(TEST_WEIGHTED_TASK_1_ID))
+        self.assertEqual(5, self.throttler.available_capacity(TEST_WEIGHTED_TASK_2_ID))
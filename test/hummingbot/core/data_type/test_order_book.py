@@ -2,7 +2,9 @@
 
 import logging
 import unittest
+from hummingbot.connector.exchange.ndax.ndax_order_book_message import NdaxOrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 import numpy as np
 
 
@@ -50,6 +52,70 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_apply_conflated_diffs_keeps_last_update_per_price_level(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 1], [3, 1, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        diffs = [
+            OrderBookMessage(OrderBookMessageType.DIFF,
+                             {"trading_pair": "A-B", "update_id": 2, "bids": [["3", "0"], ["2", "5"]], "asks": []}),
+            OrderBookMessage(OrderBookMessageType.DIFF,
+                             {"trading_pair": "A-B", "update_id": 4, "bids": [["3", "2"]], "asks": [["4", "0"]]}),
+            OrderBookMessage(OrderBookMessageType.DIFF,
+                             {"trading_pair": "A-B", "update_id": 3, "bids": [["2", "7"]], "asks": []}),
+        ]
+        levels_in, levels_out = order_book.apply_conflated_diffs(diffs)
+
+        self.assertEqual(5, levels_in)
+        self.assertEqual(3, levels_out)
+        self.assertEqual(4, order_book.last_diff_uid)
+        bids, asks = order_book.snapshot
+        self.assertEqual([[3., 2., 4.], [2., 7., 3.], [1., 1., 1.]], bids.values.tolist())
+        self.assertEqual([[5., 1., 1.]], asks.values.tolist())
+
+    def test_apply_conflated_diffs_reads_rows_from_message_properties(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        # NDAX diff messages carry their rows in the "data" entries instead of "bids" and "asks"
+        diffs = [
+            NdaxOrderBookMessage(OrderBookMessageType.DIFF, {"data": [[2, 0, 1660000000, 0, 0, 0, 3, 1, 2, 0],
+                                                                      [2, 0, 1660000000, 2, 0, 0, 4, 1, 1, 1]]},
+                                 timestamp=1660000000),
+            NdaxOrderBookMessage(OrderBookMessageType.DIFF, {"data": [[3, 0, 1660000001, 1, 0, 0, 3, 1, 6, 0]]},
+                                 timestamp=1660000001),
+        ]
+        levels_in, levels_out = order_book.apply_conflated_diffs(diffs)
+
+        self.assertEqual(3, levels_in)
+        self.assertEqual(2, levels_out)
+        self.assertEqual(3, order_book.last_diff_uid)
+        bids, asks = order_book.snapshot
+        self.assertEqual([[3., 6., 3.], [2., 1., 1.], [1., 1., 1.]], bids.values.tolist())
+        self.assertEqual([[5., 1., 1.]], asks.values.tolist())
+
+    def test_top_levels(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 1], [3, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 4, 1], [5, 5, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.top_levels(2)
+        self.assertEqual([[3, 3], [2, 2]], bids.tolist())
+        self.assertEqual([[4, 4], [5, 5]], asks.tolist())
+
+        bids, asks = order_book.top_levels(10)
+        self.assertEqual((3, 2), bids.shape)
+        self.assertEqual((2, 2), asks.shape)
+
+        bids, asks = OrderBook().top_levels(5)
+        self.assertEqual((0, 2), bids.shape)
+        self.assertEqual((0, 2), asks.shape)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,178 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import (
+    OrderBookDiffConflation,
+    OrderBookMessageDispatcher,
+    OrderBookTracker,
+)
+
+
+class OrderBookTrackerPerPairRoutingTests(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_source = MagicMock()
+        self.data_source.get_new_order_book = AsyncMock(side_effect=self._new_order_book)
+        self.tracker = OrderBookTracker(
+            data_source=self.data_source, trading_pairs=[self.trading_pair], per_pair_routing=True)
+        self.tracker._sleep = AsyncMock()
+        self.tasks: List[asyncio.Task] = []
+
+    def tearDown(self) -> None:
+        for task in self.tasks:
+            task.cancel()
+        self.tracker.stop()
+        super().tearDown()
+
+    async def _new_order_book(self, trading_pair: str) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_snapshot(bids=[OrderBookRow(99.0, 1.0, 10)], asks=[OrderBookRow(101.0, 1.0, 10)], update_id=10)
+        return order_book
+
+    def _diff(self, update_id: int, bids=None, asks=None) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": self.trading_pair, "update_id": update_id, "bids": bids or [], "asks": asks or []},
+            timestamp=float(update_id))
+
+    async def _wait_for_pending_messages(self):
+        pair_queue = self.tracker._pair_queues[self.trading_pair]
+        while len(pair_queue) > 0:
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    async def test_diffs_received_before_initialization_are_applied_after_snapshot(self):
+        dispatcher = OrderBookMessageDispatcher(self.tracker._dispatch_diff_message)
+        dispatcher.put_nowait(self._diff(update_id=5, bids=[(98.0, 5.0)]))
+        dispatcher.put_nowait(self._diff(update_id=11, bids=[(99.5, 2.0)]))
+
+        await self.tracker._init_order_books()
+        await self._wait_for_pending_messages()
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        stats = self.tracker.pair_queues_stats()[self.trading_pair]
+        self.assertEqual(99.5, order_book.get_price(is_buy=False))
+        self.assertEqual(1, stats["messages_in"])
+        self.assertEqual(1, stats["applies"])
+
+    async def test_consecutive_diffs_are_applied_in_a_single_batch(self):
+        await self.tracker._init_order_books()
+        await self._wait_for_pending_messages()
+
+        dispatcher = OrderBookMessageDispatcher(self.tracker._dispatch_diff_message)
+        await dispatcher.put(self._diff(update_id=9, bids=[(98.0, 5.0)]))
+        dispatcher.put_nowait(self._diff(update_id=11, bids=[(99.5, 2.0)]))
+        dispatcher.put_nowait(self._diff(update_id=12, asks=[(100.5, 3.0)]))
+        dispatcher.put_nowait(self._diff(update_id=13, bids=[(99.5, 0.0)]))
+        await self._wait_for_pending_messages()
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        stats = self.tracker.pair_queues_stats()[self.trading_pair]
+        self.assertEqual(99.0, order_book.get_price(is_buy=False))
+        self.assertEqual(100.5, order_book.get_price(is_buy=True))
+        self.assertEqual(13, order_book.last_diff_uid)
+        self.assertEqual(3, stats["messages_in"])
+        self.assertEqual(1, stats["messages_rejected"])
+        self.assertEqual(1, stats["applies"])
+        self.assertEqual(3, stats["max_depth"])
+        self.assertEqual(1, stats["apply_latency"]["count"])
+
+    async def test_full_pair_queue_discards_pending_diffs_and_resyncs_from_snapshot(self):
+        self.tracker.PAIR_QUEUE_MAX_SIZE = 2
+        snapshot = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": self.trading_pair, "update_id": 20, "bids": [(97.0, 1.0)], "asks": [(102.0, 1.0)]},
+            timestamp=20.0)
+        self.data_source.get_order_book_snapshot_message = AsyncMock(return_value=snapshot)
+        await self.tracker._init_order_books()
+        await self._wait_for_pending_messages()
+        # Pause the tracking task to let the queue fill up
+        self.tracker._tracking_tasks[self.trading_pair].cancel()
+
+        for update_id in range(11, 14):
+            self.tracker._dispatch_diff_message(self._diff(update_id=update_id, bids=[(98.0, float(update_id))]))
+        await asyncio.sleep(0.01)
+
+        pair_queue = self.tracker._pair_queues[self.trading_pair]
+        self.assertEqual(1, pair_queue.overflows)
+        self.assertEqual(2, len(pair_queue))
+        self.data_source.get_order_book_snapshot_message.assert_awaited_once_with(self.trading_pair)
+
+        self.tracker._tracking_tasks[self.trading_pair] = asyncio.create_task(
+            self.tracker._track_single_book_in_batches(self.trading_pair))
+        await self._wait_for_pending_messages()
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual(102.0, order_book.get_price(is_buy=True))
+        self.assertEqual(20, order_book.snapshot_uid)
+
+    async def test_conflation_merges_pending_diffs_per_price_level(self):
+        self.tracker._diff_conflation = OrderBookDiffConflation.CONFLATE
+        await self.tracker._init_order_books()
+        await self._wait_for_pending_messages()
+
+        for update_id, amount in ((11, 1.0), (12, 2.0), (13, 3.0)):
+            self.tracker._dispatch_diff_message(self._diff(update_id=update_id, bids=[(99.5, amount)]))
+        await self._wait_for_pending_messages()
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        stats = self.tracker.pair_queues_stats()[self.trading_pair]
+        bids, _ = order_book.snapshot
+        self.assertEqual([99.5, 3.0, 13], bids.iloc[0].tolist())
+        self.assertEqual(13, order_book.last_diff_uid)
+        self.assertEqual(3, stats["messages_in"])
+        self.assertEqual(1, stats["applies"])
+        self.assertEqual(3, stats["levels_in"])
+        self.assertEqual(1, stats["levels_out"])
+
+    async def test_latest_only_discards_messages_before_last_snapshot(self):
+        self.tracker._diff_conflation = OrderBookDiffConflation.LATEST_ONLY
+        await self.tracker._init_order_books()
+        await self._wait_for_pending_messages()
+
+        snapshot = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": self.trading_pair, "update_id": 20, "bids": [(97.0, 1.0)], "asks": [(102.0, 1.0)]},
+            timestamp=20.0)
+        self.tracker._dispatch_diff_message(self._diff(update_id=11, bids=[(99.5, 1.0)]))
+        self.tracker._dispatch_diff_message(self._diff(update_id=12, asks=[(100.5, 1.0)]))
+        self.tracker._dispatch_snapshot_message(snapshot)
+        self.tracker._dispatch_diff_message(self._diff(update_id=21, bids=[(98.0, 1.0)]))
+        await self._wait_for_pending_messages()
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        stats = self.tracker.pair_queues_stats()[self.trading_pair]
+        self.assertEqual(98.0, order_book.get_price(is_buy=False))
+        self.assertEqual(102.0, order_book.get_price(is_buy=True))
+        self.assertEqual(2, stats["messages_skipped"])
+        self.assertEqual(1, stats["applies"])
+
+    async def test_latest_only_replays_diffs_newer_than_snapshot_queued_before_it(self):
+        self.tracker._diff_conflation = OrderBookDiffConflation.LATEST_ONLY
+        await self.tracker._init_order_books()
+        await self._wait_for_pending_messages()
+
+        snapshot = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": self.trading_pair, "update_id": 20, "bids": [(97.0, 1.0)], "asks": [(102.0, 1.0)]},
+            timestamp=20.0)
+        self.tracker._dispatch_diff_message(self._diff(update_id=11, bids=[(99.5, 1.0)]))
+        # Received from the websocket before the REST snapshot, but newer than it
+        self.tracker._dispatch_diff_message(self._diff(update_id=21, asks=[(101.5, 1.0)]))
+        self.tracker._dispatch_snapshot_message(snapshot)
+        await self._wait_for_pending_messages()
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        stats = self.tracker.pair_queues_stats()[self.trading_pair]
+        self.assertEqual(97.0, order_book.get_price(is_buy=False))
+        self.assertEqual(101.5, order_book.get_price(is_buy=True))
+        self.assertEqual(21, order_book.last_diff_uid)
+        self.assertEqual(2, stats["messages_skipped"])
+        self.assertEqual(0, stats["applies"])
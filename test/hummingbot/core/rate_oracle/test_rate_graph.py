@@ -0,0 +1,87 @@
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from hummingbot.core.rate_oracle.rate_graph import RateGraph
+from hummingbot.core.rate_oracle.utils import find_rate
+
+
+class RateGraphTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
+        self.graph = RateGraph(self.prices)
+
+    def test_find_rate_matches_prices_dictionary(self):
+        for pair in ("HBOT-USDT", "USDT-HBOT", "HBOT-AAVE", "AAVE-HBOT", "HBOT-GBP", "ZBOT-USDT", "USDT-USDT",
+                     "WHBOT-USDT", "USDC-GBP"):
+            with self.subTest(pair=pair):
+                self.assertEqual(find_rate(self.prices, pair), self.graph.find_rate(pair))
+                self.assertEqual(find_rate(self.prices, pair), find_rate(self.graph, pair))
+
+    def test_find_rate_through_multiple_hops(self):
+        self.graph["GBP-EUR"] = Decimal("1.2")
+        self.graph["JPY-EUR"] = Decimal("0.006")
+
+        self.assertIsNone(find_rate(self.prices, "AAVE-JPY"))
+        self.assertEqual(Decimal("50") * Decimal("0.75") * Decimal("1.2") / Decimal("0.006"),
+                         self.graph.find_rate("AAVE-JPY"))
+        self.assertEqual([("AAVE-USDT", False), ("USDT-GBP", False), ("GBP-EUR", False), ("JPY-EUR", True)],
+                         self.graph.conversion_path("AAVE", "JPY"))
+
+        graph = RateGraph(self.graph, max_hops=3)
+        self.assertIsNone(graph.find_rate("AAVE-JPY"))
+
+    def test_cross_rates_are_updated_with_prices(self):
+        self.assertEqual(Decimal("2"), self.graph.find_rate("HBOT-AAVE"))
+        self.assertEqual(Decimal("75"), self.graph.find_rate("HBOT-GBP"))
+
+        self.graph["AAVE-USDT"] = Decimal("25")
+        self.graph.update({"USDT-GBP": Decimal("0.8")})
+
+        self.assertEqual(Decimal("4"), self.graph.find_rate("HBOT-AAVE"))
+        self.assertEqual(Decimal("80"), self.graph.find_rate("HBOT-GBP"))
+
+    def test_pairs_added_and_removed_change_conversion_paths(self):
+        self.assertIsNone(self.graph.find_rate("BTC-GBP"))
+
+        self.graph["BTC-USDT"] = Decimal("20000")
+        self.assertEqual(Decimal("15000"), self.graph.find_rate("BTC-GBP"))
+
+        self.graph["BTC-GBP"] = Decimal("16000")
+        self.assertEqual(Decimal("16000"), self.graph.find_rate("BTC-GBP"))
+
+        del self.graph["BTC-GBP"]
+        self.graph.pop("BTC-USDT")
+        self.assertIsNone(self.graph.find_rate("BTC-GBP"))
+
+        self.graph["BTC-USDT"] = Decimal("0")
+        self.assertIsNone(self.graph.find_rate("BTC-GBP"))
+
+        self.graph.clear()
+        self.assertEqual({}, dict(self.graph))
+        self.assertIsNone(self.graph.find_rate("HBOT-AAVE"))
+
+    def test_cross_rate_lookups_on_large_price_map_are_memoized(self):
+        prices = {}
+        for i in range(2_000):
+            prices[f"TOKEN{i}-USDT"] = Decimal(i + 1)
+        for i in range(1_000):
+            prices[f"TOKEN{i}-BTC"] = Decimal(i + 1) / Decimal("20000")
+        graph = RateGraph(prices)
+        pairs = [f"TOKEN{i}-TOKEN{i + 1000}" for i in range(0, 1_000, 10)] + ["USDT-ETH"]
+
+        with patch.object(graph, "_shortest_path", wraps=graph._shortest_path) as shortest_path_mock:
+            self.assertEqual([find_rate(prices, pair) for pair in pairs], [graph.find_rate(pair) for pair in pairs])
+            self.assertEqual(len(pairs), shortest_path_mock.call_count)
+
+            # Repeated lookups reuse the memoized rates
+            self.assertEqual([find_rate(prices, pair) for pair in pairs], [graph.find_rate(pair) for pair in pairs])
+            self.assertEqual(len(pairs), shortest_path_mock.call_count)
+
+            # Price changes reuse the conversion paths and recompute only the rates depending on the changed pair
+            prices["TOKEN0-USDT"] = graph["TOKEN0-USDT"] = Decimal("3")
+            self.assertEqual([find_rate(prices, pair) for pair in pairs], [graph.find_rate(pair) for pair in pairs])
+            self.assertEqual(len(pairs), shortest_path_mock.call_count)
+            self.assertEqual(Decimal("3") / Decimal("1001"), graph.find_rate("TOKEN0-TOKEN1000"))
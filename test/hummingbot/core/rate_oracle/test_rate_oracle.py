@@ -1,3 +1,4 @@
+import asyncio
 from copy import deepcopy
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
@@ -24,6 +25,21 @@ class DummyRateSource(RateSourceBase):
         return deepcopy(self._price_dict)
 
 
+class CountingRateSource(DummyRateSource):
+    def __init__(self, price_dict: Dict[str, Decimal]):
+        super().__init__(price_dict)
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.error: Optional[Exception] = None
+
+    async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return await super().get_prices(quote_token)
+
+
 class RateOracleTest(IsolatedAsyncioWrapperTestCase):
     @classmethod
     def setUpClass(cls):
@@ -80,6 +96,21 @@ class RateOracleTest(IsolatedAsyncioWrapperTestCase):
         rate = find_rate(prices, "HBOT-GBP")
         self.assertEqual(rate, Decimal("75"))
 
+    def test_get_pair_rate_uses_updated_prices(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+        rate_oracle._prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50")}
+
+        self.assertEqual(Decimal("2"), rate_oracle.get_pair_rate("HBOT-AAVE"))
+
+        rate_oracle.set_price("AAVE-USDT", Decimal("25"))
+        rate_oracle.set_price("USDT-GBP", Decimal("0.75"))
+
+        self.assertEqual(Decimal("4"), rate_oracle.get_pair_rate("HBOT-AAVE"))
+        self.assertEqual(Decimal("0.25"), rate_oracle.get_pair_rate("AAVE-HBOT"))
+        self.assertEqual(Decimal("18.75"), rate_oracle.get_pair_rate("AAVE-GBP"))
+        self.assertEqual({"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("25"), "USDT-GBP": Decimal("0.75")},
+                         rate_oracle.prices)
+
     def test_rate_oracle_single_instance_rate_source_reset_after_configuration_change(self):
         config_map = ClientConfigAdapter(ClientConfigMap())
         config_map.rate_oracle_source = "binance"
@@ -99,3 +130,73 @@ class RateOracleTest(IsolatedAsyncioWrapperTestCase):
         config_map.global_token.global_token_name = "EUR"
 
         self.assertEqual(0, len(rate_oracle.prices))
+
+    async def test_concurrent_rate_requests_share_one_source_fetch(self):
+        source = CountingRateSource(price_dict={self.trading_pair: Decimal("10")})
+        rate_oracle = RateOracle(source=source, price_cache_ttl=60)
+
+        requests = [asyncio.ensure_future(rate_oracle.rate_async(self.trading_pair)) for _ in range(10)]
+        await asyncio.sleep(0)
+        source.release.set()
+        rates = await asyncio.gather(*requests)
+
+        self.assertEqual([Decimal("10")] * 10, rates)
+        self.assertEqual(1, source.calls)
+        self.assertEqual(Decimal("10"), await rate_oracle.rate_async(self.trading_pair))
+        self.assertEqual(1, source.calls)
+        self.assertEqual({"hits": 1, "misses": 1, "coalesced": 9, "errors": 0}, rate_oracle.price_cache_stats.to_dict())
+
+    async def test_price_snapshot_expires_after_ttl(self):
+        source = CountingRateSource(price_dict={self.trading_pair: Decimal("10")})
+        source.release.set()
+        rate_oracle = RateOracle(source=source, price_cache_ttl=0)
+
+        await rate_oracle.rate_async(self.trading_pair)
+        await rate_oracle.rate_async(self.trading_pair)
+
+        self.assertEqual(2, source.calls)
+        self.assertEqual(2, rate_oracle.price_cache_stats.misses)
+
+    async def test_failed_fetch_is_not_cached(self):
+        source = CountingRateSource(price_dict={self.trading_pair: Decimal("10")})
+        source.error = IOError("Test error")
+        rate_oracle = RateOracle(source=source, price_cache_ttl=60)
+
+        requests = [asyncio.ensure_future(rate_oracle.rate_async(self.trading_pair)) for _ in range(3)]
+        await asyncio.sleep(0)
+        source.release.set()
+        results = await asyncio.gather(*requests, return_exceptions=True)
+
+        self.assertTrue(all(isinstance(result, IOError) for result in results))
+        self.assertEqual(1, rate_oracle.price_cache_stats.errors)
+
+        source.error = None
+        self.assertEqual(Decimal("10"), await rate_oracle.rate_async(self.trading_pair))
+        self.assertEqual(2, source.calls)
+
+    async def test_cancelled_request_does_not_cancel_shared_fetch(self):
+        source = CountingRateSource(price_dict={self.trading_pair: Decimal("10")})
+        rate_oracle = RateOracle(source=source, price_cache_ttl=60)
+
+        first_request = asyncio.ensure_future(rate_oracle.rate_async(self.trading_pair))
+        second_request = asyncio.ensure_future(rate_oracle.rate_async(self.trading_pair))
+        await asyncio.sleep(0)
+        first_request.cancel()
+        source.release.set()
+
+        self.assertEqual(Decimal("10"), await second_request)
+        self.assertTrue(first_request.cancelled())
+        self.assertEqual(1, source.calls)
+
+    async def test_source_change_clears_price_snapshot(self):
+        source = CountingRateSource(price_dict={self.trading_pair: Decimal("10")})
+        source.release.set()
+        rate_oracle = RateOracle(source=source, price_cache_ttl=60)
+        await rate_oracle.rate_async(self.trading_pair)
+
+        new_source = CountingRateSource(price_dict={self.trading_pair: Decimal("20")})
+        new_source.release.set()
+        rate_oracle.source = new_source
+
+        self.assertEqual(Decimal("20"), await rate_oracle.rate_async(self.trading_pair))
+        self.assertEqual(1, new_source.calls)
@@ -1,13 +1,44 @@
 import asyncio
 import time
 import unittest
+from typing import List
 
 import pandas as pd
 
 from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
+class RecordingTimeIterator(PyTimeIterator):
+
+    def __init__(self, name: str, ticks_log: List[str], tick_duration: float = 0.0):
+        super().__init__()
+        self.name = name
+        self.ticks_log = ticks_log
+        self.tick_duration = tick_duration
+        self.timestamps: List[float] = []
+
+    def tick(self, timestamp: float):
+        self.timestamps.append(timestamp)
+        self.ticks_log.append(self.name)
+        if self.tick_duration > 0:
+            time.sleep(self.tick_duration)
+
+
+class WakeUpTimeIterator(RecordingTimeIterator):
+
+    def __init__(self, name: str, ticks_log: List[str], wake_up_interval: float):
+        super().__init__(name, ticks_log)
+        self.wake_up_interval = wake_up_interval
+
+    def next_wake_up_timestamp(self, timestamp: float) -> float:
+        # Wakes up on multiples of the interval
+        if self.wake_up_interval == float("inf"):
+            return self.wake_up_interval
+        return ((timestamp // self.wake_up_interval) + 1) * self.wake_up_interval
+
+
 class ClockUnitTest(unittest.TestCase):
 
     backtest_start_timestamp: float = pd.Timestamp("2021-01-01", tz="UTC").timestamp()
@@ -122,3 +153,94 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_set_iterator_schedule_rejects_invalid_tick_every(self):
+        time_iterator: TimeIterator = TimeIterator()
+
+        with self.assertRaises(ValueError):
+            self.clock_realtime.add_iterator(time_iterator, tick_every=0)
+
+    def test_run_til_ticks_iterators_on_their_schedule(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.05)
+        ticks_log: List[str] = []
+        strategy = RecordingTimeIterator("strategy", ticks_log)
+        recorder = RecordingTimeIterator("recorder", ticks_log)
+        reporter = RecordingTimeIterator("reporter", ticks_log)
+        clock.add_iterator(reporter, deferred=True)
+        clock.add_iterator(recorder, tick_every=3)
+        clock.add_iterator(strategy)
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.6))
+
+        self.assertGreater(len(strategy.timestamps), 6)
+        self.assertEqual(strategy.timestamps[::3], recorder.timestamps)
+        # The deferred iterator is ticked after the rest of iterators of the same tick
+        self.assertEqual(["recorder", "strategy", "reporter"], ticks_log[:3])
+        self.assertEqual(strategy.timestamps[:len(reporter.timestamps)], reporter.timestamps)
+
+        stats = clock.get_tick_stats()
+        self.assertEqual(len(strategy.timestamps), stats["ticks"])
+        ticks_by_schedule = {(iterator_stats["tick_every"], iterator_stats["deferred"]): iterator_stats["ticks"]
+                             for iterator_stats in stats["iterators"]}
+        self.assertEqual({(1, False): len(strategy.timestamps),
+                          (3, False): len(recorder.timestamps),
+                          (1, True): len(reporter.timestamps)},
+                         ticks_by_schedule)
+
+    def test_run_til_records_overruns_and_skipped_ticks(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.05)
+        slow_iterator = RecordingTimeIterator("slow", [], tick_duration=0.12)
+        clock.add_iterator(slow_iterator)
+
+        with clock, self.assertLogs("hummingbot.core.clock", level="WARNING") as logs:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.5))
+
+        stats = clock.tick_stats
+        self.assertGreater(stats.overruns, 0)
+        self.assertGreater(stats.skipped_ticks, 0)
+        self.assertGreaterEqual(stats.durations.max, 0.12)
+        # Overrun warnings are rate limited
+        self.assertEqual(1, len(logs.records))
+        self.assertIn("Clock tick overran the tick size", logs.records[0].getMessage())
+
+    def test_fast_forward_backtest_jumps_to_earliest_wake_up(self):
+        clock = Clock(ClockMode.BACKTEST, self.tick_size, self.backtest_start_timestamp, self.backtest_end_timestamp,
+                      fast_forward=True)
+        first_iterator = WakeUpTimeIterator("first", [], wake_up_interval=60)
+        second_iterator = WakeUpTimeIterator("second", [], wake_up_interval=45)
+        clock.add_iterator(first_iterator)
+        clock.add_iterator(second_iterator)
+
+        clock.backtest_til(self.backtest_start_timestamp + 120)
+
+        start = self.backtest_start_timestamp
+        self.assertEqual([start + 45, start + 60, start + 90, start + 120], first_iterator.timestamps)
+        self.assertEqual(first_iterator.timestamps, second_iterator.timestamps)
+        self.assertEqual(116, clock.fast_forwarded_ticks)
+        self.assertEqual(start + 120, clock.current_timestamp)
+
+    def test_fast_forward_backtest_ticks_every_step_for_iterators_without_wake_up(self):
+        clock = Clock(ClockMode.BACKTEST, self.tick_size, self.backtest_start_timestamp, self.backtest_end_timestamp,
+                      fast_forward=True)
+        wake_up_iterator = WakeUpTimeIterator("wake_up", [], wake_up_interval=60)
+        every_tick_iterator = RecordingTimeIterator("every_tick", [])
+        clock.add_iterator(wake_up_iterator)
+        clock.add_iterator(every_tick_iterator)
+
+        clock.backtest_til(self.backtest_start_timestamp + 10)
+
+        self.assertEqual(10, len(every_tick_iterator.timestamps))
+        self.assertEqual(10, len(wake_up_iterator.timestamps))
+        self.assertEqual(0, clock.fast_forwarded_ticks)
+
+    def test_fast_forward_backtest_does_not_jump_beyond_end(self):
+        clock = Clock(ClockMode.BACKTEST, self.tick_size, self.backtest_start_timestamp, self.backtest_end_timestamp,
+                      fast_forward=True)
+        idle_iterator = WakeUpTimeIterator("idle", [], wake_up_interval=float("inf"))
+        clock.add_iterator(idle_iterator)
+
+        clock.backtest()
+
+        self.assertEqual([self.backtest_end_timestamp], idle_iterator.timestamps)
+        self.assertEqual(self.backtest_end_timestamp, clock.current_timestamp)
@@ -1,4 +1,5 @@
 import asyncio
+import tempfile
 import time
 from decimal import Decimal
 from pathlib import Path
@@ -194,6 +195,32 @@ class TradingCoreTest(IsolatedAsyncioWrapperTestCase):
             self.client_config_adapter, "custom_db"
         )
 
+    @patch("hummingbot.core.trading_core.MarketsRecorder")
+    @patch("hummingbot.core.trading_core.SQLConnectionManager")
+    def test_initialize_markets_recorder_with_write_behind(self, mock_sql_manager, mock_markets_recorder):
+        """Test the markets recorder options are taken from the client config"""
+        self.client_config.markets_recorder.recorder_write_behind = True
+        self.client_config.markets_recorder.recorder_write_behind_interval = 0.5
+        self.client_config.markets_recorder.recorder_write_behind_queue_size = 100
+
+        self.trading_core.initialize_markets_recorder("custom_db")
+
+        kwargs = mock_markets_recorder.call_args.kwargs
+        self.assertTrue(kwargs["write_behind"])
+        self.assertEqual(0.5, kwargs["write_behind_interval"])
+        self.assertEqual(100, kwargs["write_behind_queue_size"])
+
+    @patch("hummingbot.core.trading_core.MarketsRecorder")
+    @patch("hummingbot.core.trading_core.SQLConnectionManager")
+    def test_initialize_markets_recorder_with_trade_fills_warm_start(self, mock_sql_manager, mock_markets_recorder):
+        """Test the trade fills warm start is taken from the client config"""
+        self.trading_core.initialize_markets_recorder("custom_db")
+        self.assertFalse(mock_markets_recorder.call_args.kwargs["trade_fills_warm_start"])
+
+        self.client_config.markets_recorder.recorder_trade_fills_warm_start = True
+        self.trading_core.initialize_markets_recorder("custom_db")
+        self.assertTrue(mock_markets_recorder.call_args.kwargs["trade_fills_warm_start"])
+
     @patch("hummingbot.core.trading_core.importlib")
     @patch("hummingbot.core.trading_core.inspect")
     @patch("hummingbot.core.trading_core.sys")
@@ -663,6 +690,49 @@ class TradingCoreTest(IsolatedAsyncioWrapperTestCase):
             # Verify PerformanceMetrics.create was called correctly
             self.assertEqual(mock_perf_metrics_class.create.call_count, 2)
 
+    def test_performance_accumulators_are_kept_per_period_and_evicted(self):
+        def trades(order_id: str):
+            trade = Mock(spec=TradeFill)
+            trade.order_id = order_id
+            trade.exchange_trade_id = f"E{order_id}"
+            return [trade]
+
+        accumulator = self.trading_core.performance_accumulator("binance", "BTC-USDT", trades("OID0"))
+        self.assertIs(accumulator, self.trading_core.performance_accumulator("binance", "BTC-USDT", trades("OID0")))
+
+        for i in range(1, TradingCore.PERFORMANCE_ACCUMULATORS_CACHE_SIZE + 1):
+            self.trading_core.performance_accumulator("binance", "BTC-USDT", trades(f"OID{i}"))
+
+        self.assertEqual(TradingCore.PERFORMANCE_ACCUMULATORS_CACHE_SIZE,
+                         len(self.trading_core._performance_accumulators))
+        self.assertIsNot(accumulator, self.trading_core.performance_accumulator("binance", "BTC-USDT", trades("OID0")))
+
+    def test_performance_accumulators_saved_next_to_trade_fill_db(self):
+        trade = Mock(spec=TradeFill)
+        trade.order_id = "OID0"
+        trade.exchange_trade_id = "EOID0"
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "test_strategy.sqlite"
+            self.trading_core.trade_fill_db = Mock(db_path=str(db_path))
+            self.trading_core._strategy_file_name = "test_strategy.yml"
+            accumulator = self.trading_core.performance_accumulator("binance", "BTC-USDT", [trade])
+            accumulator.num_buys = 3
+
+            self.trading_core.save_performance_accumulators()
+            self.assertTrue((Path(temp_dir) / "test_strategy.performance.json").exists())
+
+            trading_core = TradingCore(self.client_config_adapter, self.scripts_path)
+            trading_core.trade_fill_db = Mock(db_path=str(db_path))
+            trading_core._strategy_file_name = "test_strategy.yml"
+            restored = trading_core.performance_accumulator("binance", "BTC-USDT", [trade])
+            self.assertEqual(3, restored.num_buys)
+            self.assertEqual(accumulator.to_json(), restored.to_json())
+
+            # The accumulators of another config are not restored
+            trading_core._strategy_file_name = "other_strategy.yml"
+            self.assertEqual(0, trading_core.performance_accumulator("binance", "BTC-USDT", [trade]).num_buys)
+
     @patch("hummingbot.core.trading_core.PerformanceMetrics")
     async def test_calculate_performance_metrics_timeout(self, mock_perf_metrics_class):
         """Test calculate_performance_metrics_by_connector_pair with timeout"""
@@ -0,0 +1,43 @@
+import unittest
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+
+
+class LatencyHistogramTest(unittest.TestCase):
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0.0, histogram.mean)
+        self.assertEqual(0.0, histogram.percentile(99))
+
+    def test_observe_updates_buckets_and_stats(self):
+        histogram = LatencyHistogram(bucket_bounds=(0.01, 0.1, 1.0))
+        for value in (0.005, 0.05, 0.05, 0.5, 2.0):
+            histogram.observe(value)
+
+        self.assertEqual(5, histogram.count)
+        self.assertAlmostEqual(2.605 / 5, histogram.mean)
+        self.assertEqual(2.0, histogram.max)
+        self.assertEqual({0.01: 1, 0.1: 2, 1.0: 1, float("inf"): 1}, histogram.buckets())
+
+    def test_percentile_returns_bucket_upper_bound(self):
+        histogram = LatencyHistogram(bucket_bounds=(0.01, 0.1, 1.0))
+        for value in (0.005, 0.05, 0.05, 0.5, 2.0):
+            histogram.observe(value)
+
+        self.assertEqual(0.01, histogram.percentile(20))
+        self.assertEqual(0.1, histogram.percentile(50))
+        self.assertEqual(1.0, histogram.percentile(80))
+        self.assertEqual(2.0, histogram.percentile(100))
+
+    def test_reset(self):
+        histogram = LatencyHistogram()
+        histogram.observe(1.0)
+        histogram.reset()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0.0, histogram.max)
+        self.assertEqual({"count": 0, "mean": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0},
+                         histogram.to_dict())
@@ -340,6 +340,32 @@ class OrderTrackerUnitTests(unittest.TestCase):
         # Check that check_and_cleanup_shadow_records clears shadow_limit_orders
         self.assertTrue(self.market_info not in self.order_tracker.get_shadow_limit_orders())
 
+    def test_next_wake_up_timestamp_is_shadow_records_expiry(self):
+        self.assertEqual(float("inf"), self.order_tracker.next_wake_up_timestamp(self.start_timestamp))
+
+        order: LimitOrder = self.limit_orders[0]
+        self.simulate_place_order(self.order_tracker, order, self.market_info)
+        self.simulate_stop_tracking_order(self.order_tracker, order, self.market_info)
+
+        self.assertEqual(self.start_timestamp + OrderTracker.SHADOW_MAKER_ORDER_KEEP_ALIVE_DURATION,
+                         self.order_tracker.next_wake_up_timestamp(self.start_timestamp))
+
+    def test_fast_forward_backtest_cleans_up_shadow_records(self):
+        order_tracker: OrderTracker = OrderTracker()
+        clock: Clock = Clock(ClockMode.BACKTEST, self.clock_tick_size, self.start_timestamp, self.end_timestamp,
+                             fast_forward=True)
+        clock.add_iterator(order_tracker)
+        clock.backtest_til(self.start_timestamp)
+
+        order: LimitOrder = self.limit_orders[0]
+        self.simulate_place_order(order_tracker, order, self.market_info)
+        self.simulate_stop_tracking_order(order_tracker, order, self.market_info)
+        clock.backtest_til(self.start_timestamp + OrderTracker.SHADOW_MAKER_ORDER_KEEP_ALIVE_DURATION * 2)
+
+        self.assertTrue(self.market_info not in order_tracker.get_shadow_limit_orders())
+        self.assertEqual(float("inf"), order_tracker.next_wake_up_timestamp(clock.current_timestamp))
+        self.assertGreater(clock.fast_forwarded_ticks, 0)
+
     def test_has_in_flight_cancel(self):
         # Check initial output
         self.assertFalse(self.order_tracker.has_in_flight_cancel("ORDER_ID_DO_NOT_EXIST"))
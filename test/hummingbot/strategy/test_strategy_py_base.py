@@ -3,11 +3,14 @@ import time
 import unittest
 from collections import deque
 from decimal import Decimal
-from typing import Union
+from typing import List, Tuple, Union
+
+import pandas as pd
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.market_order import MarketOrder
@@ -23,6 +26,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
 
@@ -63,6 +67,50 @@ class MockPyStrategy(StrategyPyBase):
         self.events_queue.append(funding_payment_completed_event)
 
 
+class ScheduledOrdersPyStrategy(MockPyStrategy):
+    """
+    Places orders at scheduled timestamps, and reports the next of them as its wake up timestamp
+    """
+
+    def __init__(self, market_info: MarketTradingPairTuple, schedule: List[Tuple[float, bool, OrderType, Decimal, Decimal]]):
+        super().__init__()
+        self.market_info = market_info
+        self.schedule = deque(schedule)
+        self.add_markets([market_info.market])
+
+    def tick(self, timestamp: float):
+        while len(self.schedule) > 0 and self.schedule[0][0] <= timestamp:
+            _, is_buy, order_type, amount, price = self.schedule.popleft()
+            if is_buy:
+                self.buy_with_specific_market(self.market_info, amount, order_type, price)
+            else:
+                self.sell_with_specific_market(self.market_info, amount, order_type, price)
+
+    def next_wake_up_timestamp(self, timestamp: float) -> float:
+        return self.schedule[0][0] if len(self.schedule) > 0 else float("inf")
+
+
+class OrderBookScheduleIterator(PyTimeIterator):
+    """
+    Market data replay setting the order book mid price at scheduled timestamps
+    """
+
+    def __init__(self, market: MockPaperExchange, trading_pair: str, schedule: List[Tuple[float, float]]):
+        super().__init__()
+        self.market = market
+        self.trading_pair = trading_pair
+        self.schedule = deque(schedule)
+
+    def tick(self, timestamp: float):
+        while len(self.schedule) > 0 and self.schedule[0][0] <= timestamp:
+            _, mid_price = self.schedule.popleft()
+            self.market.set_balanced_order_book(trading_pair=self.trading_pair, mid_price=mid_price, min_price=1,
+                                                max_price=200, price_step_size=1, volume_step_size=10)
+
+    def next_wake_up_timestamp(self, timestamp: float) -> float:
+        return self.schedule[0][0] if len(self.schedule) > 0 else float("inf")
+
+
 class StrategyPyBaseUnitTests(unittest.TestCase):
 
     @classmethod
@@ -317,3 +365,43 @@ class StrategyPyBaseUnitTests(unittest.TestCase):
         event = self.strategy.events_queue.popleft()
 
         self.assertIsInstance(event, FundingPaymentCompletedEvent)
+
+    def run_scheduled_backtest(self, fast_forward: bool) -> Tuple[Clock, MockPaperExchange, List[OrderFilledEvent]]:
+        start_timestamp = pd.Timestamp("2021-01-01", tz="UTC").timestamp()
+        market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        market.set_balanced_order_book(trading_pair=self.trading_pair, mid_price=100, min_price=1,
+                                       max_price=200, price_step_size=1, volume_step_size=10)
+        market.set_balance("COINALPHA", 500)
+        market.set_balance("HBOT", 50000)
+        market_info = MarketTradingPairTuple(market, self.trading_pair, *self.trading_pair.split("-"))
+        order_book_replay = OrderBookScheduleIterator(market, self.trading_pair, [(start_timestamp + 300, 90)])
+        strategy = ScheduledOrdersPyStrategy(market_info, [
+            (start_timestamp + 100, True, OrderType.MARKET, Decimal("10"), Decimal("NaN")),
+            # Resting until the order book moves down
+            (start_timestamp + 200, True, OrderType.LIMIT, Decimal("5"), Decimal("95")),
+            # Crossing the order book when placed
+            (start_timestamp + 400, False, OrderType.LIMIT, Decimal("3"), Decimal("80")),
+            (start_timestamp + 500, False, OrderType.MARKET, Decimal("7"), Decimal("NaN")),
+        ])
+
+        clock = Clock(ClockMode.BACKTEST, 1.0, start_timestamp, start_timestamp + 1000, fast_forward=fast_forward)
+        clock.add_iterator(order_book_replay)
+        clock.add_iterator(market)
+        clock.add_iterator(strategy)
+        clock.backtest()
+
+        fills = [event for event in strategy.events_queue if isinstance(event, OrderFilledEvent)]
+        return clock, market, fills
+
+    def test_fast_forward_backtest_matches_tick_by_tick_backtest(self):
+        clock, market, fills = self.run_scheduled_backtest(fast_forward=False)
+        fast_clock, fast_market, fast_fills = self.run_scheduled_backtest(fast_forward=True)
+
+        self.assertEqual(0, clock.fast_forwarded_ticks)
+        self.assertGreater(fast_clock.fast_forwarded_ticks, 900)
+        self.assertEqual(4, len(fills))
+        self.assertEqual(
+            [(fill.timestamp, fill.trade_type, fill.order_type, fill.price, fill.amount) for fill in fills],
+            [(fill.timestamp, fill.trade_type, fill.order_type, fill.price, fill.amount) for fill in fast_fills])
+        self.assertEqual(market.get_all_balances(), fast_market.get_all_balances())
+        self.assertEqual(clock.current_timestamp, fast_clock.current_timestamp)
@@ -0,0 +1,147 @@
+import unittest
+from decimal import Decimal
+from typing import Optional
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import (
+    ArrayPositionExecutorSimulator,
+    PositionExecutorSimulator,
+)
+from hummingbot.strategy_v2.backtesting.market_data_arrays import MarketDataArrays
+from hummingbot.strategy_v2.executors.position_executor.data_types import (
+    PositionExecutorConfig,
+    TrailingStop,
+    TripleBarrierConfig,
+)
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class ArrayPositionExecutorSimulatorTests(unittest.TestCase):
+    start_timestamp = 1_700_000_000
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.simulator = PositionExecutorSimulator()
+        self.array_simulator = ArrayPositionExecutorSimulator()
+        self.df = self._candles(size=5_000, seed=1)
+
+    def _candles(self, size: int, seed: int) -> pd.DataFrame:
+        rng = np.random.default_rng(seed=seed)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, size)))
+        df = pd.DataFrame({
+            "timestamp": self.start_timestamp + 60.0 * np.arange(size),
+            "open": close,
+            "high": close * 1.001,
+            "low": close * 0.999,
+            "close": close,
+            "volume": np.ones(size),
+        })
+        return BacktestingDataProvider.ensure_epoch_index(df)
+
+    def _config(self, side: TradeType = TradeType.BUY, open_order_type: OrderType = OrderType.MARKET,
+                entry_price: Optional[Decimal] = None, take_profit: Optional[Decimal] = None,
+                stop_loss: Optional[Decimal] = None, time_limit: Optional[int] = None,
+                trailing_stop: Optional[TrailingStop] = None) -> PositionExecutorConfig:
+        return PositionExecutorConfig(
+            timestamp=self.start_timestamp,
+            trading_pair="BTC-USDT",
+            connector_name="binance",
+            side=side,
+            entry_price=entry_price if entry_price is not None else Decimal(str(self.df["close"].iloc[0])),
+            amount=Decimal("0.5"),
+            triple_barrier_config=TripleBarrierConfig(
+                take_profit=take_profit,
+                stop_loss=stop_loss,
+                time_limit=time_limit,
+                trailing_stop=trailing_stop,
+                open_order_type=open_order_type,
+            ))
+
+    def assert_same_simulation(self, config: PositionExecutorConfig, df: Optional[pd.DataFrame] = None):
+        df = self.df if df is None else df
+        expected = self.simulator.simulate(df, config, trade_cost=0.0006)
+        simulation = self.array_simulator.simulate(df, config, trade_cost=0.0006)
+
+        self.assertEqual(expected.close_type, simulation.close_type)
+        pd.testing.assert_frame_equal(expected.executor_simulation, simulation.executor_simulation, check_exact=True)
+        return simulation
+
+    def test_barriers_match_dataframe_simulator(self):
+        trailing_stop = TrailingStop(activation_price=Decimal("0.01"), trailing_delta=Decimal("0.003"))
+        configs = {
+            CloseType.TAKE_PROFIT: self._config(take_profit=Decimal("0.01"), stop_loss=Decimal("0.5")),
+            CloseType.STOP_LOSS: self._config(side=TradeType.SELL, take_profit=Decimal("0.5"),
+                                              stop_loss=Decimal("0.01")),
+            CloseType.TRAILING_STOP: self._config(take_profit=Decimal("0.5"), stop_loss=Decimal("0.5"),
+                                                  trailing_stop=trailing_stop),
+            CloseType.TIME_LIMIT: self._config(take_profit=Decimal("0.5"), stop_loss=Decimal("0.5"),
+                                               time_limit=3600, trailing_stop=trailing_stop),
+        }
+        for close_type, config in configs.items():
+            with self.subTest(close_type=close_type):
+                simulation = self.assert_same_simulation(config)
+                self.assertEqual(close_type, simulation.close_type)
+
+    def test_limit_entry_matches_dataframe_simulator(self):
+        entry_price = Decimal(str(self.df["close"].iloc[0] * 0.99))
+        for side in (TradeType.BUY, TradeType.SELL):
+            with self.subTest(side=side):
+                config = self._config(side=side, open_order_type=OrderType.LIMIT, entry_price=entry_price,
+                                      take_profit=Decimal("0.02"), stop_loss=Decimal("0.03"), time_limit=60 * 3000)
+                self.assert_same_simulation(config)
+
+    def test_limit_entry_never_filled_matches_dataframe_simulator(self):
+        config = self._config(open_order_type=OrderType.LIMIT, entry_price=Decimal("1"), take_profit=Decimal("0.02"),
+                              time_limit=60 * 100)
+
+        simulation = self.assert_same_simulation(config)
+
+        self.assertEqual(CloseType.TIME_LIMIT, simulation.close_type)
+        self.assertEqual(101, len(simulation.executor_simulation))
+
+    def test_random_configurations_match_dataframe_simulator(self):
+        rng = np.random.default_rng(seed=3)
+        for seed in range(20):
+            df = self._candles(size=3_000, seed=seed)
+            config = self._config(
+                side=TradeType.BUY if seed % 2 == 0 else TradeType.SELL,
+                entry_price=Decimal(str(df["close"].iloc[0])),
+                take_profit=Decimal(str(round(rng.uniform(0.005, 0.05), 4))),
+                stop_loss=Decimal(str(round(rng.uniform(0.005, 0.05), 4))),
+                time_limit=int(rng.integers(60, 60 * 3000)),
+                trailing_stop=TrailingStop(activation_price=Decimal("0.005"), trailing_delta=Decimal("0.002")))
+            with self.subTest(seed=seed):
+                self.assert_same_simulation(config, df)
+
+    def test_simulate_from_arrays_starts_at_index(self):
+        config = self._config(take_profit=Decimal("0.01"), stop_loss=Decimal("0.01"))
+        config.timestamp = self.df["timestamp"].iloc[1000]
+
+        expected = self.simulator.simulate(self.df.loc[config.timestamp:], config, trade_cost=0.0006)
+        simulation = self.array_simulator.simulate_from_arrays(MarketDataArrays(self.df), 1000, config, 0.0006)
+
+        self.assertEqual(expected.close_type, simulation.close_type)
+        pd.testing.assert_frame_equal(expected.executor_simulation, simulation.executor_simulation, check_exact=True)
+
+    def test_early_barrier_crossing_scans_only_first_chunk(self):
+        config = self._config(take_profit=Decimal("0.001"), stop_loss=Decimal("0.05"))
+        expected = self.simulator.simulate(self.df, config, trade_cost=0.0006)
+
+        with patch.object(ArrayPositionExecutorSimulator, "_net_pnl_pct",
+                          wraps=ArrayPositionExecutorSimulator._net_pnl_pct) as net_pnl_pct_mock:
+            simulation = self.array_simulator.simulate_from_arrays(MarketDataArrays(self.df), 0, config,
+                                                                   trade_cost=0.0006)
+
+        net_pnl_pct_mock.assert_called_once()
+        self.assertEqual((0, ArrayPositionExecutorSimulator.INITIAL_CHUNK_SIZE), net_pnl_pct_mock.call_args.args[2:4])
+        self.assertEqual(CloseType.TAKE_PROFIT, simulation.close_type)
+        self.assertLess(len(simulation.executor_simulation), ArrayPositionExecutorSimulator.INITIAL_CHUNK_SIZE)
+        self.assertEqual(simulation.executor_simulation["net_pnl_pct"].iloc[-1],
+                         simulation.executor_simulation["net_pnl_pct"].max())
+        self.assertGreater(simulation.executor_simulation["net_pnl_pct"].iloc[-1], 0.001)
+        pd.testing.assert_frame_equal(expected.executor_simulation, simulation.executor_simulation, check_exact=True)
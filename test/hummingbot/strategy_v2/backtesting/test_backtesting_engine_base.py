@@ -0,0 +1,133 @@
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from types import SimpleNamespace
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.market_data_arrays import MarketDataArrays
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, ExecutorAction
+
+
+class BacktestingTestDataProvider:
+    def __init__(self, candles: pd.DataFrame):
+        self.candles = candles
+        self.prices = {}
+        self._time = None
+
+    def get_candles_df(self, connector_name: str, trading_pair: str, interval: str) -> pd.DataFrame:
+        return self.candles.copy()
+
+
+class BacktestingTestController:
+    """Minimal controller creating a position executor at the configured timestamps"""
+
+    def __init__(self, market_data_provider, entry_timestamps: List[float]):
+        self.config = SimpleNamespace(connector_name="binance", trading_pair="BTC-USDT")
+        self.market_data_provider = market_data_provider
+        self.processed_data: Dict = {}
+        self.executors_info = []
+        self.entry_timestamps = set(entry_timestamps)
+
+    def determine_executor_actions(self) -> List[ExecutorAction]:
+        timestamp = self.market_data_provider._time
+        if timestamp not in self.entry_timestamps:
+            return []
+        return [CreateExecutorAction(
+            controller_id="test",
+            executor_config=PositionExecutorConfig(
+                id=f"executor_{int(timestamp)}",
+                timestamp=timestamp,
+                trading_pair="BTC-USDT",
+                connector_name="binance",
+                side=TradeType.BUY,
+                entry_price=Decimal(str(self.processed_data["close"])),
+                amount=Decimal("1"),
+                triple_barrier_config=TripleBarrierConfig(
+                    take_profit=Decimal("0.01"),
+                    stop_loss=Decimal("0.01"),
+                    time_limit=600,
+                    open_order_type=OrderType.MARKET,
+                ),
+            ))]
+
+
+class BacktestingEngineBaseTests(IsolatedAsyncioWrapperTestCase):
+
+    @staticmethod
+    def _candles(size: int) -> pd.DataFrame:
+        rng = np.random.default_rng(seed=42)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, size)))
+        return pd.DataFrame({
+            "timestamp": 1_700_000_000.0 + np.arange(size, dtype=float),
+            "open": close,
+            "high": close * 1.0005,
+            "low": close * 0.9995,
+            "close": close,
+            "volume": np.ones(size),
+        })
+
+    def _engine(self, candles: pd.DataFrame, entry_timestamps: List[float]) -> BacktestingEngineBase:
+        engine = BacktestingEngineBase()
+        engine.controller = BacktestingTestController(BacktestingTestDataProvider(candles), entry_timestamps)
+        engine.backtesting_resolution = "1s"
+        return engine
+
+    def test_market_data_arrays_slices_share_memory(self):
+        candles = self._candles(10)
+        market_data = MarketDataArrays(candles)
+
+        close = market_data.column("close", start=4)
+        self.assertTrue(np.shares_memory(close, market_data.columns["close"]))
+        self.assertEqual(6, len(close))
+        self.assertEqual(candles["timestamp"].iloc[4], market_data.timestamp(4))
+        self.assertEqual({"close": candles["close"].iloc[3]}, market_data.row(3, ["close"]))
+        self.assertIsInstance(market_data.row(3)["volume"], float)
+        self.assertTrue(market_data.frame(4).equals(candles.iloc[4:]))
+
+    async def test_fast_mode_matches_row_iteration(self):
+        candles = self._candles(3000)
+        entry_timestamps = [candles["timestamp"].iloc[i] for i in (10, 700, 1500)]
+
+        engine = self._engine(candles, entry_timestamps)
+        executors_info = await engine.simulate_execution(trade_cost=0.0006)
+        fast_engine = self._engine(candles, entry_timestamps)
+        fast_executors_info = await fast_engine.simulate_execution_fast(trade_cost=0.0006)
+
+        self.assertEqual(3, len(executors_info))
+        self.assertEqual([(info.id, info.close_type, info.close_timestamp, info.net_pnl_quote)
+                          for info in executors_info],
+                         [(info.id, info.close_type, info.close_timestamp, info.net_pnl_quote)
+                          for info in fast_executors_info])
+        self.assertEqual(engine.controller.processed_data.keys(), fast_engine.controller.processed_data.keys())
+        self.assertEqual(engine.controller.processed_data["close"], fast_engine.controller.processed_data["close"])
+
+    async def test_fast_mode_only_updates_requested_processed_data_columns(self):
+        candles = self._candles(100)
+        engine = self._engine(candles, entry_timestamps=[])
+
+        await engine.simulate_execution_fast(trade_cost=0.0006, processed_data_columns=["close"])
+
+        self.assertEqual({"close", "features"}, set(engine.controller.processed_data.keys()))
+        self.assertEqual(candles["close"].iloc[-1], engine.controller.processed_data["close"])
+        self.assertEqual(candles["timestamp"].iloc[-1], engine.controller.market_data_provider._time)
+
+    async def test_fast_mode_with_requested_columns_matches_row_iteration(self):
+        candles = self._candles(2000)
+        entry_timestamps = [candles["timestamp"].iloc[i] for i in range(0, 2000, 200)]
+
+        engine = self._engine(candles, entry_timestamps)
+        executors_info = await engine.simulate_execution(trade_cost=0.0006)
+        fast_engine = self._engine(candles, entry_timestamps)
+        fast_executors_info = await fast_engine.simulate_execution_fast(trade_cost=0.0006,
+                                                                        processed_data_columns=["close"])
+
+        self.assertEqual(10, len(fast_executors_info))
+        self.assertEqual([(info.id, info.close_type, info.close_timestamp, info.net_pnl_quote)
+                          for info in executors_info],
+                         [(info.id, info.close_type, info.close_timestamp, info.net_pnl_quote)
+                          for info in fast_executors_info])
@@ -0,0 +1,83 @@
+import multiprocessing
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+import numpy as np
+import pandas as pd
+
+from controllers.market_making.pmm_simple import PMMSimpleConfig
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.strategy_v2.backtesting.backtesting_parameter_sweep import BacktestingParameterSweep, SharedCandlesFeeds
+
+
+class BacktestingParameterSweepTests(IsolatedAsyncioWrapperTestCase):
+    start = 1_700_000_000
+    end = start + 60 * 2_000
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.controller_config = PMMSimpleConfig(
+            id="pmm_simple",
+            connector_name="binance",
+            trading_pair="BTC-USDT",
+            total_amount_quote=Decimal("1000"),
+            buy_spreads=[0.001],
+            sell_spreads=[0.001],
+            executor_refresh_time=600,
+            time_limit=3600,
+        )
+
+    def _candles(self) -> pd.DataFrame:
+        rng = np.random.default_rng(seed=7)
+        size = (self.end - self.start) // 60 + 1
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, size)))
+        return pd.DataFrame({
+            "timestamp": self.start + 60.0 * np.arange(size),
+            "open": close,
+            "high": close * 1.001,
+            "low": close * 0.999,
+            "close": close,
+            "volume": np.ones(size),
+            "n_trades": np.arange(size, dtype=np.int64),
+        })
+
+    def test_expand_parameter_grid(self):
+        configs = BacktestingParameterSweep.expand_parameter_grid(
+            self.controller_config, {"take_profit": [Decimal("0.01"), Decimal("0.02")], "time_limit": [60, 120, 180]})
+
+        self.assertEqual(6, len(configs))
+        self.assertEqual({"take_profit": Decimal("0.02"), "time_limit": 180}, configs[-1][0])
+        self.assertEqual(Decimal("0.02"), configs[-1][1].take_profit)
+        self.assertEqual(180, configs[-1][1].triple_barrier_config.time_limit)
+        self.assertEqual(self.controller_config.stop_loss, configs[-1][1].stop_loss)
+
+    def test_shared_candles_feeds_round_trip(self):
+        candles = self._candles()
+        shared_candles = SharedCandlesFeeds.create({"binance_BTC-USDT_1m": candles})
+        try:
+            attached = SharedCandlesFeeds.attach(shared_candles.name, shared_candles.layout)
+            candles_feeds = attached.candles_feeds()
+            attached.close()
+        finally:
+            shared_candles.close()
+            shared_candles.unlink()
+
+        pd.testing.assert_frame_equal(candles, candles_feeds["binance_BTC-USDT_1m"])
+
+    async def test_run_ranks_results_of_all_combinations(self):
+        sweep = BacktestingParameterSweep(max_workers=2, mp_context=multiprocessing.get_context("fork"))
+        data_provider = sweep.backtesting_engine.backtesting_data_provider
+        data_provider.candles_feeds["binance_BTC-USDT_1m"] = self._candles()
+        data_provider.trading_rules["binance"] = {"BTC-USDT": TradingRule(
+            trading_pair="BTC-USDT",
+            min_price_increment=Decimal("0.01"),
+            min_base_amount_increment=Decimal("0.0001"))}
+
+        results = await sweep.run(self.controller_config,
+                                  {"take_profit": [Decimal("0.005"), Decimal("0.02")], "stop_loss": [Decimal("0.01")]},
+                                  start=self.start, end=self.end)
+
+        self.assertEqual(2, len(results))
+        self.assertEqual({Decimal("0.005"), Decimal("0.02")}, set(results["take_profit"]))
+        self.assertTrue((results["total_executors"] > 0).all())
+        self.assertTrue(results["net_pnl_quote"].is_monotonic_decreasing)
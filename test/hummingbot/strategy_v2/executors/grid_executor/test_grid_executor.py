@@ -1,6 +1,8 @@
+import itertools
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from test.logger_mixin_for_test import LoggerMixinForTest
+from typing import Optional
 from unittest.mock import MagicMock, PropertyMock, patch
 
 from hummingbot.connector.exchange_py_base import ExchangePyBase
@@ -17,7 +19,7 @@ from hummingbot.core.event.events import (
     OrderFilledEvent,
 )
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
-from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig, GridLevelStates
+from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig, GridLevel, GridLevelStates
 from hummingbot.strategy_v2.executors.grid_executor.grid_executor import GridExecutor
 from hummingbot.strategy_v2.executors.position_executor.data_types import TrailingStop, TripleBarrierConfig
 from hummingbot.strategy_v2.models.base import RunnableStatus
@@ -1189,3 +1191,81 @@ class TestGridExecutor(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         await executor.control_task()
         self.assertEqual(executor._status, RunnableStatus.TERMINATED)
         self.assertEqual(executor.close_type, CloseType.POSITION_HOLD)
+
+    def get_large_grid_executor(self, n_levels: int, side: TradeType = TradeType.BUY,
+                                activation_bounds: Optional[Decimal] = None) -> GridExecutor:
+        config = GridExecutorConfig(
+            id="test",
+            timestamp=1234567890,
+            side=side,
+            connector_name="binance",
+            trading_pair="ETH-USDT",
+            start_price=Decimal("100"),
+            end_price=Decimal("200"),
+            total_amount_quote=Decimal(10 * n_levels),
+            max_open_orders=20,
+            max_orders_per_batch=5,
+            activation_bounds=activation_bounds,
+            limit_price=Decimal("50") if side == TradeType.BUY else Decimal("250"),
+            triple_barrier_config=TripleBarrierConfig(take_profit=Decimal("0.01")),
+        )
+        step = (config.end_price - config.start_price) / (n_levels - 1)
+        levels = [
+            GridLevel(id=f"L{i}", price=config.start_price + step * i, amount_quote=Decimal("10"),
+                      take_profit=Decimal("0.01"), side=side, open_order_type=OrderType.LIMIT_MAKER,
+                      take_profit_order_type=OrderType.LIMIT_MAKER)
+            for i in range(n_levels)
+        ]
+        self.strategy.buy.side_effect = (f"OID-BUY-{i}" for i in itertools.count(1))
+        self.strategy.sell.side_effect = (f"OID-SELL-{i}" for i in itertools.count(1))
+        with patch.object(GridExecutor, "_generate_grid_levels", return_value=levels):
+            executor = self.get_grid_executor_from_config(config)
+        executor._status = RunnableStatus.RUNNING
+        return executor
+
+    @patch.object(GridExecutor, "get_price", MagicMock(return_value=Decimal("150.02")))
+    def test_not_active_levels_selected_by_proximity(self):
+        for side, activation_bounds in ((TradeType.BUY, None), (TradeType.BUY, Decimal("0.01")),
+                                        (TradeType.SELL, Decimal("0.01"))):
+            executor = self.get_large_grid_executor(n_levels=200, side=side, activation_bounds=activation_bounds)
+            executor.update_metrics()
+            executor.update_grid_levels()
+            for level in executor.grid_levels[95:105:3]:
+                level.active_open_order = TrackedOrder("OID-TEST")
+            executor.update_grid_levels()
+
+            not_active_levels = executor.levels_by_state[GridLevelStates.NOT_ACTIVE]
+            if activation_bounds is not None and side == TradeType.BUY:
+                min_price = executor.mid_price * (1 - activation_bounds)
+                not_active_levels = [level for level in not_active_levels if level.price >= min_price]
+            elif activation_bounds is not None:
+                max_price = executor.mid_price * (1 + activation_bounds)
+                not_active_levels = [level for level in not_active_levels if level.price <= max_price]
+            expected = sorted(not_active_levels, key=lambda level: abs(level.price - executor.mid_price))
+
+            self.assertEqual(expected[:5], executor._get_not_active_levels_by_proximity(5))
+            self.assertEqual(expected, executor._get_not_active_levels_by_proximity())
+
+    @patch.object(GridExecutor, "get_price", MagicMock(return_value=Decimal("150.02")))
+    async def test_control_task_cost_with_large_grid(self):
+        executor = self.get_large_grid_executor(n_levels=1000, activation_bounds=Decimal("0.05"))
+        # The levels of each batch are moved to OPEN_ORDER_PLACED by the next cycle, so the 4 batches of 5 orders
+        # needed to reach the max open orders are indexed after 5 cycles
+        for _ in range(5):
+            await executor.control_task()
+        self.assertEqual(20, len(executor.levels_by_state[GridLevelStates.OPEN_ORDER_PLACED]))
+        self.assertEqual(980, len(executor.levels_by_state[GridLevelStates.NOT_ACTIVE]))
+
+        with patch.object(executor, "_index_grid_levels", wraps=executor._index_grid_levels) as index_mock, \
+                patch.object(GridLevel, "update_state", autospec=True,
+                             side_effect=GridLevel.update_state) as update_state_mock:
+            for _ in range(20):
+                await executor.control_task()
+
+        # Only the levels with orders are checked each cycle, instead of the whole grid
+        index_mock.assert_not_called()
+        self.assertEqual(20 * 20, update_state_mock.call_count)
+        for state, levels in executor.levels_by_state.items():
+            self.assertEqual([level for level in executor.grid_levels if level.state == state], levels)
+        self.assertEqual(sorted(level.price for level in executor.levels_by_state[GridLevelStates.NOT_ACTIVE]),
+                         [price for price, _ in executor._not_active_levels_by_price])
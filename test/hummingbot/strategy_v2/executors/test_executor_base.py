@@ -18,7 +18,9 @@ from hummingbot.core.event.events import (
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
 from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
 
 
 class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
@@ -169,3 +171,57 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
     def test_get_in_flight_order(self):
         in_flight_orders = self.component.get_in_flight_order("connector1", "OID-BUY-1")
         self.assertEqual(in_flight_orders, None)
+
+    def test_executor_info_rebuilt_only_when_state_changes(self):
+        config = PositionExecutorConfig(id="test", timestamp=1234567890, trading_pair="ETH-USDT",
+                                        connector_name="connector1", side=TradeType.BUY, amount=Decimal("1"))
+        executor = ExecutorBase(strategy=self.strategy, connectors=["connector1"], config=config)
+        executor.get_net_pnl_quote = MagicMock(return_value=Decimal("10"))
+        executor.get_net_pnl_pct = MagicMock(return_value=Decimal("1"))
+        executor.get_cum_fees_quote = MagicMock(return_value=Decimal("NaN"))
+
+        executor_info = executor.executor_info
+        self.assertEqual(1, executor.executor_info_version)
+        self.assertEqual(Decimal("0"), executor_info.cum_fees_quote)
+
+        # A clean executor returns the cached info without evaluating the metrics
+        executor.get_net_pnl_quote.reset_mock()
+        executor.get_net_pnl_quote.return_value = Decimal("20")
+        self.assertIs(executor_info, executor.executor_info)
+        executor.get_net_pnl_quote.assert_not_called()
+
+        # A dirty executor with an unchanged state keeps the same instance
+        executor.get_net_pnl_quote.return_value = Decimal("10")
+        executor.on_control_task_executed()
+        self.assertIs(executor_info, executor.executor_info)
+        self.assertEqual(1, executor.executor_info_version)
+
+        executor.get_net_pnl_quote.return_value = Decimal("20")
+        executor.on_control_task_executed()
+        updated_executor_info = executor.executor_info
+        self.assertIsNot(executor_info, updated_executor_info)
+        self.assertEqual(Decimal("20"), updated_executor_info.net_pnl_quote)
+        self.assertEqual(2, executor.executor_info_version)
+
+    def test_executor_info_marked_dirty_by_order_events_and_status_changes(self):
+        config = PositionExecutorConfig(id="test", timestamp=1234567890, trading_pair="ETH-USDT",
+                                        connector_name="connector1", side=TradeType.BUY, amount=Decimal("1"))
+        executor = ExecutorBase(strategy=self.strategy, connectors=["connector1"], config=config)
+        executor.get_net_pnl_quote = MagicMock(return_value=Decimal("10"))
+        executor.get_net_pnl_pct = MagicMock(return_value=Decimal("1"))
+        executor.get_cum_fees_quote = MagicMock(return_value=Decimal("0"))
+        executor.process_order_filled_event = MagicMock()
+        executor_info = executor.executor_info
+
+        executor.get_net_pnl_quote.return_value = Decimal("20")
+        executor._fill_order_forwarder(MagicMock())
+        executor.process_order_filled_event.assert_called_once()
+        self.assertEqual(Decimal("20"), executor.executor_info.net_pnl_quote)
+
+        executor.close_type = CloseType.EARLY_STOP
+        self.assertEqual(CloseType.EARLY_STOP, executor.executor_info.close_type)
+
+        executor._status = RunnableStatus.TERMINATED
+        self.assertEqual(RunnableStatus.TERMINATED, executor.executor_info.status)
+        self.assertEqual(4, executor.executor_info_version)
+        self.assertIsNot(executor_info, executor.executor_info)
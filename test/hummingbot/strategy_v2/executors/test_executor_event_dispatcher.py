@@ -0,0 +1,77 @@
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.event.events import MarketEvent, OrderCancelledEvent
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.executor_event_dispatcher import ExecutorEventDispatcher
+
+
+class ExecutorEventDispatcherTests(TestCase):
+    def setUp(self):
+        self.connector = MagicMock(spec=ExchangePyBase)
+        self.strategy = MagicMock(spec=ScriptStrategyBase)
+        self.strategy.connectors = {"connector1": self.connector}
+        self.strategy.buy.side_effect = ["OID-BUY-1", "OID-BUY-2"]
+        self.dispatcher = ExecutorEventDispatcher()
+        self.executor_1 = self._create_executor("executor_1")
+        self.executor_2 = self._create_executor("executor_2")
+
+    def _create_executor(self, executor_id: str) -> ExecutorBase:
+        config = ExecutorConfigBase(id=executor_id, type="position_executor", timestamp=1234567890)
+        executor = ExecutorBase(strategy=self.strategy, connectors=["connector1"], config=config)
+        executor.process_order_canceled_event = MagicMock()
+        executor.set_event_dispatcher(self.dispatcher)
+        executor.register_events()
+        return executor
+
+    def _place_buy_order(self, executor: ExecutorBase) -> str:
+        return executor.place_order(connector_name="connector1", trading_pair="ETH-USDT", order_type=OrderType.LIMIT,
+                                    side=TradeType.BUY, amount=Decimal("1"), price=Decimal("1000"))
+
+    def _dispatch_cancel(self, order_id: str) -> OrderCancelledEvent:
+        event = OrderCancelledEvent(timestamp=1234567890, order_id=order_id)
+        self.dispatcher._dispatch_event(MarketEvent.OrderCancelled.value, self.connector, event)
+        return event
+
+    def test_listens_once_per_connector(self):
+        self.assertEqual(7, self.connector.add_listener.call_count)
+
+    def test_event_delivered_only_to_order_owner(self):
+        order_id = self._place_buy_order(self.executor_1)
+
+        event = self._dispatch_cancel(order_id)
+
+        self.executor_1.process_order_canceled_event.assert_called_once_with(
+            MarketEvent.OrderCancelled.value, self.connector, event)
+        self.executor_2.process_order_canceled_event.assert_not_called()
+
+    def test_event_of_unknown_order_delivered_to_all_connector_executors(self):
+        event = self._dispatch_cancel("OID-EXTERNAL")
+
+        self.executor_1.process_order_canceled_event.assert_called_once_with(
+            MarketEvent.OrderCancelled.value, self.connector, event)
+        self.executor_2.process_order_canceled_event.assert_called_once_with(
+            MarketEvent.OrderCancelled.value, self.connector, event)
+
+    def test_unregister_executor_drops_its_orders(self):
+        order_id = self._place_buy_order(self.executor_1)
+        self.assertEqual(1, self.dispatcher.tracked_orders_count)
+
+        self.executor_1.unregister_events()
+        self._dispatch_cancel(order_id)
+
+        self.assertEqual(0, self.dispatcher.tracked_orders_count)
+        self.executor_1.process_order_canceled_event.assert_not_called()
+        self.executor_2.process_order_canceled_event.assert_called_once()
+
+    def test_stop_removes_listeners(self):
+        self.dispatcher.stop()
+
+        self.assertEqual(7, self.connector.remove_listener.call_count)
+        self._dispatch_cancel("OID-EXTERNAL")
+        self.executor_1.process_order_canceled_event.assert_not_called()
@@ -700,3 +700,53 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.assertEqual(len(result["controller2"]["executors"]), 0)
         self.assertEqual(len(result["controller3"]["executors"]), 0)
         self.assertEqual(len(result["controller3"]["positions"]), 0)
+
+    def test_generate_performance_report_updates_only_changed_executors(self):
+        config = PositionExecutorConfig(
+            timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
+        )
+
+        def executor_info(status: RunnableStatus, net_pnl_quote: Decimal, close_type=None):
+            return ExecutorInfo(
+                id="123", timestamp=1234, type="position_executor", status=status, config=config,
+                close_type=close_type, filled_amount_quote=Decimal(100), net_pnl_quote=net_pnl_quote,
+                net_pnl_pct=Decimal(0), cum_fees_quote=Decimal(1), is_trading=True, is_active=True, custom_info={})
+
+        executor_1 = MagicMock(spec=PositionExecutor)
+        executor_1.executor_info = executor_info(RunnableStatus.RUNNING, Decimal(10))
+        executor_2 = MagicMock(spec=PositionExecutor)
+        executor_2.executor_info = executor_info(RunnableStatus.RUNNING, Decimal(5))
+        self.orchestrator.active_executors["test"] = [executor_1, executor_2]
+
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+        self.assertEqual(Decimal(15), report.unrealized_pnl_quote)
+        self.assertEqual(Decimal(200), report.volume_traded)
+
+        executor_1.executor_info = executor_info(RunnableStatus.TERMINATED, Decimal(12), CloseType.TAKE_PROFIT)
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+        self.assertEqual(Decimal(5), report.unrealized_pnl_quote)
+        self.assertEqual(Decimal(12), report.realized_pnl_quote)
+        self.assertEqual({CloseType.TAKE_PROFIT: 1}, report.close_type_counts)
+
+        self.orchestrator.active_executors["test"] = [executor_2]
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+        self.assertEqual(Decimal(5), report.unrealized_pnl_quote)
+        self.assertEqual(Decimal(0), report.realized_pnl_quote)
+        self.assertEqual(Decimal(100), report.volume_traded)
+        self.assertEqual({}, report.close_type_counts)
+
+    def test_get_all_reports_calculates_each_position_summary_once(self):
+        position = PositionHold("binance", "ETH-USDT", TradeType.BUY)
+        position.buy_amount_base = Decimal("2")
+        position.buy_amount_quote = Decimal("400")
+        position.volume_traded_quote = Decimal("400")
+        self.orchestrator.positions_held = {"test": [position]}
+        self.orchestrator.cached_performance = {"test": PerformanceReport()}
+
+        with patch.object(PositionHold, "get_position_summary", wraps=position.get_position_summary) as summary_mock:
+            result = self.orchestrator.get_all_reports()
+
+        summary_mock.assert_called_once_with(Decimal(230))
+        self.assertEqual([result["test"]["positions"][0]], result["test"]["performance"].positions_summary)
+        self.assertEqual(Decimal(60), result["test"]["performance"].unrealized_pnl_quote)
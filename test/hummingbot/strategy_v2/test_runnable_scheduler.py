@@ -0,0 +1,90 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from test.logger_mixin_for_test import LoggerMixinForTest
+from unittest.mock import MagicMock
+
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.runnable_base import RunnableBase
+from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
+
+
+class TestRunnableScheduler(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
+    def setUp(self):
+        self.scheduler = RunnableScheduler()
+        self.set_loggers(loggers=[RunnableBase.logger(), self.scheduler.logger()])
+
+    def tearDown(self):
+        self.scheduler.stop()
+        super().tearDown()
+
+    def create_runnable(self, update_interval: float = 0.05) -> RunnableBase:
+        runnable = RunnableBase(update_interval=update_interval)
+        runnable.set_scheduler(self.scheduler)
+        runnable.control_task = MagicMock(side_effect=self._completed_task)
+        runnable.on_stop = MagicMock()
+        return runnable
+
+    @staticmethod
+    async def _completed_task():
+        pass
+
+    async def test_runnables_with_same_interval_share_tick_group(self):
+        runnables = [self.create_runnable() for _ in range(3)]
+        for runnable in runnables:
+            runnable.start()
+        await asyncio.sleep(0.12)
+
+        self.assertEqual(3, self.scheduler.runnables_count)
+        self.assertEqual(1, len(self.scheduler._groups))
+        for runnable in runnables:
+            self.assertGreaterEqual(runnable.control_task.call_count, 2)
+            self.assertEqual(runnable.control_task.call_count,
+                             self.scheduler.task_stats(runnable).executions_count)
+
+    async def test_terminated_runnable_is_removed(self):
+        runnable = self.create_runnable()
+        runnable.start()
+        await asyncio.sleep(0.02)
+
+        runnable.stop()
+        self.assertEqual(RunnableStatus.TERMINATED, runnable.status)
+        await asyncio.sleep(0.1)
+
+        runnable.on_stop.assert_called_once()
+        self.assertEqual(0, self.scheduler.runnables_count)
+        self.assertEqual(0, len(self.scheduler._groups))
+
+    async def test_control_task_exception_is_logged(self):
+        async def raise_exception():
+            raise Exception("Test")
+
+        runnable = self.create_runnable()
+        runnable.control_task = raise_exception
+        runnable.start()
+        await asyncio.sleep(0.02)
+
+        self.assertTrue(self.is_logged("ERROR", "Test"))
+        self.assertEqual(1, self.scheduler.task_stats(runnable).executions_count)
+
+    async def test_slow_runnable_is_deferred(self):
+        self.scheduler = RunnableScheduler(max_task_duration=0.01)
+
+        async def slow_task():
+            await asyncio.sleep(0.06)
+
+        slow_runnable = self.create_runnable()
+        slow_runnable.control_task = MagicMock(side_effect=slow_task)
+        slow_runnable.start()
+        await asyncio.sleep(0.03)
+
+        stats = self.scheduler.task_stats(slow_runnable)
+        self.assertEqual(0, stats.executions_count)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(1, stats.executions_count)
+        self.assertEqual(2, stats.deferred_ticks)
+        self.assertTrue(self.is_partially_logged("WARNING", "Control task of RunnableBase took"))
+        await asyncio.sleep(0.2)
+
+        self.assertGreater(stats.shed_ticks_count, 0)
+        self.assertLess(slow_runnable.control_task.call_count, 5)